@@ -1,33 +1,88 @@
 from flask import Flask
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 import logging
 
 from .config.config import Config
+from .logs.logs import configure_logging
 from .models.models import db
 from .auth.auth import jwt, init_jwt_handlers
+from .auth.revocation import token_blocklist
+from .auth.principals import principal_cache
+from .auth.hashing import password_hasher
+from .cache.cache import read_cache
+from .compression.compression import compression
+from .search.search import search_index
+from .snapshot.snapshot import snapshot_cli, snapshot_publisher
+from .images.images import image_pipeline
+from .pool.pool import init_pool
+from .metrics.metrics import metrics
+from .slowlog.slowlog import slow_query_cli, slow_query_log
+from .ratelimit.ratelimit import rate_limiter
+from .indexes.tech_index import tech_index_cli
+from .stats.stats import stats_cli
+from .loadtest.loadtest import loadtest_cli
 from .routes.auth_routes import auth_bp
 from .routes.project_routes import projects_bp
 from .routes.skill_routes import skills_bp
 from .routes.profile_routes import profile_bp
+from .routes.health_routes import health_bp
+from .routes.metrics_routes import metrics_bp
+from .routes.admin_routes import admin_bp
+from .routes.search_routes import search_bp
+from .routes.stats_routes import stats_bp
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 def create_app(config_class=Config):
     app = Flask(__name__)
-    app.config.from_object(config_class)
+    app.config.from_object(Config)
+    if isinstance(config_class, dict):
+        app.config.from_mapping(config_class)
+    else:
+        app.config.from_object(config_class)
+
+    configure_logging(app)
+
+    # Trust X-Forwarded-For from nginx so rate limits key on the client IP
+    if app.config['TRUSTED_PROXY_COUNT']:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXY_COUNT'])
 
     # Initialize extensions
     CORS(app, resources=app.config['CORS_RESOURCES'])
+    init_pool(app)
     db.init_app(app)
+    metrics.init_app(app)
+    slow_query_log.init_app(app)
     jwt.init_app(app)
     init_jwt_handlers(jwt)
+    token_blocklist.init_app(app)
+    principal_cache.init_app(app)
+    password_hasher.init_app(app)
+    rate_limiter.init_app(app)
+    read_cache.init_app(app)
+    compression.init_app(app)
+    search_index.init_app(app)
+    snapshot_publisher.init_app(app)
+    image_pipeline.init_app(app)
 
     # Register blueprints
     app.register_blueprint(auth_bp)
     app.register_blueprint(projects_bp)
     app.register_blueprint(skills_bp)
     app.register_blueprint(profile_bp)
+    app.register_blueprint(health_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(stats_bp)
+
+    # CLI commands
+    app.cli.add_command(tech_index_cli)
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(loadtest_cli)
+    app.cli.add_command(slow_query_cli)
+    app.cli.add_command(snapshot_cli)
 
     # Error handlers
     @app.errorhandler(404)
@@ -40,7 +95,7 @@ def create_app(config_class=Config):
 
     @app.errorhandler(500)
     def handle_error(error):
-        logger.error(f"Server error: {str(error)}")
+        logger.error("Server error: %s", error)
         return {"message": "Internal server error"}, 500
 
     return app
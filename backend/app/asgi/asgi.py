@@ -0,0 +1,180 @@
+import hashlib
+import logging
+from urllib.parse import parse_qsl
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from werkzeug.datastructures import MultiDict
+
+from ..config.config import Config
+from ..indexes.tech_index import filter_by_tech
+from ..pagination.pagination import PaginationError, keyset
+from ..pool.pool import engine_options
+from ..routes.profile_routes import PROFILE, SNAPSHOT_ISOLATION, portfolio_payload, portfolio_queries
+from ..routes.project_routes import PROJECT_SORTS
+from ..routes.skill_routes import SKILL_SORTS
+from ..stats.stats import (
+    skill_categories_rows,
+    skill_categories_select,
+    technology_stats_rows,
+    technology_stats_select
+)
+from ..serializers.serializers import (
+    dumps,
+    profile_skill_serializer,
+    project_serializer,
+    skill_serializer
+)
+
+logger = logging.getLogger(__name__)
+
+# Sync driver -> asyncio driver used by the async engine
+ASYNC_DRIVERS = {
+    'mysql+pymysql': 'mysql+aiomysql',
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite'
+}
+
+
+def async_database_uri(uri):
+    scheme, sep, rest = uri.partition('://')
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+class AsyncReadAPI:
+    """ASGI app serving the public read endpoints on an async engine.
+
+    Mirrors GET /api/projects, /api/skills, /api/profile, /api/portfolio and
+    /api/stats/tech from the Flask blueprints, including pagination, sorting, ``?tech=``
+    filtering and ``?group=category``, but
+    each request awaits the database instead of holding a worker thread.
+    Writes and auth stay on the Flask app.
+    """
+
+    def __init__(self, config=Config, engine=None):
+        self.config = config
+        uri = config.SQLALCHEMY_DATABASE_URI
+        self.engine = engine or create_async_engine(
+            async_database_uri(uri),
+            **engine_options(
+                uri,
+                config.SQLALCHEMY_ENGINE_OPTIONS,
+                queue_pool=make_url(uri).get_backend_name() != 'sqlite'
+            )
+        )
+        self.routes = {
+            '/api/projects': self.projects,
+            '/api/skills': self.skills,
+            '/api/profile': self.profile,
+            '/api/portfolio': self.portfolio,
+            '/api/stats/tech': self.tech_stats
+        }
+
+    async def _page(self, query, sorts, default_sort, args, path):
+        statement, finish = keyset(
+            query,
+            sorts,
+            default_sort,
+            args,
+            self.config.PAGINATION_DEFAULT_LIMIT,
+            self.config.PAGINATION_MAX_LIMIT
+        )
+        async with self.engine.connect() as conn:
+            page = finish((await conn.execute(statement)).all())
+        return page.items, page.headers(path, args)
+
+    async def projects(self, args, path):
+        if args.get('match', 'all') not in ('all', 'any'):
+            return 400, {"message": "match must be 'all' or 'any'"}, {}
+        query = filter_by_tech(project_serializer.select(), args)
+        rows, headers = await self._page(query, PROJECT_SORTS, '-created_at', args, path)
+        return 200, project_serializer.rows(rows), headers
+
+    async def skills(self, args, path):
+        group = args.get('group')
+        if group is not None:
+            if group != 'category':
+                return 400, {"message": "group must be 'category'"}, {}
+            async with self.engine.connect() as conn:
+                rows = await conn.execute(skill_categories_select())
+            return 200, skill_categories_rows(rows), {}
+        rows, headers = await self._page(
+            skill_serializer.select(), SKILL_SORTS, 'category', args, path
+        )
+        return 200, skill_serializer.rows(rows), headers
+
+    async def profile(self, args, path):
+        async with self.engine.connect() as conn:
+            skills = await conn.execute(profile_skill_serializer.select())
+        return 200, dict(PROFILE, skills=profile_skill_serializer.rows(skills)), {}
+
+    async def portfolio(self, args, path):
+        (projects, finish_projects), (skills, finish_skills) = portfolio_queries(
+            self.config.PAGINATION_DEFAULT_LIMIT,
+            self.config.PAGINATION_MAX_LIMIT
+        )
+        isolation = SNAPSHOT_ISOLATION.get(self.engine.dialect.name)
+        async with self.engine.connect() as conn:
+            if isolation:
+                await conn.execution_options(isolation_level=isolation)
+            project_page = finish_projects((await conn.execute(projects)).all())
+            skill_page = finish_skills((await conn.execute(skills)).all())
+        return 200, portfolio_payload(project_page, skill_page), {}
+
+    async def tech_stats(self, args, path):
+        async with self.engine.connect() as conn:
+            rows = await conn.execute(technology_stats_select())
+        return 200, technology_stats_rows(rows), {}
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        handler = self.routes.get(scope['path'])
+        if handler is None:
+            status, payload, headers = 404, {"message": "Resource not found"}, {}
+        elif scope['method'] not in ('GET', 'HEAD'):
+            status, payload, headers = 405, {"message": "Method not allowed"}, {}
+        else:
+            args = MultiDict(parse_qsl(scope['query_string'].decode('latin-1')))
+            try:
+                status, payload, headers = await handler(args, scope['path'])
+            except PaginationError as e:
+                status, payload, headers = 400, {"message": str(e)}, {}
+            except Exception as e:
+                logger.error("Error serving %s: %s", scope['path'], e)
+                status, payload, headers = 500, {"message": "Internal server error"}, {}
+
+        body = dumps(payload)
+        raw_headers = [(b'content-type', b'application/json')]
+        raw_headers.extend((k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in headers.items())
+        if status == 200:
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            raw_headers.append((b'etag', etag.encode('ascii')))
+            if_none_match = dict(scope['headers']).get(b'if-none-match', b'').decode('latin-1')
+            if etag in [tag.strip() for tag in if_none_match.split(',')]:
+                status, body = 304, b''
+        raw_headers.append((b'content-length', str(len(body)).encode('ascii')))
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': raw_headers})
+        await send({
+            'type': 'http.response.body',
+            'body': b'' if scope['method'] == 'HEAD' else body
+        })
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def create_asgi_app(config_class=Config):
+    return AsyncReadAPI(config_class)
@@ -1,14 +1,17 @@
-from flask import jsonify, request
+from flask import g, jsonify
 from flask_jwt_extended import (
     create_access_token,
     get_jwt_identity,
     jwt_required,
+    verify_jwt_in_request,
     JWTManager
 )
 from functools import wraps
 import logging
 
 from ..models.models import User
+from .revocation import token_blocklist
+from .principals import principal_cache
 
 jwt = JWTManager()
 logger = logging.getLogger(__name__)
@@ -34,20 +37,36 @@ def init_jwt_handlers(jwt):
     def revoked_token_callback(jwt_header, jwt_payload):
         return jsonify({"message": "Token has been revoked"}), 401
 
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        return token_blocklist.is_revoked(jwt_payload['jti'])
+
 def debug_jwt_required():
     def wrapper(fn):
         @wraps(fn)
         def decorated(*args, **kwargs):
-            auth_header = request.headers.get('Authorization')
-            logger.debug(f"Auth header: {auth_header}")
-            
             try:
                 verify_jwt_in_request()
                 current_user = get_jwt_identity()
-                logger.debug(f"Current user: {current_user}")
+                logger.debug("Current user: %s", current_user)
                 return fn(*args, **kwargs)
             except Exception as e:
-                logger.error(f"JWT verification failed: {str(e)}")
+                logger.error("JWT verification failed: %s", e)
                 return jsonify({"message": "Authentication failed", "error": str(e)}), 401
         return decorated
     return wrapper
+
+def principal_required():
+    # jwt_required plus a check that the user still exists, served from the
+    # principal cache; the resolved user is available as ``g.principal``
+    def wrapper(fn):
+        @wraps(fn)
+        @jwt_required()
+        def decorated(*args, **kwargs):
+            principal = principal_cache.get(get_jwt_identity())
+            if principal is None:
+                return jsonify({"message": "User not found"}), 401
+            g.principal = principal
+            return fn(*args, **kwargs)
+        return decorated
+    return wrapper
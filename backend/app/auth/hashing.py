@@ -0,0 +1,100 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from flask import current_app, has_app_context
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HashingUnavailable(Exception):
+    pass
+
+
+class _HashingState:
+    def __init__(self, workers, queue_size, timeout):
+        self.workers = workers
+        self.timeout = timeout
+        # Jobs running plus jobs waiting; beyond this callers are turned away
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def executor(self):
+        # Created lazily so each gunicorn worker gets its own pool after fork
+        with self.lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+
+class PasswordHasher:
+    """Runs werkzeug's scrypt hashing in a bounded process pool.
+
+    Request threads only wait on the result, so a burst of logins cannot pin
+    the CPU of the worker serving other requests. When every slot is busy, or
+    a hash takes longer than ``PASSWORD_HASH_TIMEOUT``, ``HashingUnavailable``
+    is raised instead of queueing without limit. Outside an application
+    context, or with ``PASSWORD_HASH_WORKERS = 0``, hashing runs inline.
+
+    The pool uses ``spawn``, since forking a gevent worker would copy its
+    hub into every child; each child imports the entry module and the app
+    before its first job, so servers ``warm`` the pool after fork rather
+    than charge that to the first logins.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PASSWORD_HASH_WORKERS', 2)
+        app.config.setdefault('PASSWORD_HASH_QUEUE', 16)
+        app.config.setdefault('PASSWORD_HASH_TIMEOUT', 5)
+        app.extensions['password_hasher'] = _HashingState(
+            app.config['PASSWORD_HASH_WORKERS'],
+            app.config['PASSWORD_HASH_QUEUE'],
+            app.config['PASSWORD_HASH_TIMEOUT']
+        )
+
+    def warm(self):
+        """Start every pool process and wait until each has run a job."""
+        state = current_app.extensions.get('password_hasher')
+        if state is None or not state.workers:
+            return
+        # Children are spawned on demand, one per job without an idle process
+        futures = [state.executor.submit(abs, 0) for _ in range(state.workers)]
+        for future in futures:
+            future.result()
+
+    def check(self, pwhash, password):
+        return self._run(check_password_hash, pwhash, password)
+
+    def generate(self, password):
+        return self._run(generate_password_hash, password)
+
+    def _run(self, fn, *args):
+        state = current_app.extensions.get('password_hasher') if has_app_context() else None
+        if state is None or not state.workers:
+            return fn(*args)
+
+        if not state.slots.acquire(blocking=False):
+            raise HashingUnavailable("Password hashing pool is saturated")
+        try:
+            future = state.executor.submit(fn, *args)
+        except BaseException:
+            state.slots.release()
+            raise
+        # The slot is held until the job really finishes, even after a timeout
+        future.add_done_callback(lambda _: state.slots.release())
+        try:
+            return future.result(timeout=state.timeout)
+        except FutureTimeoutError:
+            raise HashingUnavailable("Password hashing timed out")
+
+
+password_hasher = PasswordHasher()
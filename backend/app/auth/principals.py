@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+
+from ..models.models import User, db
+
+
+class Principal:
+    __slots__ = ('id', 'username')
+
+    def __init__(self, id, username):
+        self.id = id
+        self.username = username
+
+
+class _PrincipalState:
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+
+class PrincipalCache:
+    """Bounded LRU + TTL cache of authenticated users keyed by JWT identity.
+
+    Entries are dropped when the user row is updated or deleted in this
+    process; ``PRINCIPAL_CACHE_TTL`` bounds how long other workers may keep
+    a principal they have not seen change.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PRINCIPAL_CACHE_SIZE', 1024)
+        app.config.setdefault('PRINCIPAL_CACHE_TTL', 60)
+        app.extensions['principal_cache'] = _PrincipalState(
+            app.config['PRINCIPAL_CACHE_SIZE'],
+            app.config['PRINCIPAL_CACHE_TTL']
+        )
+
+    @property
+    def _state(self):
+        return current_app.extensions['principal_cache']
+
+    def get(self, identity):
+        state = self._state
+        now = time.monotonic()
+        with state.lock:
+            entry = state.entries.get(identity)
+            if entry is not None and entry[1] > now:
+                state.entries.move_to_end(identity)
+                return entry[0]
+
+        row = db.session.execute(
+            select(User.id, User.username).where(User.username == identity)
+        ).first()
+        if row is None:
+            return None
+
+        principal = Principal(row.id, row.username)
+        with state.lock:
+            state.entries[identity] = (principal, now + state.ttl)
+            state.entries.move_to_end(identity)
+            while len(state.entries) > state.max_size:
+                state.entries.popitem(last=False)
+        return principal
+
+    def invalidate(self, *identities):
+        state = self._state
+        with state.lock:
+            for identity in identities:
+                state.entries.pop(identity, None)
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_user(mapper, connection, target):
+    if not has_app_context() or 'principal_cache' not in current_app.extensions:
+        return
+    # A rename must evict the principal cached under the old username too
+    history = db.inspect(target).attrs.username.history
+    principal_cache.invalidate(target.username, *(history.deleted or ()))
@@ -0,0 +1,134 @@
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..models.models import RevokedToken, db
+
+logger = logging.getLogger(__name__)
+
+# Re-read this much history on every sync so a revocation committed by another
+# worker just after our previous read is never skipped
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def _utc(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _epoch(value):
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevocationStore:
+    """Revoked ``jti`` -> ``exp`` map that forgets tokens once they expire.
+
+    Lookups are a single dict probe. A min-heap ordered by expiry lets
+    ``evict`` drop expired entries without scanning, so memory is bounded by
+    the number of revoked tokens that could still be presented.
+    """
+
+    def __init__(self):
+        self._expiry = {}
+        self._heap = []
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti):
+        expires = self._expiry.get(jti)
+        return expires is not None and expires > time.time()
+
+    def __len__(self):
+        return len(self._expiry)
+
+    def add(self, jti, expires):
+        with self._lock:
+            if self._expiry.get(jti) != expires:
+                self._expiry[jti] = expires
+                heapq.heappush(self._heap, (expires, jti))
+        self.evict()
+
+    def evict(self, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires, jti = heapq.heappop(self._heap)
+                if self._expiry.get(jti) == expires:
+                    del self._expiry[jti]
+
+
+class _BlocklistState:
+    def __init__(self, sync_interval):
+        self.store = RevocationStore()
+        self.sync_interval = sync_interval
+        self.next_sync = 0.0
+        self.synced_until = None
+        self.lock = threading.Lock()
+
+
+class TokenBlocklist:
+    """JWT revocation backed by the revoked_tokens table.
+
+    Each process keeps the live revocations in memory and pulls rows written
+    by other workers at most every ``JWT_BLOCKLIST_SYNC_INTERVAL`` seconds, so
+    the per-request check never waits on the database.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('JWT_BLOCKLIST_SYNC_INTERVAL', 5)
+        app.extensions['token_blocklist'] = _BlocklistState(
+            app.config['JWT_BLOCKLIST_SYNC_INTERVAL']
+        )
+
+    @property
+    def _state(self):
+        return current_app.extensions['token_blocklist']
+
+    def is_revoked(self, jti):
+        state = self._state
+        if time.monotonic() >= state.next_sync:
+            self._sync(state)
+        return jti in state.store
+
+    def revoke(self, jwt_payload):
+        now = datetime.utcnow()
+        db.session.add(RevokedToken(
+            jti=jwt_payload['jti'],
+            expires_at=_utc(jwt_payload['exp']),
+            revoked_at=now
+        ))
+        # Expired rows can never match a valid token again
+        db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at < now))
+        db.session.commit()
+        self._state.store.add(jwt_payload['jti'], jwt_payload['exp'])
+
+    def _sync(self, state):
+        if not state.lock.acquire(blocking=False):
+            return  # another thread is already syncing
+        try:
+            started = datetime.utcnow()
+            query = select(RevokedToken.jti, RevokedToken.expires_at)
+            if state.synced_until is None:
+                query = query.where(RevokedToken.expires_at > started)
+            else:
+                query = query.where(RevokedToken.revoked_at >= state.synced_until - SYNC_OVERLAP)
+            for jti, expires_at in db.session.execute(query):
+                state.store.add(jti, _epoch(expires_at))
+            state.synced_until = started
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error("Token blocklist sync failed: %s", e)
+        finally:
+            state.next_sync = time.monotonic() + state.sync_interval
+            state.lock.release()
+
+
+token_blocklist = TokenBlocklist()
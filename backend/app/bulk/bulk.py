@@ -0,0 +1,84 @@
+from sqlalchemy import delete, select
+
+from ..models.models import db
+
+OPERATIONS = ('create', 'upsert', 'delete')
+
+
+class BulkError(ValueError):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class BulkResult:
+    """Per-item outcome of a batch, reported by operation and input index."""
+
+    def __init__(self):
+        self.results = {op: [] for op in OPERATIONS}
+        self.errors = 0
+
+    def ok(self, op, index, status, id):
+        self.results[op].append({'index': index, 'status': status, 'id': id})
+
+    def fail(self, op, index, message, status='error'):
+        self.results[op].append({'index': index, 'status': status, 'message': message})
+        self.errors += 1
+
+    def ids(self, op, status):
+        return [item['id'] for item in self.results[op] if item['status'] == status]
+
+    def to_dict(self):
+        for items in self.results.values():
+            items.sort(key=lambda item: item['index'])
+        return {'results': self.results, 'errors': self.errors}
+
+
+def parse_batch(data, max_items):
+    if not isinstance(data, dict) or not any(op in data for op in OPERATIONS):
+        raise BulkError("Expected an object with create, upsert and/or delete lists")
+    batch = {}
+    for op in OPERATIONS:
+        items = data.get(op, [])
+        if not isinstance(items, list):
+            raise BulkError(f"{op} must be a list")
+        batch[op] = items
+    if sum(len(items) for items in batch.values()) > max_items:
+        raise BulkError(f"Batch exceeds the limit of {max_items} items", 413)
+    return batch['create'], batch['upsert'], batch['delete']
+
+
+def validate(op, items, clean, result):
+    # ``clean`` maps one raw item to column values or raises BulkError; invalid
+    # items are reported and skipped so the rest of the batch still applies
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, clean(item)))
+        except BulkError as e:
+            result.fail(op, index, str(e))
+    return valid
+
+
+def delete_by_ids(model, ids, result, before_delete=None):
+    wanted = []
+    for index, id in enumerate(ids):
+        if isinstance(id, int) and not isinstance(id, bool):
+            wanted.append((index, id))
+        else:
+            result.fail('delete', index, "id must be an integer")
+    if not wanted:
+        return
+
+    found = set(db.session.scalars(
+        select(model.id).where(model.id.in_({id for _, id in wanted}))
+    ))
+    if found:
+        if before_delete is not None:
+            before_delete(found)
+        db.session.execute(delete(model).where(model.id.in_(found)))
+    for index, id in wanted:
+        if id in found:
+            result.ok('delete', index, 'deleted', id)
+        else:
+            result.fail('delete', index, "Not found", status='not_found')
@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response, current_app, request
+
+from ..compression.compression import compression
+from ..serializers.serializers import dumps
+
+
+class _CacheEntry:
+    __slots__ = ('versions', 'body', 'headers', 'etag', 'expires_at', 'encoded')
+
+    def __init__(self, versions, body, headers, etag, expires_at):
+        self.versions = versions
+        self.body = body
+        self.headers = headers
+        self.etag = etag
+        self.expires_at = expires_at
+        # Compressed variants of ``body`` by content coding, filled on demand
+        self.encoded = {}
+
+    def encode(self, encoding):
+        body = self.encoded.get(encoding)
+        if body is None:
+            # Racing requests may both compress; either result is identical
+            body = self.encoded[encoding] = compression.compress(self.body, encoding)
+        return body
+
+
+class _CacheState:
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.versions = {}
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, versions):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.versions != versions or (
+            entry.expires_at is not None and entry.expires_at < time.monotonic()
+        ):
+            with self.lock:
+                self.entries.pop(key, None)
+            return None
+        return entry
+
+    def put(self, key, versions, body, headers):
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        entry = _CacheEntry(versions, body, headers, etag, expires_at)
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+
+class ReadCache:
+    """In-process cache of serialized GET responses, keyed by data version.
+
+    Write handlers call ``invalidate`` after a successful commit, which bumps the
+    version of the touched resources so every cached body depending on them is
+    rebuilt on the next read. Compressed variants live on the entry, so each
+    body is compressed once per encoding and data version. Versions are per
+    process, so ``READ_CACHE_TTL`` bounds how long another worker may keep
+    serving a body it has not seen invalidated.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('READ_CACHE_TTL', 30)
+        app.config.setdefault('READ_CACHE_MAX_ENTRIES', 256)
+        app.extensions['read_cache'] = _CacheState(
+            app.config['READ_CACHE_TTL'],
+            app.config['READ_CACHE_MAX_ENTRIES']
+        )
+
+    @property
+    def _state(self):
+        return current_app.extensions['read_cache']
+
+    def version(self, resource):
+        return self._state.versions.get(resource, 0)
+
+    def invalidate(self, *resources):
+        state = self._state
+        with state.lock:
+            for resource in resources:
+                state.versions[resource] = state.versions.get(resource, 0) + 1
+
+    def respond(self, name, build, depends_on=None):
+        # ``build`` returns the payload, or ``(payload, headers)`` when the
+        # response carries extra headers such as pagination links.
+        state = self._state
+        versions = tuple(state.versions.get(r, 0) for r in (depends_on or (name,)))
+        key = (name, tuple(sorted(request.args.items(multi=True))))
+
+        entry = state.get(key, versions)
+        if entry is None:
+            payload, headers = build(), {}
+            if isinstance(payload, tuple):
+                payload, headers = payload
+            body = dumps(payload)
+            entry = state.put(key, versions, body, headers)
+
+        encoding = compression.negotiate(len(entry.body))
+        # Weak comparison: a client holding the gzip variant may revalidate
+        # after switching encodings, and the data is the same either way
+        if request.if_none_match.contains_weak(entry.etag):
+            response = Response(status=304)
+        elif encoding is None:
+            response = Response(entry.body, mimetype='application/json', headers=entry.headers)
+        else:
+            response = Response(entry.encode(encoding), mimetype='application/json', headers=entry.headers)
+            response.headers['Content-Encoding'] = encoding
+        response.set_etag(entry.etag, weak=encoding is not None)
+        if compression.enabled:
+            response.vary.add('Accept-Encoding')
+        response.cache_control.no_cache = True
+        return response
+
+
+read_cache = ReadCache()
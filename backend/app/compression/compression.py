@@ -0,0 +1,90 @@
+import gzip
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without brotli
+    brotli = None
+
+# Mimetype prefixes worth compressing; images and archives already are
+COMPRESSIBLE = ('application/json', 'text/')
+
+
+def _gzip(body, level):
+    # mtime=0 keeps the output, and so any cached variant, deterministic
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _brotli(body, level):
+    return brotli.compress(body, quality=level)
+
+
+# Content codings in server preference order, best ratio first
+CODECS = {'br': _brotli, 'gzip': _gzip} if brotli is not None else {'gzip': _gzip}
+
+
+class _CompressionState:
+    def __init__(self, min_size, levels):
+        self.min_size = min_size
+        self.levels = levels
+
+
+class Compression:
+    """Accept-Encoding negotiation for response bodies.
+
+    Bodies of at least ``COMPRESSION_MIN_SIZE`` bytes go out as brotli (when
+    the ``brotli`` package is installed) or gzip, whichever the client
+    prefers. The read cache compresses each cached body once per encoding
+    and keeps the result; other responses are compressed on the way out.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('COMPRESSION_ENABLED', True)
+        app.config.setdefault('COMPRESSION_MIN_SIZE', 1024)
+        app.config.setdefault('COMPRESSION_GZIP_LEVEL', 6)
+        app.config.setdefault('COMPRESSION_BROTLI_QUALITY', 5)
+        if not app.config['COMPRESSION_ENABLED']:
+            return
+        app.extensions['compression'] = _CompressionState(
+            app.config['COMPRESSION_MIN_SIZE'],
+            {'gzip': app.config['COMPRESSION_GZIP_LEVEL'], 'br': app.config['COMPRESSION_BROTLI_QUALITY']}
+        )
+        app.after_request(self._compress_response)
+
+    @property
+    def enabled(self):
+        return 'compression' in current_app.extensions
+
+    def negotiate(self, size):
+        """The coding to send a ``size``-byte body in, or None for identity."""
+        state = current_app.extensions.get('compression')
+        if state is None or size < state.min_size:
+            return None
+        return request.accept_encodings.best_match(CODECS)
+
+    def compress(self, body, encoding):
+        return CODECS[encoding](body, current_app.extensions['compression'].levels[encoding])
+
+    def _compress_response(self, response):
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or not (response.mimetype or '').startswith(COMPRESSIBLE)):
+            return response
+        response.vary.add('Accept-Encoding')
+        encoding = self.negotiate(response.content_length or 0)
+        if encoding is not None:
+            response.set_data(self.compress(response.get_data(), encoding))
+            response.headers['Content-Encoding'] = encoding
+            etag, weak = response.get_etag()
+            if etag and not weak:
+                # The compressed bytes differ, so a strong validator no longer holds
+                response.set_etag(etag, weak=True)
+        return response
+
+
+compression = Compression()
@@ -14,21 +14,117 @@ class Config:
     JWT_TOKEN_LOCATION = ['headers']
     JWT_HEADER_NAME = 'Authorization'
     JWT_HEADER_TYPE = 'Bearer'
+    JWT_BLOCKLIST_SYNC_INTERVAL = int(os.getenv('JWT_BLOCKLIST_SYNC_INTERVAL', 5))
+    PRINCIPAL_CACHE_SIZE = int(os.getenv('PRINCIPAL_CACHE_SIZE', 1024))
+    PRINCIPAL_CACHE_TTL = int(os.getenv('PRINCIPAL_CACHE_TTL', 60))
+
+    # Password hashing pool (0 workers hashes inline)
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_QUEUE = int(os.getenv('PASSWORD_HASH_QUEUE', 16))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', 5))
     
     # Database
-    SQLALCHEMY_DATABASE_URI = (
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL') or (
         f"mysql+pymysql://{os.getenv('MYSQL_USER', 'portfolio_user')}:{os.getenv('MYSQL_PASSWORD', 'portfolio_pass')}@"
         f"{os.getenv('MYSQL_HOST', 'db')}/{os.getenv('MYSQL_DATABASE', 'portfolio_db')}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),
+        # Recycle well inside MySQL's wait_timeout so idle connections are
+        # replaced before the server drops them
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    }
+
+    # Read cache
+    READ_CACHE_TTL = int(os.getenv('READ_CACHE_TTL', 30))
+    READ_CACHE_MAX_ENTRIES = int(os.getenv('READ_CACHE_MAX_ENTRIES', 256))
+
+    # Response compression (brotli needs the optional brotli package)
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 5))
+
+    # Static snapshots of the public reads for nginx; off when unset
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', '')
+    SNAPSHOT_GZIP_LEVEL = int(os.getenv('SNAPSHOT_GZIP_LEVEL', 9))
+    # Seconds a write waits for others before its snapshots are re-rendered
+    # in the background; 0 publishes inline
+    SNAPSHOT_DEBOUNCE = float(os.getenv('SNAPSHOT_DEBOUNCE', 0.5))
+
+    # Uploaded project images, resized in the background (needs Pillow); off
+    # when IMAGE_DIR is unset
+    IMAGE_DIR = os.getenv('IMAGE_DIR', '')
+    IMAGE_URL_PREFIX = os.getenv('IMAGE_URL_PREFIX', '/media/')
+    IMAGE_WIDTHS = tuple(int(w) for w in os.getenv('IMAGE_WIDTHS', '320,640,960,1280').split(','))
+    IMAGE_MAX_BYTES = int(os.getenv('IMAGE_MAX_BYTES', 10 * 1024 * 1024))
+    IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS', 1))
+
+    # Pagination
+    PAGINATION_DEFAULT_LIMIT = int(os.getenv('PAGINATION_DEFAULT_LIMIT', 100))
+    PAGINATION_MAX_LIMIT = int(os.getenv('PAGINATION_MAX_LIMIT', 500))
+    STREAM_CHUNK_ROWS = int(os.getenv('STREAM_CHUNK_ROWS', 500))
+
+    # Full-text search (/api/search); each worker syncs others' writes this often
+    SEARCH_SYNC_INTERVAL = int(os.getenv('SEARCH_SYNC_INTERVAL', 5))
+    SEARCH_MAX_RESULTS = int(os.getenv('SEARCH_MAX_RESULTS', 100))
+
+    # Bulk writes
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 1000))
     
+    # Rate limiting ("count/second|minute|hour|day" token buckets)
+    RATELIMIT_ENABLED = os.getenv('RATELIMIT_ENABLED', 'true').lower() == 'true'
+    RATELIMIT_BACKEND = os.getenv('RATELIMIT_BACKEND', 'memory')  # or 'sqlite'
+    RATELIMIT_SQLITE_PATH = os.getenv('RATELIMIT_SQLITE_PATH', '/dev/shm/portfolio-ratelimit.sqlite3')
+    RATELIMIT_MAX_KEYS = int(os.getenv('RATELIMIT_MAX_KEYS', 10000))
+    RATELIMIT_LOGIN_IP = os.getenv('RATELIMIT_LOGIN_IP', '20/minute')
+    RATELIMIT_LOGIN_USERNAME = os.getenv('RATELIMIT_LOGIN_USERNAME', '5/minute')
+    RATELIMIT_WRITE_IP = os.getenv('RATELIMIT_WRITE_IP', '120/minute')
+    TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', 0))
+
+    # Logging (records are formatted and written on a background thread)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', '%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s')
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', 0.01))  # fraction of DEBUG records kept
+
+    # Metrics (/api/metrics); set a shared directory to aggregate gunicorn workers
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR', '')
+    METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', 1.0))
+
+    # Slow query log (/api/admin/slow-queries, flask slow-queries report)
+    SLOW_QUERY_ENABLED = os.getenv('SLOW_QUERY_ENABLED', 'true').lower() == 'true'
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 100))
+    SLOW_QUERY_LOG_SIZE = int(os.getenv('SLOW_QUERY_LOG_SIZE', 100))
+
+    # Startup (start.py)
+    STARTUP_DB_TIMEOUT = float(os.getenv('STARTUP_DB_TIMEOUT', 60))
+    STARTUP_WARM = os.getenv('STARTUP_WARM', 'true').lower() == 'true'
+    STARTUP_WARM_CONNECTIONS = int(os.getenv('STARTUP_WARM_CONNECTIONS', 4))
+
+    # Production server (serve.py)
+    SERVER_BIND = os.getenv('SERVER_BIND', '0.0.0.0:5000')
+    SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', 0))  # 0 sizes from CPU cores
+    SERVER_WORKER_CLASS = os.getenv('SERVER_WORKER_CLASS', 'gevent')
+    SERVER_WORKER_CONNECTIONS = int(os.getenv('SERVER_WORKER_CONNECTIONS', 1000))
+    SERVER_TIMEOUT = int(os.getenv('SERVER_TIMEOUT', 30))
+    SERVER_GRACEFUL_TIMEOUT = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', 30))
+    SERVER_KEEPALIVE = int(os.getenv('SERVER_KEEPALIVE', 5))
+    SERVER_MAX_REQUESTS = int(os.getenv('SERVER_MAX_REQUESTS', 0))
+    SERVER_ACCESS_LOG = os.getenv('SERVER_ACCESS_LOG', '')
+
     # CORS
     CORS_RESOURCES = {
         r"/api/*": {
             "origins": ["http://localhost:3000"],
             "methods": ["GET", "HEAD", "POST", "OPTIONS", "PUT", "PATCH", "DELETE"],
             "allow_headers": ["Content-Type", "Authorization"],
-            "expose_headers": ["Content-Range", "X-Content-Range"],
+            "expose_headers": ["Content-Range", "X-Content-Range", "X-Next-Cursor", "Link"],
             "supports_credentials": True,
             "max_age": 86400
         }
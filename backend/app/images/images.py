@@ -0,0 +1,238 @@
+import base64
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import current_app
+
+from ..cache.cache import read_cache
+from ..models.models import Project, db
+from ..snapshot.snapshot import snapshot_publisher
+
+try:
+    from PIL import Image, ImageFilter, ImageOps
+except ImportError:  # pragma: no cover - exercised only without Pillow
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Output encodings: (format, extension, MIME type, save options)
+FORMATS = (
+    ('WEBP', 'webp', 'image/webp', {'quality': 80, 'method': 6}),
+    ('JPEG', 'jpg', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+
+# Width of the blurred preview inlined as a data URI
+PLACEHOLDER_WIDTH = 16
+
+# Hex digits of the content hash naming each file
+DIGEST_LENGTH = 16
+
+
+class ImageError(ValueError):
+    pass
+
+
+def digest(data):
+    return hashlib.blake2b(data, digest_size=DIGEST_LENGTH // 2).hexdigest()
+
+
+def _open(data):
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    # Phones record rotation in EXIF instead of rotating the pixels
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'RGBA'):
+        alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if alpha else 'RGB')
+    return image
+
+
+def _flatten(image):
+    # JPEG has no alpha channel; composite onto white rather than black
+    if image.mode != 'RGBA':
+        return image
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A'))
+    return background
+
+
+def _encode(image, fmt, options):
+    buffer = io.BytesIO()
+    (_flatten(image) if fmt == 'JPEG' else image).save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def _placeholder(image):
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    small = image.resize((PLACEHOLDER_WIDTH, height), Image.LANCZOS).filter(ImageFilter.GaussianBlur(1))
+    return 'data:image/webp;base64,' + base64.b64encode(_encode(small, 'WEBP', {'quality': 30})).decode('ascii')
+
+
+def render_variants(data, output_dir, url_prefix, widths):
+    """Resize an uploaded image into every width and format under ``output_dir``.
+
+    Each file is named by the hash of its own bytes, so URLs never change
+    meaning and can be cached forever. Widths above the original's are
+    skipped rather than upscaled. Runs in the processing pool, so it takes
+    and returns only plain data.
+    """
+    image = _open(data)
+    targets = sorted({w for w in widths if w < image.width} | {min(image.width, max(widths))})
+    variants = []
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt, extension, mimetype, options in FORMATS:
+            body = _encode(resized, fmt, options)
+            name = f'{digest(body)}.{extension}'
+            path = os.path.join(output_dir, name)
+            if not os.path.exists(path):
+                tmp = f'{path}.tmp-{os.getpid()}'
+                with open(tmp, 'wb') as f:
+                    f.write(body)
+                os.replace(tmp, path)
+            variants.append({
+                'type': mimetype,
+                'url': url_prefix + name,
+                'width': width,
+                'height': height,
+                'bytes': len(body)
+            })
+    return {
+        'width': image.width,
+        'height': image.height,
+        'placeholder': _placeholder(image),
+        'variants': variants,
+        'srcset': {
+            mimetype: ', '.join(f"{v['url']} {v['width']}w" for v in variants if v['type'] == mimetype)
+            for _, _, mimetype, _ in FORMATS
+        }
+    }
+
+
+class _ImageState:
+    def __init__(self, directory, url_prefix, widths, workers):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.widths = widths
+        self.workers = workers
+        self.lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def executor(self):
+        # Created lazily so each gunicorn worker gets its own pool after fork
+        with self.lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+
+class ImagePipeline:
+    """Background resizing of project images into responsive variants.
+
+    An upload is recorded on the project as ``{"status": "processing"}`` and
+    rendered in a process pool; when it finishes, ``Project.image_variants``
+    holds the dimensions, a blurred placeholder, every variant and a ready
+    ``srcset`` per format, and ``image_url`` points at the largest JPEG.
+    Uploads are off unless ``IMAGE_DIR`` is set and Pillow is installed.
+    With ``IMAGE_WORKERS = 0`` images are processed inline.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('IMAGE_DIR', '')
+        app.config.setdefault('IMAGE_URL_PREFIX', '/media/')
+        app.config.setdefault('IMAGE_WIDTHS', (320, 640, 960, 1280))
+        app.config.setdefault('IMAGE_MAX_BYTES', 10 * 1024 * 1024)
+        app.config.setdefault('IMAGE_WORKERS', 1)
+        if not app.config['IMAGE_DIR'] or Image is None:
+            return
+        app.extensions['images'] = _ImageState(
+            app.config['IMAGE_DIR'],
+            app.config['IMAGE_URL_PREFIX'],
+            tuple(app.config['IMAGE_WIDTHS']),
+            app.config['IMAGE_WORKERS']
+        )
+
+    @property
+    def enabled(self):
+        return 'images' in current_app.extensions
+
+    def submit(self, project, data):
+        """Queue ``data`` for processing as ``project``'s image.
+
+        Raises ``ImageError`` when the upload is not a readable image. The
+        caller commits the processing marker before the result can land.
+        """
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                # Reads the header only; the pixels are decoded in the pool
+                image.verify()
+        except Exception:
+            raise ImageError("Upload is not a supported image")
+        source = digest(data)
+        project.image_variants = {'status': 'processing', 'source': source}
+        return source
+
+    def start(self, project_id, source, data):
+        state = current_app.extensions['images']
+        os.makedirs(state.directory, exist_ok=True)
+        args = (data, state.directory, state.url_prefix, state.widths)
+        app = current_app._get_current_object()
+        if not state.workers:
+            self._store(app, project_id, source, *self._render(*args))
+            return
+        future = state.executor.submit(render_variants, *args)
+        future.add_done_callback(lambda f: self._store(app, project_id, source, *self._result(f)))
+
+    @staticmethod
+    def _render(*args):
+        try:
+            return render_variants(*args), None
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def _result(future):
+        error = future.exception()
+        return (None, error) if error else (future.result(), None)
+
+    def _store(self, app, project_id, source, result, error):
+        with app.app_context():
+            try:
+                project = db.session.get(Project, project_id, with_for_update=True)
+                # A newer upload, or deletion of the project, supersedes this one
+                if project is None or (project.image_variants or {}).get('source') != source:
+                    db.session.rollback()
+                    return
+                if error is not None:
+                    logger.error("Error processing image for project %s: %s", project_id, error)
+                    project.image_variants = {'status': 'failed', 'source': source}
+                else:
+                    project.image_variants = dict(result, status='ready', source=source)
+                    # Clients that ignore srcset still get a resized JPEG
+                    project.image_url = max(
+                        (v for v in result['variants'] if v['type'] == 'image/jpeg'),
+                        key=lambda v: v['width']
+                    )['url']
+                db.session.commit()
+                read_cache.invalidate('projects')
+                snapshot_publisher.publish('projects')
+            except Exception as e:
+                db.session.rollback()
+                logger.error("Error storing image variants for project %s: %s", project_id, e)
+
+
+image_pipeline = ImagePipeline()
@@ -0,0 +1,107 @@
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, func, insert, select
+
+from ..models.models import Project, ProjectTechnology, db
+from ..stats.stats import count_technologies, rebuild_technology_stats
+
+tech_index_cli = AppGroup('tech-index', help="Maintain the project technology index.")
+
+
+def tech_key(name):
+    return name.strip().lower()[:100]
+
+
+def _rows(project_id, tech_stack):
+    rows = {}
+    for name in tech_stack or []:
+        if isinstance(name, str) and name.strip():
+            rows.setdefault(tech_key(name), {
+                'project_id': project_id,
+                'tech_key': tech_key(name),
+                'name': name.strip()[:100]
+            })
+    return list(rows.values())
+
+
+def index_projects(stacks):
+    # ``stacks`` yields (project_id, tech_stack) pairs. Runs inside the caller's
+    # transaction so the index and its counts commit together with the projects.
+    rows = [row for project_id, tech_stack in stacks for row in _rows(project_id, tech_stack)]
+    if rows:
+        db.session.execute(insert(ProjectTechnology), rows)
+        count_technologies((row['tech_key'], row['name'], 1) for row in rows)
+
+
+def index_project(project):
+    index_projects([(project.id, project.tech_stack)])
+
+
+def unindex_projects(project_ids):
+    count_technologies(
+        (tech_key, name, -1) for tech_key, name in db.session.execute(
+            select(ProjectTechnology.tech_key, ProjectTechnology.name)
+            .where(ProjectTechnology.project_id.in_(project_ids))
+        )
+    )
+    db.session.execute(
+        delete(ProjectTechnology).where(ProjectTechnology.project_id.in_(project_ids))
+    )
+
+
+def unindex_project(project_id):
+    unindex_projects([project_id])
+
+
+def matching_project_ids(names, match_all=True):
+    keys = {tech_key(name) for name in names}
+    query = select(ProjectTechnology.project_id).where(ProjectTechnology.tech_key.in_(keys))
+    if match_all:
+        # The primary key makes (project_id, tech_key) unique, so a project
+        # matches every requested technology exactly when it has len(keys) hits
+        query = query.group_by(ProjectTechnology.project_id).having(func.count() == len(keys))
+    else:
+        query = query.distinct()
+    return query
+
+
+def filter_by_tech(query, args):
+    # ``?tech=`` filter shared by the Flask and async listings
+    techs = args.getlist('tech')
+    if techs:
+        match_all = args.get('match', 'all') == 'all'
+        query = query.where(Project.id.in_(matching_project_ids(techs, match_all)))
+    return query
+
+
+def backfill(batch_size=1000):
+    db.session.execute(delete(ProjectTechnology))
+    indexed = 0
+    last_id = 0
+    while True:
+        # Keyset batches rather than a streaming cursor: MySQL cannot run the
+        # inserts on a connection that still has an unread result set open
+        projects = db.session.execute(
+            select(Project.id, Project.tech_stack)
+            .where(Project.id > last_id)
+            .order_by(Project.id)
+            .limit(batch_size)
+        ).all()
+        if not projects:
+            break
+        rows = [row for project_id, tech_stack in projects for row in _rows(project_id, tech_stack)]
+        if rows:
+            db.session.execute(insert(ProjectTechnology), rows)
+        indexed += len(projects)
+        last_id = projects[-1].id
+    rebuild_technology_stats()
+    db.session.commit()
+    return indexed
+
+
+@tech_index_cli.command('backfill')
+@click.option('--batch-size', default=1000, show_default=True)
+def backfill_command(batch_size):
+    """Rebuild the technology index and counts from every project's tech_stack."""
+    indexed = backfill(batch_size)
+    click.echo(f"Indexed {indexed} projects")
@@ -0,0 +1,229 @@
+import http.client
+import json
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+class WSGITransport:
+    """Requests served by the app in this process, one test client per thread."""
+
+    def __init__(self, app):
+        self.app = app
+        self.local = threading.local()
+
+    def request(self, method, path, body=None, headers=None):
+        client = getattr(self.local, 'client', None)
+        if client is None:
+            client = self.local.client = self.app.test_client()
+        response = client.open(path, method=method, json=body, headers=headers)
+        return response.status_code, response.get_data()
+
+
+class HTTPTransport:
+    """Requests against a running server over a keep-alive connection per thread."""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.connection_class = (
+            http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        )
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.local = threading.local()
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        for attempt in range(2):
+            conn = getattr(self.local, 'conn', None)
+            if conn is None:
+                conn = self.local.conn = self.connection_class(self.netloc, timeout=30)
+            try:
+                conn.request(method, self.prefix + path, body, headers)
+                response = conn.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, OSError):
+                # The server closed an idle keep-alive connection; retry once
+                conn.close()
+                self.local.conn = None
+                if attempt:
+                    raise
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint, status, latency):
+        with self.lock:
+            self.latencies[endpoint].append(latency)
+            self.statuses[endpoint][status] += 1
+
+
+def _get(path):
+    endpoint = f'GET {path}'
+
+    def scenario(transport, options, timed):
+        timed(endpoint, lambda: transport.request('GET', path))
+    return scenario
+
+
+def _login(transport, options, timed):
+    credentials = {'username': options['username'], 'password': options['password']}
+    status, body = timed('POST /api/login', lambda: transport.request('POST', '/api/login', credentials))
+    return json.loads(body)['token'] if status == 200 else None
+
+
+def _create_skill(transport, options, timed):
+    # Each client thread logs in once and reuses the token, like the
+    # transports reuse connections; logging in per write would run into the
+    # login rate limits long before the write endpoint is measured
+    session = options['session']
+    token = getattr(session, 'token', None)
+    if token is None:
+        token = session.token = _login(transport, options, timed)
+        if token is None:
+            return
+    skill = {'name': f'loadtest-{uuid.uuid4().hex[:12]}', 'category': 'Loadtest', 'proficiency': 3}
+    status, _ = timed('POST /api/skills', lambda: transport.request(
+        'POST', '/api/skills', skill, {'Authorization': f'Bearer {token}'}
+    ))
+    if status == 401:
+        # Expired or revoked; log in again on this thread's next write
+        session.token = None
+
+
+SCENARIOS = {
+    'projects': _get('/api/projects'),
+    'skills': _get('/api/skills'),
+    'profile': _get('/api/profile'),
+    'portfolio': _get('/api/portfolio'),
+    'create-skill': _create_skill,
+    'login': _login,
+}
+
+
+def parse_mix(mix):
+    # "projects:90,profile:5,create-skill:5" -> ([names], [weights])
+    names, weights = [], []
+    for part in mix.split(','):
+        name, _, weight = part.strip().partition(':')
+        if name not in SCENARIOS:
+            raise click.BadParameter(f"unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+        try:
+            value = float(weight or 1)
+        except ValueError:
+            raise click.BadParameter(f"weight of '{name}' must be a number, not '{weight}'")
+        if not 0 <= value < float('inf'):
+            raise click.BadParameter(f"weight of '{name}' must be a non-negative number")
+        names.append(name)
+        weights.append(value)
+    if not any(weights):
+        raise click.BadParameter("at least one scenario needs a positive weight")
+    return names, weights
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile of an already sorted list
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run(transport, names, weights, rate, duration, concurrency, options, rng=None):
+    """Open-loop load: arrivals follow a Poisson process at ``rate`` per second.
+
+    Requests are scheduled whether or not earlier ones have finished, and
+    latency is measured from the scheduled arrival, so time spent waiting
+    for a free client counts against the server instead of hiding it.
+    """
+    rng = rng or random.Random()
+    recorder = Recorder()
+    # Per-thread state such as the login token of the write scenarios
+    options = dict(options, session=threading.local())
+
+    def execute(scenario, scheduled):
+        start = scheduled
+
+        def timed(endpoint, call):
+            # Later steps of a scenario are timed from when they are issued
+            nonlocal start
+            start = start or time.perf_counter()
+            try:
+                status, body = call()
+            except (http.client.HTTPException, OSError):
+                status, body = 'error', b''
+            recorder.record(endpoint, status, time.perf_counter() - start)
+            start = None
+            return status, body
+
+        try:
+            SCENARIOS[scenario](transport, options, timed)
+        except Exception as e:
+            # Anything else would vanish with the discarded future; report it
+            # against the scenario so failures are never under-counted
+            recorder.record(f'scenario {scenario}', type(e).__name__, time.perf_counter() - scheduled)
+
+    started = time.perf_counter()
+    next_arrival = started
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while next_arrival < started + duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(execute, rng.choices(names, weights)[0], next_arrival)
+            next_arrival += rng.expovariate(rate)
+    return recorder, time.perf_counter() - started
+
+
+def report(recorder, elapsed):
+    lines = [
+        f"{'endpoint':<22} {'count':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8}  statuses"
+    ]
+    for endpoint in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[endpoint])
+        ms = [percentile(values, p) * 1000 for p in (50, 95, 99)] + [values[-1] * 1000]
+        statuses = ' '.join(f'{status}={count}' for status, count in sorted(
+            recorder.statuses[endpoint].items(), key=lambda item: str(item[0])
+        ))
+        lines.append(
+            f'{endpoint:<22} {len(values):>7} {len(values) / elapsed:>8.1f} '
+            + ' '.join(f'{value:>8.2f}' for value in ms) + f'  {statuses}'
+        )
+    return '\n'.join(lines)
+
+
+@click.command('loadtest')
+@click.option('--url', default=None, help="Base URL of a running server; defaults to this app in-process.")
+@click.option('--mix', default='projects:90,profile:5,create-skill:5', show_default=True,
+              help="Weighted scenarios: " + ', '.join(SCENARIOS) + '.')
+@click.option('--rate', default=50.0, show_default=True, help="Arrivals per second.")
+@click.option('--duration', default=10.0, show_default=True, help="Seconds to generate load for.")
+@click.option('--concurrency', default=32, show_default=True, help="Concurrent clients.")
+@click.option('--username', default='admin', show_default=True,
+              help="Login for the login scenario and, once per client, the write scenarios.")
+@click.option('--password', default='', help="Password for the login and write scenarios.")
+@click.option('--seed', type=int, default=None, help="Seed the arrival and mix sequence.")
+@with_appcontext
+def loadtest_cli(url, mix, rate, duration, concurrency, username, password, seed):
+    """Drive the API with an open-loop request mix and report latency percentiles."""
+    names, weights = parse_mix(mix)
+    transport = HTTPTransport(url) if url else WSGITransport(current_app._get_current_object())
+    click.echo(f"Running {mix} at {rate:g} req/s for {duration:g}s with {concurrency} clients "
+               f"against {url or 'the in-process app'}")
+    recorder, elapsed = run(transport, names, weights, rate, duration, concurrency,
+                            {'username': username, 'password': password}, random.Random(seed))
+    click.echo(report(recorder, elapsed))
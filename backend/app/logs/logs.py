@@ -0,0 +1,167 @@
+import atexit
+import importlib
+import logging
+import logging.handlers
+import os
+import random
+import re
+import sys
+
+REDACTED = '[REDACTED]'
+
+# Secrets that must never reach a log sink, however they were interpolated
+REDACTIONS = (
+    (re.compile(r'(Bearer\s+)\S+', re.IGNORECASE), r'\1' + REDACTED),
+    (re.compile(r'eyJ[\w-]+\.[\w-]+\.[\w-]*'), REDACTED),
+    (re.compile(r'''(["']?\b(?:password|passwd|secret|access_token)["']?\s*[:=]\s*)("[^"]*"|'[^']*'|[^\s,}]+)''',
+                re.IGNORECASE), r'\1' + REDACTED),
+)
+
+# Arguments that can be formatted later on another thread without racing the
+# request that logged them (ORM instances, for example, may lazy-load)
+SAFE_ARGS = (str, bytes, int, float, bool, type(None), BaseException)
+
+
+def redact(text):
+    for pattern, replacement in REDACTIONS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+class RedactingFormatter(logging.Formatter):
+    def format(self, record):
+        return redact(super().format(record))
+
+
+class DebugSampler(logging.Filter):
+    """Keep every record above DEBUG and a ``rate`` fraction of DEBUG ones."""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+def _native(module, name):
+    # Under gevent's monkey patching threads become greenlets, which would
+    # stall whenever a worker blocks and survive fork into every child; the
+    # listener needs a real OS thread and primitives that work across it
+    try:
+        from gevent import monkey
+    except ImportError:
+        return getattr(importlib.import_module(module), name)
+    return monkey.get_original(module, name)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the listener thread without formatting or waiting.
+
+    Records are dropped (and counted) rather than blocking the request when
+    the sink falls behind and ``maxsize`` records are already waiting.
+    """
+
+    def __init__(self, log_queue, maxsize):
+        super().__init__(log_queue)
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Only interpolate here when an argument is not safe to format later;
+        # timestamps, tracebacks and redaction are left to the listener
+        args = record.args
+        if args and not all(isinstance(arg, SAFE_ARGS) for arg in
+                            (args.values() if isinstance(args, dict) else args)):
+            record.msg, record.args = record.getMessage(), None
+        return record
+
+    def enqueue(self, record):
+        if self.queue.qsize() >= self.maxsize:
+            self.dropped += 1
+        else:
+            self.queue.put(record)
+
+
+class StderrHandler(logging.StreamHandler):
+    # Resolve sys.stderr per record so a replaced stream is honoured
+    def __init__(self):
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+    def createLock(self):
+        self.lock = _native('_thread', 'RLock')()
+
+
+class LoggingPipeline:
+    """Root queue handler plus the listener thread that drains it."""
+
+    def __init__(self, queue_size):
+        self.sink = StderrHandler()
+        self.sampler = DebugSampler()
+        self.handler = NonBlockingQueueHandler(_native('queue', 'SimpleQueue')(), queue_size)
+        self.handler.addFilter(self.sampler)
+        self._start()
+        atexit.register(self.stop)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def configure(self, level, fmt, sample_rate):
+        self.sink.setFormatter(RedactingFormatter(fmt))
+        self.sampler.rate = sample_rate
+        root = logging.getLogger()
+        root.setLevel(level)
+        if self.handler not in root.handlers:
+            root.addHandler(self.handler)
+
+    def _start(self):
+        self.stopped = _native('_thread', 'allocate_lock')()
+        self.stopped.acquire()
+        _native('_thread', 'start_new_thread')(self._drain, (self.handler.queue, self.stopped))
+
+    def _drain(self, log_queue, stopped):
+        try:
+            while True:
+                record = log_queue.get()
+                if record is None:
+                    break
+                if record.levelno >= self.sink.level:
+                    self.sink.handle(record)
+        finally:
+            stopped.release()
+
+    def stop(self, timeout=1.0):
+        # Flush what is queued, but never hold up interpreter exit for long
+        self.handler.queue.put(None)
+        if self.stopped.acquire(timeout=timeout):
+            self.stopped.release()
+
+    def _after_fork(self):
+        # Only the forking thread survives fork, and the old queue may have
+        # been mid-update, so each child starts a fresh queue and listener
+        self.handler.queue = _native('queue', 'SimpleQueue')()
+        self.handler.dropped = 0
+        self._start()
+
+
+_pipeline = None
+
+
+def configure_logging(app):
+    """Route all logging through the background pipeline, configured from ``app.config``.
+
+    Safe to call once per app; the pipeline itself is shared by the process.
+    """
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = LoggingPipeline(app.config['LOG_QUEUE_SIZE'])
+    _pipeline.configure(app.config['LOG_LEVEL'].upper(), app.config['LOG_FORMAT'], app.config['LOG_DEBUG_SAMPLE_RATE'])
+    app.extensions['logging'] = _pipeline
+    return _pipeline
@@ -0,0 +1,244 @@
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+from ..models.models import db
+
+# Seconds; Prometheus' defaults, which bracket everything from a cached read
+# to a slow bulk write
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HISTOGRAMS = {
+    'http_request_duration_seconds': 'Request latency by endpoint, method and status.',
+}
+COUNTERS = {
+    'db_queries_total': 'SQL statements executed while serving requests.',
+    'db_query_duration_seconds_total': 'Time spent executing SQL while serving requests.',
+}
+
+_states = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    # Forked workers must not report what their parent already counted
+    for state in _states:
+        state.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _bucket(value):
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if value <= bound:
+            return i
+    return len(LATENCY_BUCKETS)
+
+
+class MetricsState:
+    """Per-process metric samples.
+
+    The request path only appends to a deque, which is atomic and needs no
+    lock. Samples are folded into ``totals`` at most every
+    ``flush_interval`` seconds, and in multiprocess mode written to a
+    per-pid file that every worker reads when scraped.
+    """
+
+    def __init__(self, multiproc_dir, flush_interval):
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.reset()
+        _states.add(self)
+
+    def reset(self):
+        self.pending = deque()
+        self.totals = {}
+        self.next_flush = 0.0
+
+    def observe(self, name, labels, value):
+        self.pending.append(('histogram', name, labels, value))
+
+    def inc(self, name, labels, value=1):
+        self.pending.append(('counter', name, labels, value))
+
+    def maybe_flush(self):
+        if time.monotonic() >= self.next_flush:
+            self.flush()
+
+    def flush(self):
+        if not self.lock.acquire(blocking=False):
+            return  # another thread is already flushing
+        try:
+            pending, totals = self.pending, self.totals
+            while pending:
+                kind, name, labels, value = pending.popleft()
+                key = (name, labels)
+                if kind == 'counter':
+                    totals[key] = totals.get(key, 0) + value
+                else:
+                    # Per-bucket counts followed by sum and count
+                    series = totals.get(key)
+                    if series is None:
+                        series = totals[key] = [0] * (len(LATENCY_BUCKETS) + 3)
+                    series[_bucket(value)] += 1
+                    series[-2] += value
+                    series[-1] += 1
+            if self.multiproc_dir:
+                self._write()
+        finally:
+            self.next_flush = time.monotonic() + self.flush_interval
+            self.lock.release()
+
+    def _write(self):
+        path = os.path.join(self.multiproc_dir, 'metrics-%d.json' % os.getpid())
+        fd, tmp = tempfile.mkstemp(dir=self.multiproc_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump([[name, labels, value] for (name, labels), value in self.totals.items()], f)
+        os.replace(tmp, path)
+
+    def collect(self):
+        """Merged totals for this process, or for every worker in multiprocess mode."""
+        self.flush()
+        if not self.multiproc_dir:
+            return dict(self.totals)
+        merged = {}
+        for path in glob.glob(os.path.join(self.multiproc_dir, 'metrics-*.json')):
+            try:
+                with open(path) as f:
+                    rows = json.load(f)
+            except (OSError, ValueError):
+                continue  # a worker exited between glob and open
+            for name, labels, value in rows:
+                key = (name, tuple(tuple(label) for label in labels))
+                if isinstance(value, list):
+                    current = merged.setdefault(key, [0] * len(value))
+                    for i, v in enumerate(value):
+                        current[i] += v
+                else:
+                    merged[key] = merged.get(key, 0) + value
+        return merged
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(labels, extra=()):
+    pairs = tuple(labels) + tuple(extra)
+    if not pairs:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (k, _escape(v)) for k, v in pairs)
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(totals):
+    """Prometheus text exposition (format 0.0.4) of collected totals."""
+    lines = []
+    for name, help_text in HISTOGRAMS.items():
+        lines += ['# HELP %s %s' % (name, help_text), '# TYPE %s histogram' % name]
+        for (metric, labels), series in sorted(totals.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), series):
+                cumulative += count
+                lines.append('%s_bucket%s %d' % (name, _labels(labels, [('le', bound)]), cumulative))
+            lines.append('%s_sum%s %s' % (name, _labels(labels), _number(series[-2])))
+            lines.append('%s_count%s %d' % (name, _labels(labels), series[-1]))
+    for name, help_text in COUNTERS.items():
+        lines += ['# HELP %s %s' % (name, help_text), '# TYPE %s counter' % name]
+        for (metric, labels), value in sorted(totals.items()):
+            if metric == name:
+                lines.append('%s%s %s' % (name, _labels(labels), _number(value)))
+    return '\n'.join(lines) + '\n'
+
+
+def clear_multiproc_dir(path):
+    # Worker files from a previous run would otherwise be summed into this one
+    for stale in glob.glob(os.path.join(path, 'metrics-*.json')):
+        os.remove(stale)
+
+
+class Metrics:
+    """Request latency and per-request database metrics.
+
+    ``METRICS_MULTIPROC_DIR`` switches on multiprocess mode, where each
+    gunicorn worker writes its totals to that directory and a scrape of any
+    worker reports the sum across all of them.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('METRICS_ENABLED', True)
+        app.config.setdefault('METRICS_MULTIPROC_DIR', '')
+        app.config.setdefault('METRICS_FLUSH_INTERVAL', 1.0)
+        if not app.config['METRICS_ENABLED']:
+            return
+        multiproc_dir = app.config['METRICS_MULTIPROC_DIR']
+        if multiproc_dir:
+            os.makedirs(multiproc_dir, exist_ok=True)
+        app.extensions['metrics'] = MetricsState(multiproc_dir, app.config['METRICS_FLUSH_INTERVAL'])
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(db.engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    @property
+    def _state(self):
+        return current_app.extensions['metrics']
+
+    def _start_request(self):
+        g.metrics_start = time.perf_counter()
+        g.db_queries = 0
+        g.db_time = 0.0
+
+    def _finish_request(self, response):
+        start = g.get('metrics_start')
+        if start is None:
+            return response
+        state = self._state
+        # Unmatched URLs share one label so scanners cannot grow the series
+        endpoint = request.endpoint or 'unmatched'
+        state.observe('http_request_duration_seconds', (
+            ('endpoint', endpoint), ('method', request.method), ('status', str(response.status_code))
+        ), time.perf_counter() - start)
+        if g.db_queries:
+            labels = (('endpoint', endpoint),)
+            state.inc('db_queries_total', labels, g.db_queries)
+            state.inc('db_query_duration_seconds_total', labels, g.db_time)
+        state.maybe_flush()
+        return response
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info['query_start'] = time.perf_counter()
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and 'db_queries' in g:
+            g.db_queries += 1
+            g.db_time += time.perf_counter() - conn.info['query_start']
+
+    def exposition(self):
+        return render(self._state.collect())
+
+
+metrics = Metrics()
@@ -1,8 +1,11 @@
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from ..auth.hashing import password_hasher
 
 db = SQLAlchemy()
 
+# Bump whenever the models change so the next boot runs create_all
+SCHEMA_VERSION = 4
+
 class User(db.Model):
     __tablename__ = 'users'
     id = db.Column(db.Integer, primary_key=True)
@@ -10,10 +13,21 @@ class User(db.Model):
     password_hash = db.Column(db.String(256), nullable=False)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.generate(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.check(self.password_hash, password)
+
+class SchemaVersion(db.Model):
+    __tablename__ = 'schema_version'
+    version = db.Column(db.Integer, primary_key=True)
+    applied_at = db.Column(db.DateTime, nullable=False)
+
+class RevokedToken(db.Model):
+    __tablename__ = 'revoked_tokens'
+    jti = db.Column(db.String(36), primary_key=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    revoked_at = db.Column(db.DateTime, nullable=False, index=True)
 
 class Project(db.Model):
     __tablename__ = 'projects'
@@ -24,6 +38,8 @@ class Project(db.Model):
     github_url = db.Column(db.String(512))
     live_url = db.Column(db.String(512))
     tech_stack = db.Column(db.JSON)
+    # Resized variants of an uploaded image_url, written by the image pipeline
+    image_variants = db.Column(db.JSON)
     created_at = db.Column(db.TIMESTAMP, server_default=db.func.current_timestamp())
     updated_at = db.Column(
         db.TIMESTAMP, 
@@ -31,6 +47,25 @@ class Project(db.Model):
         onupdate=db.func.current_timestamp()
     )
 
+    __table_args__ = (
+        db.Index('ix_projects_created_at_id', 'created_at', 'id'),
+        db.Index('ix_projects_updated_at', 'updated_at'),
+    )
+
+class ProjectTechnology(db.Model):
+    __tablename__ = 'project_technologies'
+    project_id = db.Column(
+        db.Integer,
+        db.ForeignKey('projects.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    tech_key = db.Column(db.String(100), primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_project_technologies_tech_key', 'tech_key', 'project_id'),
+    )
+
 class Skill(db.Model):
     __tablename__ = 'skills'
     id = db.Column(db.Integer, primary_key=True)
@@ -38,3 +73,23 @@ class Skill(db.Model):
     category = db.Column(db.String(100), nullable=False)
     proficiency = db.Column(db.Integer)
     created_at = db.Column(db.TIMESTAMP, server_default=db.func.current_timestamp())
+
+    __table_args__ = (
+        db.Index('ix_skills_category_name', 'category', 'name'),
+        db.Index('ix_skills_created_at_id', 'created_at', 'id'),
+    )
+
+class TechnologyStats(db.Model):
+    # Projects per technology, kept in step with project_technologies
+    __tablename__ = 'technology_stats'
+    tech_key = db.Column(db.String(100), primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    project_count = db.Column(db.Integer, nullable=False, default=0)
+
+class SkillCategoryStats(db.Model):
+    # Per-category skill counts and proficiency totals, kept in step with skills
+    __tablename__ = 'skill_category_stats'
+    category = db.Column(db.String(100), primary_key=True)
+    skill_count = db.Column(db.Integer, nullable=False, default=0)
+    proficiency_count = db.Column(db.Integer, nullable=False, default=0)
+    proficiency_total = db.Column(db.Integer, nullable=False, default=0)
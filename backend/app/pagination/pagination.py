@@ -0,0 +1,153 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from urllib.parse import urlencode
+
+from flask import current_app, request
+from sqlalchemy import and_, or_
+
+from ..models.models import db
+
+
+class PaginationError(ValueError):
+    pass
+
+
+class Page:
+    __slots__ = ('items', 'next_cursor')
+
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def headers(self, path=None, args=None):
+        if self.next_cursor is None:
+            return {}
+        args = (request.args if args is None else args).to_dict()
+        args['cursor'] = self.next_cursor
+        path = request.path if path is None else path
+        return {
+            'X-Next-Cursor': self.next_cursor,
+            'Link': f'<{path}?{urlencode(sorted(args.items()))}>; rel="next"'
+        }
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value['dt'])
+    return value
+
+
+def encode_cursor(sort, values):
+    payload = json.dumps([sort, [_encode_value(v) for v in values]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _matches(column, value):
+    # Cursors come back from the client, so a value of the wrong type must
+    # be refused here rather than reach the database driver
+    if value is None:
+        return column.nullable
+    expected = column.type.python_type
+    if expected is int and isinstance(value, bool):
+        return False
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor, sort, columns):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, values = json.loads(base64.urlsafe_b64decode(padded))
+        values = [_decode_value(v) for v in values]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise PaginationError("Invalid cursor")
+    if cursor_sort != sort or len(values) != len(columns):
+        raise PaginationError("Cursor does not match sort order")
+    if not all(_matches(column, value) for column, value in zip(columns, values)):
+        raise PaginationError("Invalid cursor")
+    return values
+
+
+def _after(columns, values, descending):
+    # Expanded row comparison: (a, b, c) > (x, y, z) becomes
+    # a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z), which every
+    # backend can satisfy with a range scan on the matching composite index.
+    clauses = []
+    for i, column in enumerate(columns):
+        bound = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*[columns[j] == values[j] for j in range(i)], bound))
+    return or_(*clauses)
+
+
+def _limit(args, default, maximum):
+    try:
+        limit = int(args.get('limit', default))
+    except ValueError:
+        raise PaginationError("limit must be an integer")
+    if limit < 1:
+        raise PaginationError("limit must be positive")
+    return min(limit, maximum)
+
+
+def _sort(sorts, default_sort, args):
+    sort = args.get('sort', default_sort)
+    columns = sorts.get(sort.lstrip('-'))
+    if columns is None:
+        raise PaginationError(f"Unsupported sort: {sort}")
+    return sort, columns, sort.startswith('-')
+
+
+def _order(columns, descending):
+    return [column.desc() if descending else column.asc() for column in columns]
+
+
+def ordered(query, sorts, default_sort, args=None):
+    """Apply only the requested ``sort`` to ``query``, for unpaginated reads."""
+    sort, columns, descending = _sort(sorts, default_sort, request.args if args is None else args)
+    return query.order_by(*_order(columns, descending))
+
+
+def keyset(query, sorts, default_sort, args, default_limit, max_limit):
+    """Build one keyset page of ``query`` (a Core select) from query args.
+
+    The page is chosen by the ``limit``/``cursor``/``sort`` args. ``sorts``
+    maps a sort name to the tuple of columns forming its unique key; a
+    leading ``-`` on the requested sort reverses every column.
+
+    Returns the statement to execute and a function turning its rows into a
+    ``Page``, so sync and async callers share the same logic.
+    """
+    sort, columns, descending = _sort(sorts, default_sort, args)
+
+    limit = _limit(args, default_limit, max_limit)
+    cursor = args.get('cursor')
+    if cursor:
+        query = query.where(_after(columns, decode_cursor(cursor, sort, columns), descending))
+
+    def finish(rows):
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(sort, [getattr(rows[-1], c.key) for c in columns])
+        return Page(rows, next_cursor)
+
+    return query.order_by(*_order(columns, descending)).limit(limit + 1), finish
+
+
+def paginate(query, sorts, default_sort):
+    statement, finish = keyset(
+        query,
+        sorts,
+        default_sort,
+        request.args,
+        current_app.config['PAGINATION_DEFAULT_LIMIT'],
+        current_app.config['PAGINATION_MAX_LIMIT']
+    )
+    return finish(db.session.execute(statement).all())
@@ -0,0 +1,84 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+# Engine options that only make sense for a QueuePool
+QUEUE_POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout')
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.acquisitions += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+def _is_memory_sqlite(uri):
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+
+def engine_options(uri, options, queue_pool=None):
+    # In-memory SQLite runs on a single StaticPool connection, and the async
+    # SQLite driver on a NullPool, so neither accepts the queue sizing options
+    if queue_pool is None:
+        queue_pool = not _is_memory_sqlite(uri)
+    options = dict(options)
+    if not queue_pool:
+        for key in QUEUE_POOL_OPTIONS + ('poolclass',):
+            options.pop(key, None)
+    return options
+
+
+def init_pool(app):
+    # Must run before db.init_app, which creates the engine from these options
+    options = engine_options(
+        app.config['SQLALCHEMY_DATABASE_URI'],
+        app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+    )
+    if not _is_memory_sqlite(app.config['SQLALCHEMY_DATABASE_URI']):
+        options.setdefault('poolclass', InstrumentedQueuePool)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+def pool_stats(engine):
+    pool = engine.pool
+    stats = {'class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': max(pool.overflow(), 0)
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update({
+            'acquisitions': pool.acquisitions,
+            'timeouts': pool.timeouts,
+            'wait_ms_total': round(pool.wait_total * 1000, 3),
+            'wait_ms_max': round(pool.wait_max * 1000, 3)
+        })
+    return stats
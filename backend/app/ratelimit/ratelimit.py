@@ -0,0 +1,168 @@
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, jsonify, request
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_limit(limit):
+    # "10/minute" -> (capacity 10, refill rate in tokens per second)
+    count, _, period = limit.partition('/')
+    return int(count), int(count) / PERIODS[period.strip()]
+
+
+def take(tokens, updated, capacity, rate, now):
+    """Refill a bucket to ``now`` and try to take one token.
+
+    Returns ``(allowed, tokens, retry_after)``.
+    """
+    tokens = min(capacity, tokens + (now - updated) * rate)
+    if tokens >= 1:
+        return True, tokens - 1, 0.0
+    return False, tokens, (1 - tokens) / rate
+
+
+class MemoryBackend:
+    """Per-process buckets in a map capped at ``max_keys`` entries.
+
+    Only buckets that have refilled to capacity, and so are indistinguishable
+    from new ones, are evicted, least recently used first. While every
+    bucket is still draining, new keys share one overflow bucket per limit,
+    which can make those clients stricter but never looser.
+    """
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated, capacity, rate), least recently hit first
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def hit(self, key, capacity, rate, now):
+        with self.lock:
+            if key not in self.buckets and len(self.buckets) >= self.max_keys:
+                self._evict(now)
+                if len(self.buckets) >= self.max_keys:
+                    key = ('overflow', capacity, rate)
+            tokens, updated, _, _ = self.buckets.pop(key, (capacity, now, capacity, rate))
+            allowed, tokens, retry_after = take(tokens, updated, capacity, rate, now)
+            self.buckets[key] = (tokens, now, capacity, rate)
+        return allowed, retry_after
+
+    def _evict(self, now):
+        # Stops at the first bucket still refilling; later ones were hit
+        # more recently and have mostly had less time to refill
+        while self.buckets:
+            key, (tokens, updated, capacity, rate) = next(iter(self.buckets.items()))
+            if tokens + (now - updated) * rate < capacity:
+                return
+            del self.buckets[key]
+
+
+class SQLiteBackend:
+    """Buckets in a SQLite file shared by every worker on the host.
+
+    Each hit is one ``BEGIN IMMEDIATE`` transaction, so concurrent workers
+    serialize on the file lock and a limit holds across the whole server.
+    Put the file on tmpfs (e.g. /dev/shm) to keep it in memory.
+    """
+
+    def __init__(self, path, max_idle=86400):
+        self.path = path
+        self.max_idle = max_idle
+        self.local = threading.local()
+        self.hits = 0
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS buckets '
+                '(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)'
+            )
+
+    def _connect(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self.local.conn, self.local.pid = conn, os.getpid()
+        return conn
+
+    def hit(self, key, capacity, rate, now):
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            allowed, tokens, retry_after = take(tokens, updated, capacity, rate, now)
+            conn.execute(
+                'INSERT INTO buckets (key, tokens, updated) VALUES (?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated',
+                (key, tokens, now)
+            )
+            self.hits += 1
+            if self.hits % 1000 == 0:
+                # Idle buckets have refilled; dropping them keeps the file small
+                conn.execute('DELETE FROM buckets WHERE updated < ?', (now - self.max_idle,))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return allowed, retry_after
+
+
+class RateLimiter:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RATELIMIT_ENABLED', True)
+        app.config.setdefault('RATELIMIT_BACKEND', 'memory')
+        app.config.setdefault('RATELIMIT_MAX_KEYS', 10000)
+        app.config.setdefault(
+            'RATELIMIT_SQLITE_PATH',
+            os.path.join(tempfile.gettempdir(), 'portfolio-ratelimit.sqlite3')
+        )
+        if app.config['RATELIMIT_BACKEND'] == 'sqlite':
+            backend = SQLiteBackend(app.config['RATELIMIT_SQLITE_PATH'])
+        else:
+            backend = MemoryBackend(app.config['RATELIMIT_MAX_KEYS'])
+        app.extensions['rate_limiter'] = backend
+
+    def hit(self, scope, key, limit_name):
+        """Take one token from ``scope:key`` under the configured limit.
+
+        Returns ``(allowed, retry_after_seconds)``.
+        """
+        if not current_app.config['RATELIMIT_ENABLED']:
+            return True, 0.0
+        capacity, rate = parse_limit(current_app.config[limit_name])
+        backend = current_app.extensions['rate_limiter']
+        return backend.hit(f'{scope}:{key}', capacity, rate, time.time())
+
+    def rejected(self, retry_after):
+        response = jsonify({"message": "Too many requests"})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    def limit_writes(self, scope):
+        # Per-IP limit on every method except safe reads
+        def wrapper(fn):
+            @wraps(fn)
+            def decorated(*args, **kwargs):
+                if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+                    allowed, retry_after = self.hit(scope, request.remote_addr, 'RATELIMIT_WRITE_IP')
+                    if not allowed:
+                        return self.rejected(retry_after)
+                return fn(*args, **kwargs)
+            return decorated
+        return wrapper
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,29 @@
+from flask import Blueprint, current_app, jsonify, request
+from ..auth.auth import principal_required
+from ..slowlog.slowlog import slow_query_log
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+admin_bp = Blueprint('admin', __name__)
+
+@admin_bp.route('/api/admin/slow-queries', methods=['GET', 'DELETE'])
+@principal_required()
+def slow_queries():
+    if 'slow_query_log' not in current_app.extensions:
+        return jsonify({"message": "Resource not found"}), 404
+    try:
+        if request.method == 'DELETE':
+            slow_query_log.clear()
+            return jsonify({"message": "Slow query log cleared"}), 200
+
+        # Each gunicorn worker keeps its own log; pid says which one answered
+        with_plans = request.args.get('explain', '1') != '0'
+        return jsonify({
+            "pid": os.getpid(),
+            "queries": slow_query_log.report(with_plans=with_plans)
+        }), 200
+
+    except Exception as e:
+        logger.error("Error reading slow query log: %s", e)
+        return jsonify({"message": "Error reading slow query log"}), 500
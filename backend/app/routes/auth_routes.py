@@ -1,6 +1,10 @@
 from flask import Blueprint, jsonify, request
-from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
+from flask_jwt_extended import create_access_token, get_jwt, get_jwt_identity, jwt_required
 from ..models.models import User, db
+from ..auth.revocation import token_blocklist
+from ..auth.principals import principal_cache
+from ..auth.hashing import HashingUnavailable
+from ..ratelimit.ratelimit import rate_limiter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,24 +19,38 @@ def login():
 
         username = data['username']
         password = data['password']
+
+        # Throttle before the users table or the hashing pool is touched
+        for scope, key, limit in (
+            ('login-ip', request.remote_addr, 'RATELIMIT_LOGIN_IP'),
+            ('login-user', str(username), 'RATELIMIT_LOGIN_USERNAME')
+        ):
+            allowed, retry_after = rate_limiter.hit(scope, key, limit)
+            if not allowed:
+                logger.warning("Rate limited login attempt for user: %s", username)
+                return rate_limiter.rejected(retry_after)
         
         user = User.query.filter_by(username=username).first()
         
         if not user or not user.check_password(password):
-            logger.warning(f"Failed login attempt for user: {username}")
+            logger.warning("Failed login attempt for user: %s", username)
             return jsonify({"message": "Invalid username or password"}), 401
 
         access_token = create_access_token(identity=username)
-        logger.info(f"Successful login for user: {username}")
+        logger.info("Successful login for user: %s", username)
         
         return jsonify({
             "message": "Login successful",
             "token": access_token,
             "user": {"username": username}
         }), 200
+
+    except HashingUnavailable as e:
+        logger.warning("Login rejected: %s", e)
+        return jsonify({"message": "Server busy, please retry"}), 503, {"Retry-After": "1"}
         
     except Exception as e:
-        logger.error(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e)
         return jsonify({"message": "An error occurred during login"}), 500
 
 @auth_bp.route('/api/check-auth', methods=['GET'])
@@ -40,7 +58,7 @@ def login():
 def check_auth():
     try:
         current_user = get_jwt_identity()
-        user = User.query.filter_by(username=current_user).first()
+        user = principal_cache.get(current_user)
         
         if not user:
             return jsonify({
@@ -54,8 +72,21 @@ def check_auth():
         }), 200
         
     except Exception as e:
-        logger.error(f"Auth check error: {str(e)}")
+        logger.error("Auth check error: %s", e)
         return jsonify({
             "authenticated": False,
             "message": "Authentication failed"
         }), 401
+
+@auth_bp.route('/api/logout', methods=['POST'])
+@jwt_required()
+def logout():
+    try:
+        token_blocklist.revoke(get_jwt())
+        logger.info("Logged out user: %s", get_jwt_identity())
+        return jsonify({"message": "Logout successful"}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Logout error: %s", e)
+        return jsonify({"message": "An error occurred during logout"}), 500
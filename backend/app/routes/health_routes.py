@@ -0,0 +1,27 @@
+from flask import Blueprint, current_app, jsonify
+from ..models.models import db
+from ..pool.pool import pool_stats
+import logging
+
+logger = logging.getLogger(__name__)
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('/api/ready', methods=['GET'])
+def ready():
+    try:
+        # Checks out a pooled connection (validated by pool_pre_ping) rather
+        # than dialing the database from scratch
+        with db.engine.connect() as conn:
+            conn.exec_driver_sql('SELECT 1')
+        payload = {"status": "ready", "pool": pool_stats(db.engine)}
+        startup = current_app.extensions.get('startup')
+        if startup:
+            payload["startup"] = {
+                "ready_seconds": startup['ready_seconds'],
+                "first_request_seconds": startup['first_request_seconds']
+            }
+        return jsonify(payload), 200
+
+    except Exception as e:
+        logger.error("Readiness check failed: %s", e)
+        return jsonify({"status": "unavailable", "pool": pool_stats(db.engine)}), 503
@@ -0,0 +1,10 @@
+from flask import Blueprint, Response, current_app, jsonify
+from ..metrics.metrics import metrics
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    if 'metrics' not in current_app.extensions:
+        return jsonify({"message": "Resource not found"}), 404
+    return Response(metrics.exposition(), mimetype='text/plain; version=0.0.4; charset=utf-8')
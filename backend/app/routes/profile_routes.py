@@ -1,29 +1,87 @@
-from flask import Blueprint, jsonify
-from ..models.models import User, Skill
+from flask import Blueprint, current_app, jsonify
+from werkzeug.datastructures import MultiDict
+from ..models.models import User, Skill, db
+from ..cache.cache import read_cache
+from ..snapshot.snapshot import snapshot_publisher
+from ..pagination.pagination import keyset
+from ..serializers.serializers import profile_skill_serializer, project_serializer, skill_serializer
+from .project_routes import PROJECT_SORTS
+from .skill_routes import SKILL_SORTS
 import logging
 
 logger = logging.getLogger(__name__)
 profile_bp = Blueprint('profile', __name__)
 
+# For now, we'll return a static profile
+# In the future, this could be made dynamic and stored in the database
+PROFILE = {
+    'name': 'Jacob',
+    'title': 'Full Stack Developer',
+    'bio': 'Passionate about building beautiful and functional web applications'
+}
+
+# Isolation under which every statement of a transaction reads one snapshot
+SNAPSHOT_ISOLATION = {
+    'mysql': 'REPEATABLE READ',
+    'postgresql': 'REPEATABLE READ'
+}
+
+def portfolio_queries(default_limit, max_limit):
+    # The first page of each listing, in its default order; the bundle takes
+    # no arguments and clients continue from the returned cursors
+    args = MultiDict()
+    return (
+        keyset(project_serializer.select(), PROJECT_SORTS, '-created_at', args, default_limit, max_limit),
+        keyset(skill_serializer.select(), SKILL_SORTS, 'category', args, default_limit, max_limit)
+    )
+
+def portfolio_payload(projects, skills):
+    return {
+        'profile': PROFILE,
+        'projects': project_serializer.rows(projects.items),
+        'skills': skill_serializer.rows(skills.items),
+        'next_cursors': {'projects': projects.next_cursor, 'skills': skills.next_cursor}
+    }
+
+def _build_portfolio():
+    (projects, finish_projects), (skills, finish_skills) = portfolio_queries(
+        current_app.config['PAGINATION_DEFAULT_LIMIT'],
+        current_app.config['PAGINATION_MAX_LIMIT']
+    )
+    isolation = SNAPSHOT_ISOLATION.get(db.engine.dialect.name)
+    # Both reads share one connection and transaction, so a write committed
+    # between them cannot show up in one list and not the other
+    conn = db.session.connection(
+        execution_options={'isolation_level': isolation} if isolation else None
+    )
+    return portfolio_payload(
+        finish_projects(conn.execute(projects).all()),
+        finish_skills(conn.execute(skills).all())
+    )
+
+def _build_profile():
+    skills = db.session.execute(profile_skill_serializer.select())
+    return dict(PROFILE, skills=profile_skill_serializer.rows(skills))
+
+snapshot_publisher.register('profile', _build_profile, depends_on=('skills',))
+snapshot_publisher.register('portfolio', _build_portfolio, depends_on=('projects', 'skills'))
+
 @profile_bp.route('/api/profile', methods=['GET'])
 def get_profile():
     try:
-        # For now, we'll return a static profile
-        # In the future, this could be made dynamic and stored in the database
-        skills = Skill.query.all()
-        
-        return jsonify({
-            'name': 'Jacob',
-            'title': 'Full Stack Developer',
-            'bio': 'Passionate about building beautiful and functional web applications',
-            'skills': [{
-                'id': s.id,
-                'name': s.name,
-                'category': s.category,
-                'proficiency': s.proficiency
-            } for s in skills]
-        }), 200
+        # The embedded skill list is the only dynamic part of the profile
+        return read_cache.respond('profile', _build_profile, depends_on=('skills',))
         
     except Exception as e:
-        logger.error(f"Error fetching profile: {str(e)}")
+        logger.error("Error fetching profile: %s", e)
         return jsonify({"message": "Error fetching profile"}), 500
+
+@profile_bp.route('/api/portfolio', methods=['GET'])
+def get_portfolio():
+    try:
+        # Profile, projects and skills for the landing page in one response
+        return read_cache.respond('portfolio', _build_portfolio, depends_on=('projects', 'skills'))
+
+    except Exception as e:
+        logger.error("Error fetching portfolio: %s", e)
+        return jsonify({"message": "Error fetching portfolio"}), 500
@@ -1,28 +1,62 @@
-from flask import Blueprint, jsonify, request
-from flask_jwt_extended import jwt_required
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import null, select, update
 from ..models.models import Project, db
+from ..auth.auth import principal_required
+from ..ratelimit.ratelimit import rate_limiter
+from ..cache.cache import read_cache
+from ..search.search import search_index
+from ..snapshot.snapshot import first_page, snapshot_publisher
+from ..images.images import ImageError, image_pipeline
+from ..pagination.pagination import PaginationError, ordered, paginate
+from ..indexes.tech_index import (
+    filter_by_tech,
+    index_project,
+    index_projects,
+    unindex_project,
+    unindex_projects
+)
+from ..serializers.serializers import json_response, project_serializer, stream_json
+from ..bulk.bulk import BulkError, BulkResult, delete_by_ids, parse_batch, validate
 import logging
 
 logger = logging.getLogger(__name__)
 projects_bp = Blueprint('projects', __name__)
 
+PROJECT_SORTS = {
+    'created_at': (Project.created_at, Project.id)
+}
+
+def _filtered_projects():
+    return filter_by_tech(project_serializer.select(), request.args)
+
+def _list_projects():
+    page = paginate(_filtered_projects(), PROJECT_SORTS, '-created_at')
+    return project_serializer.rows(page.items), page.headers()
+
+def _snapshot_projects():
+    rows = first_page(project_serializer.select(), PROJECT_SORTS, '-created_at')
+    return None if rows is None else project_serializer.rows(rows)
+
+snapshot_publisher.register('projects', _snapshot_projects)
+
 @projects_bp.route('/api/projects', methods=['GET', 'POST'])
+@rate_limiter.limit_writes('write')
 def projects():
     if request.method == 'GET':
+        if request.args.get('match', 'all') not in ('all', 'any'):
+            return jsonify({"message": "match must be 'all' or 'any'"}), 400
         try:
-            projects = Project.query.all()
-            return jsonify([{
-                'id': p.id,
-                'title': p.title,
-                'description': p.description,
-                'image_url': p.image_url,
-                'github_url': p.github_url,
-                'live_url': p.live_url,
-                'tech_stack': p.tech_stack,
-                'created_at': p.created_at.isoformat() if p.created_at else None
-            } for p in projects]), 200
+            if request.args.get('stream') == '1':
+                return stream_json(
+                    project_serializer,
+                    ordered(_filtered_projects(), PROJECT_SORTS, '-created_at'),
+                    current_app.config['STREAM_CHUNK_ROWS']
+                )
+            return read_cache.respond('projects', _list_projects)
+        except PaginationError as e:
+            return jsonify({"message": str(e)}), 400
         except Exception as e:
-            logger.error(f"Error fetching projects: {str(e)}")
+            logger.error("Error fetching projects: %s", e)
             return jsonify({"message": "Error fetching projects"}), 500
 
     elif request.method == 'POST':
@@ -39,37 +73,188 @@ def projects():
             )
             
             db.session.add(new_project)
+            db.session.flush()
+            index_project(new_project)
             db.session.commit()
+            read_cache.invalidate('projects')
+            payload = project_serializer.instance(new_project)
+            search_index.add('project', [payload])
+            snapshot_publisher.publish('projects')
             
-            return jsonify({
-                'id': new_project.id,
-                'title': new_project.title,
-                'description': new_project.description,
-                'image_url': new_project.image_url,
-                'github_url': new_project.github_url,
-                'live_url': new_project.live_url,
-                'tech_stack': new_project.tech_stack,
-                'created_at': new_project.created_at.isoformat()
-            }), 201
+            return json_response(payload, 201)
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating project: {str(e)}")
+            logger.error("Error creating project: %s", e)
             return jsonify({"message": "Error creating project"}), 500
 
 @projects_bp.route('/api/projects/<int:id>', methods=['DELETE'])
-@jwt_required()
+@rate_limiter.limit_writes('write')
+@principal_required()
 def delete_project(id):
     try:
         project = Project.query.get(id)
         if not project:
             return jsonify({"message": "Project not found"}), 404
             
+        unindex_project(project.id)
         db.session.delete(project)
         db.session.commit()
+        read_cache.invalidate('projects')
+        search_index.remove('project', [id])
+        snapshot_publisher.publish('projects')
         return jsonify({"message": "Project deleted successfully"}), 200
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting project: {str(e)}")
+        logger.error("Error deleting project: %s", e)
         return jsonify({"message": "Error deleting project"}), 500
+
+@projects_bp.route('/api/projects/<int:id>/image', methods=['POST'])
+@rate_limiter.limit_writes('write')
+@principal_required()
+def upload_project_image(id):
+    if not image_pipeline.enabled:
+        return jsonify({"message": "Image uploads are not available"}), 503
+    upload = request.files.get('image')
+    if upload is None:
+        return jsonify({"message": "Missing image file"}), 400
+    data = upload.read(current_app.config['IMAGE_MAX_BYTES'] + 1)
+    if len(data) > current_app.config['IMAGE_MAX_BYTES']:
+        return jsonify({"message": "Image is too large"}), 413
+
+    try:
+        project = db.session.get(Project, id)
+        if not project:
+            return jsonify({"message": "Project not found"}), 404
+
+        source = image_pipeline.submit(project, data)
+        db.session.commit()
+        read_cache.invalidate('projects')
+        snapshot_publisher.publish('projects')
+        # Resizing happens in the background; the project reports
+        # "processing" until the variants are stored
+        image_pipeline.start(id, source, data)
+        return jsonify({"message": "Image accepted for processing", "source": source}), 202
+
+    except ImageError as e:
+        db.session.rollback()
+        return jsonify({"message": str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error uploading image for project %s: %s", id, e)
+        return jsonify({"message": "Error uploading image"}), 500
+
+def _clean_project(item):
+    if not isinstance(item, dict):
+        raise BulkError("Item must be an object")
+    title = item.get('title')
+    if not isinstance(title, str) or not title.strip() or len(title) > 255:
+        raise BulkError("title must be a non-empty string of at most 255 characters")
+    fields = {'title': title, 'description': item.get('description', '')}
+    if not isinstance(fields['description'], str):
+        raise BulkError("description must be a string")
+    for field in ('image_url', 'github_url', 'live_url'):
+        value = item.get(field, '')
+        if not isinstance(value, str) or len(value) > 512:
+            raise BulkError(f"{field} must be a string of at most 512 characters")
+        fields[field] = value
+    tech_stack = item.get('tech_stack', [])
+    if not isinstance(tech_stack, list) or not all(isinstance(t, str) for t in tech_stack):
+        raise BulkError("tech_stack must be a list of strings")
+    fields['tech_stack'] = tech_stack
+    return fields
+
+def _bulk_create_projects(items, result):
+    valid = validate('create', items, _clean_project, result)
+    projects = [Project(**fields) for _, fields in valid]
+    db.session.add_all(projects)
+    db.session.flush()
+    index_projects((project.id, project.tech_stack) for project in projects)
+    for (index, _), project in zip(valid, projects):
+        result.ok('create', index, 'created', project.id)
+    return [dict(fields, id=project.id) for (_, fields), project in zip(valid, projects)]
+
+def _bulk_upsert_projects(items, result):
+    valid, seen = [], set()
+    for index, fields in validate('upsert', items, _clean_project, result):
+        if fields['title'] in seen:
+            result.fail('upsert', index, "Duplicate title in batch")
+        else:
+            seen.add(fields['title'])
+            valid.append((index, fields))
+    if not valid:
+        return []
+
+    # Projects upsert on title: one SELECT resolves every key, updates go
+    # out as a single executemany and inserts as one flush. Titles are not
+    # unique, so a title shared by several projects is rejected rather than
+    # updating whichever row came back last
+    existing, ambiguous = {}, set()
+    for title, id in db.session.execute(select(Project.title, Project.id).where(Project.title.in_(seen))):
+        if title in existing:
+            ambiguous.add(title)
+        existing[title] = id
+    updates, inserts = [], []
+    for index, fields in valid:
+        id = existing.get(fields['title'])
+        if fields['title'] in ambiguous:
+            result.fail('upsert', index, "Title matches more than one project")
+        elif id is None:
+            inserts.append((index, Project(**fields), fields))
+        else:
+            updates.append((index, dict(fields, id=id)))
+
+    if updates:
+        ids = [fields['id'] for _, fields in updates]
+        db.session.execute(update(Project), [fields for _, fields in updates])
+        # Variants describe an uploaded image; an image_url pointing anywhere
+        # else replaces it
+        db.session.execute(
+            update(Project)
+            .where(Project.id.in_(ids), Project.image_url.notlike(current_app.config['IMAGE_URL_PREFIX'] + '%'))
+            .values(image_variants=null())
+        )
+        unindex_projects(ids)
+    db.session.add_all([project for _, project, _ in inserts])
+    db.session.flush()
+    index_projects(
+        [(project.id, project.tech_stack) for _, project, _ in inserts]
+        + [(fields['id'], fields['tech_stack']) for _, fields in updates]
+    )
+
+    for index, fields in updates:
+        result.ok('upsert', index, 'updated', fields['id'])
+    for index, project, _ in inserts:
+        result.ok('upsert', index, 'created', project.id)
+    return [fields for _, fields in updates] + [
+        dict(fields, id=project.id) for _, project, fields in inserts
+    ]
+
+@projects_bp.route('/api/projects/bulk', methods=['POST'])
+@rate_limiter.limit_writes('write')
+@principal_required()
+def bulk_projects():
+    try:
+        creates, upserts, deletes = parse_batch(
+            request.get_json(silent=True), current_app.config['BULK_MAX_ITEMS']
+        )
+    except BulkError as e:
+        return jsonify({"message": str(e)}), e.status
+
+    result = BulkResult()
+    try:
+        written = _bulk_create_projects(creates, result)
+        written += _bulk_upsert_projects(upserts, result)
+        delete_by_ids(Project, deletes, result, before_delete=unindex_projects)
+        db.session.commit()
+        read_cache.invalidate('projects')
+        search_index.add('project', written)
+        search_index.remove('project', result.ids('delete', 'deleted'))
+        snapshot_publisher.publish('projects')
+        return jsonify(result.to_dict()), 200
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error applying project batch: %s", e)
+        return jsonify({"message": "Error applying project batch"}), 500
@@ -0,0 +1,29 @@
+from flask import Blueprint, current_app, jsonify, request
+from ..search.search import SOURCES, search_index
+from ..serializers.serializers import json_response
+import logging
+
+logger = logging.getLogger(__name__)
+search_bp = Blueprint('search', __name__)
+
+@search_bp.route('/api/search', methods=['GET'])
+def search():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"message": "q is required"}), 400
+    kinds = request.args.getlist('type') or None
+    if kinds and not set(kinds) <= set(SOURCES):
+        return jsonify({"message": f"type must be one of: {', '.join(SOURCES)}"}), 400
+    try:
+        limit = int(request.args.get('limit', 20))
+    except ValueError:
+        return jsonify({"message": "limit must be an integer"}), 400
+    if limit < 1:
+        return jsonify({"message": "limit must be positive"}), 400
+
+    try:
+        results = search_index.search(query, min(limit, current_app.config['SEARCH_MAX_RESULTS']), kinds)
+        return json_response({"query": query, "results": results})
+    except Exception as e:
+        logger.error("Error searching: %s", e)
+        return jsonify({"message": "Error searching"}), 500
@@ -1,25 +1,59 @@
-from flask import Blueprint, jsonify, request
-from flask_jwt_extended import jwt_required
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import select, tuple_, update
 from ..models.models import Skill, db
+from ..auth.auth import principal_required
+from ..ratelimit.ratelimit import rate_limiter
+from ..cache.cache import read_cache
+from ..search.search import search_index
+from ..snapshot.snapshot import first_page, snapshot_publisher
+from ..stats.stats import count_skills, skill_categories_rows, skill_categories_select, uncount_skill_ids
+from ..pagination.pagination import PaginationError, ordered, paginate
+from ..serializers.serializers import json_response, skill_serializer, stream_json
+from ..bulk.bulk import BulkError, BulkResult, delete_by_ids, parse_batch, validate
 import logging
 
 logger = logging.getLogger(__name__)
 skills_bp = Blueprint('skills', __name__)
 
+SKILL_SORTS = {
+    'category': (Skill.category, Skill.name, Skill.id),
+    'created_at': (Skill.created_at, Skill.id)
+}
+
+def _list_skills():
+    page = paginate(skill_serializer.select(), SKILL_SORTS, 'category')
+    return skill_serializer.rows(page.items), page.headers()
+
+def _snapshot_skills():
+    rows = first_page(skill_serializer.select(), SKILL_SORTS, 'category')
+    return None if rows is None else skill_serializer.rows(rows)
+
+snapshot_publisher.register('skills', _snapshot_skills)
+
+def _skill_categories():
+    return skill_categories_rows(db.session.execute(skill_categories_select()))
+
 @skills_bp.route('/api/skills', methods=['GET', 'POST'])
+@rate_limiter.limit_writes('write')
 def skills():
     if request.method == 'GET':
+        group = request.args.get('group')
+        if group is not None and group != 'category':
+            return jsonify({"message": "group must be 'category'"}), 400
         try:
-            skills = Skill.query.all()
-            return jsonify([{
-                'id': s.id,
-                'name': s.name,
-                'category': s.category,
-                'proficiency': s.proficiency,
-                'created_at': s.created_at.isoformat() if s.created_at else None
-            } for s in skills]), 200
+            if group:
+                return read_cache.respond('skills', _skill_categories)
+            if request.args.get('stream') == '1':
+                return stream_json(
+                    skill_serializer,
+                    ordered(skill_serializer.select(), SKILL_SORTS, 'category'),
+                    current_app.config['STREAM_CHUNK_ROWS']
+                )
+            return read_cache.respond('skills', _list_skills)
+        except PaginationError as e:
+            return jsonify({"message": str(e)}), 400
         except Exception as e:
-            logger.error(f"Error fetching skills: {str(e)}")
+            logger.error("Error fetching skills: %s", e)
             return jsonify({"message": "Error fetching skills"}), 500
 
     elif request.method == 'POST':
@@ -28,42 +62,155 @@ def skills():
             
             if not data or 'name' not in data or 'category' not in data:
                 return jsonify({"message": "Missing required fields"}), 400
+
+            # Numeric strings were always stored as integers by the column;
+            # the category totals need the integer before the flush
+            proficiency = data.get('proficiency', 0)
+            if proficiency is not None:
+                try:
+                    proficiency = int(proficiency)
+                except (TypeError, ValueError):
+                    return jsonify({"message": "proficiency must be an integer"}), 400
                 
             new_skill = Skill(
                 name=data['name'],
                 category=data['category'],
-                proficiency=data.get('proficiency', 0)
+                proficiency=proficiency
             )
             
             db.session.add(new_skill)
+            count_skills([(new_skill.category, new_skill.proficiency, 1)])
             db.session.commit()
+            read_cache.invalidate('skills')
+            payload = skill_serializer.instance(new_skill)
+            search_index.add('skill', [payload])
+            snapshot_publisher.publish('skills')
             
-            return jsonify({
-                'id': new_skill.id,
-                'name': new_skill.name,
-                'category': new_skill.category,
-                'proficiency': new_skill.proficiency,
-                'created_at': new_skill.created_at.isoformat()
-            }), 201
+            return json_response(payload, 201)
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating skill: {str(e)}")
+            logger.error("Error creating skill: %s", e)
             return jsonify({"message": "Error creating skill"}), 500
 
 @skills_bp.route('/api/skills/<int:id>', methods=['DELETE'])
-@jwt_required()
+@rate_limiter.limit_writes('write')
+@principal_required()
 def delete_skill(id):
     try:
         skill = Skill.query.get(id)
         if not skill:
             return jsonify({"message": "Skill not found"}), 404
             
+        count_skills([(skill.category, skill.proficiency, -1)])
         db.session.delete(skill)
         db.session.commit()
+        read_cache.invalidate('skills')
+        search_index.remove('skill', [id])
+        snapshot_publisher.publish('skills')
         return jsonify({"message": "Skill deleted successfully"}), 200
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting skill: {str(e)}")
+        logger.error("Error deleting skill: %s", e)
         return jsonify({"message": "Error deleting skill"}), 500
+
+def _clean_skill(item):
+    if not isinstance(item, dict):
+        raise BulkError("Item must be an object")
+    for field in ('name', 'category'):
+        value = item.get(field)
+        if not isinstance(value, str) or not value.strip() or len(value) > 100:
+            raise BulkError(f"{field} must be a non-empty string of at most 100 characters")
+    proficiency = item.get('proficiency', 0)
+    if not isinstance(proficiency, int) or isinstance(proficiency, bool):
+        raise BulkError("proficiency must be an integer")
+    return {'name': item['name'], 'category': item['category'], 'proficiency': proficiency}
+
+def _bulk_create_skills(items, result):
+    valid = validate('create', items, _clean_skill, result)
+    skills = [Skill(**fields) for _, fields in valid]
+    db.session.add_all(skills)
+    db.session.flush()
+    count_skills((fields['category'], fields['proficiency'], 1) for _, fields in valid)
+    for (index, _), skill in zip(valid, skills):
+        result.ok('create', index, 'created', skill.id)
+    return [dict(fields, id=skill.id) for (_, fields), skill in zip(valid, skills)]
+
+def _bulk_upsert_skills(items, result):
+    valid, seen = [], set()
+    for index, fields in validate('upsert', items, _clean_skill, result):
+        key = (fields['name'], fields['category'])
+        if key in seen:
+            result.fail('upsert', index, "Duplicate name and category in batch")
+        else:
+            seen.add(key)
+            valid.append((index, fields))
+    if not valid:
+        return []
+
+    # One SELECT resolves every key, then updates go out as a single
+    # executemany and inserts as one flush. A name and category shared by
+    # several skills is rejected rather than updating one of them at random
+    existing, ambiguous = {}, set()
+    for id, name, category, proficiency in db.session.execute(
+        select(Skill.id, Skill.name, Skill.category, Skill.proficiency)
+        .where(tuple_(Skill.name, Skill.category).in_(seen))
+    ):
+        if (name, category) in existing:
+            ambiguous.add((name, category))
+        existing[(name, category)] = (id, proficiency)
+    updates, inserts, counts = [], [], []
+    for index, fields in valid:
+        id, proficiency = existing.get((fields['name'], fields['category']), (None, None))
+        if (fields['name'], fields['category']) in ambiguous:
+            result.fail('upsert', index, "Name and category match more than one skill")
+        elif id is None:
+            inserts.append((index, Skill(**fields), fields))
+            counts.append((fields['category'], fields['proficiency'], 1))
+        else:
+            updates.append((index, id, fields))
+            counts += [(fields['category'], proficiency, -1), (fields['category'], fields['proficiency'], 1)]
+
+    if updates:
+        db.session.execute(update(Skill), [
+            {'id': id, 'proficiency': fields['proficiency']} for _, id, fields in updates
+        ])
+    db.session.add_all([skill for _, skill, _ in inserts])
+    db.session.flush()
+    count_skills(counts)
+
+    for index, id, _ in updates:
+        result.ok('upsert', index, 'updated', id)
+    for index, skill, _ in inserts:
+        result.ok('upsert', index, 'created', skill.id)
+    # Updates only change proficiency, which is not searchable
+    return [dict(fields, id=skill.id) for _, skill, fields in inserts]
+
+@skills_bp.route('/api/skills/bulk', methods=['POST'])
+@rate_limiter.limit_writes('write')
+@principal_required()
+def bulk_skills():
+    try:
+        creates, upserts, deletes = parse_batch(
+            request.get_json(silent=True), current_app.config['BULK_MAX_ITEMS']
+        )
+    except BulkError as e:
+        return jsonify({"message": str(e)}), e.status
+
+    result = BulkResult()
+    try:
+        written = _bulk_create_skills(creates, result)
+        written += _bulk_upsert_skills(upserts, result)
+        delete_by_ids(Skill, deletes, result, before_delete=uncount_skill_ids)
+        db.session.commit()
+        read_cache.invalidate('skills')
+        search_index.add('skill', written)
+        search_index.remove('skill', result.ids('delete', 'deleted'))
+        snapshot_publisher.publish('skills')
+        return jsonify(result.to_dict()), 200
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error applying skill batch: %s", e)
+        return jsonify({"message": "Error applying skill batch"}), 500
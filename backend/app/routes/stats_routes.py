@@ -0,0 +1,21 @@
+from flask import Blueprint, jsonify
+from ..models.models import db
+from ..cache.cache import read_cache
+from ..stats.stats import technology_stats_rows, technology_stats_select
+import logging
+
+logger = logging.getLogger(__name__)
+stats_bp = Blueprint('stats', __name__)
+
+def _technology_stats():
+    return technology_stats_rows(db.session.execute(technology_stats_select()))
+
+@stats_bp.route('/api/stats/tech', methods=['GET'])
+def tech_stats():
+    try:
+        # Counts are maintained by the project write handlers
+        return read_cache.respond('tech_stats', _technology_stats, depends_on=('projects',))
+
+    except Exception as e:
+        logger.error("Error fetching technology stats: %s", e)
+        return jsonify({"message": "Error fetching technology stats"}), 500
@@ -0,0 +1,377 @@
+import bisect
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from datetime import timedelta
+from operator import itemgetter
+
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..models.models import Project, Skill, db
+from ..serializers.serializers import project_serializer, skill_serializer
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r'\w+')
+
+# Re-read this much history on every sync so a write committed by another
+# worker just after our previous read is never skipped
+SYNC_OVERLAP = timedelta(seconds=30)
+
+# Shorter final words are matched whole rather than expanded as a prefix
+MIN_PREFIX = 2
+
+# Rows read per query while building
+BUILD_BATCH_SIZE = 5000
+
+# Most query words considered; the rest of a pasted paragraph is ignored
+MAX_QUERY_TERMS = 16
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+class InvertedIndex:
+    """BM25-ranked inverted index over ``(kind, id)`` documents.
+
+    Postings map each term to ``{document: term frequency}`` and a sorted
+    vocabulary answers prefix lookups with a bisect, so adding or removing a
+    document only touches its own terms. Adding a document that is already
+    indexed replaces it.
+    """
+
+    def __init__(self, k1=1.2, b=0.75, max_expansions=50):
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+        self.postings = {}
+        self.lengths = {}
+        self.terms = {}
+        self.vocabulary = []
+        self.total_length = 0
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def _add(self, document, text):
+        # Returns the terms that are new to the vocabulary
+        tokens = tokenize(text)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        self._remove(document)
+        new = []
+        for term, frequency in counts.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                new.append(term)
+            postings[document] = frequency
+        self.lengths[document] = len(tokens)
+        self.terms[document] = tuple(counts)
+        self.total_length += len(tokens)
+        return new
+
+    def _remove(self, document):
+        terms = self.terms.pop(document, None)
+        if terms is None:
+            return
+        self.total_length -= self.lengths.pop(document)
+        for term in terms:
+            postings = self.postings[term]
+            del postings[document]
+            if not postings:
+                del self.postings[term]
+                # A term added earlier in the same batch is not listed yet
+                position = bisect.bisect_left(self.vocabulary, term)
+                if position < len(self.vocabulary) and self.vocabulary[position] == term:
+                    del self.vocabulary[position]
+
+    def add_many(self, documents):
+        # ``documents`` yields (document, text) pairs
+        with self.lock:
+            new = [term for document, text in documents for term in self._add(document, text)]
+            if len(new) > 64:
+                # Cheaper to sort once than to insert thousands of terms
+                self.vocabulary = sorted(self.postings)
+            else:
+                for term in new:
+                    bisect.insort(self.vocabulary, term)
+
+    def add(self, document, text):
+        self.add_many([(document, text)])
+
+    def remove_many(self, documents):
+        with self.lock:
+            for document in documents:
+                self._remove(document)
+
+    def remove(self, document):
+        self.remove_many([document])
+
+    def expand(self, prefix):
+        # Vocabulary terms starting with ``prefix``, the word itself first
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:start + self.max_expansions]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def _words(self, tokens, prefix):
+        # Per query word: its best possible contribution and the (weight,
+        # postings) of every term it matches. BM25's tf / (tf + norm) is
+        # below 1, so a term's weight bounds what it can add to a score.
+        count, k1 = len(self.lengths), self.k1
+        last = tokens[-1]
+        words = []
+        for token in dict.fromkeys(tokens):
+            expand = prefix and token == last and len(token) >= MIN_PREFIX
+            terms = []
+            for term in self.expand(token) if expand else (token,):
+                postings = self.postings.get(term)
+                if postings:
+                    idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    terms.append((idf * (k1 + 1), postings))
+            if terms:
+                words.append((max(weight for weight, _ in terms), terms))
+        return words
+
+    def search(self, query, limit=20, kinds=None, prefix=True):
+        """Top ``limit`` ``(document, score)`` pairs for ``query``, best first.
+
+        Words are OR-ed and their BM25 scores summed. With ``prefix`` the last
+        word also matches longer terms, for typeahead; a document matching
+        several of its expansions scores for the best one only.
+        """
+        tokens = tokenize(query)[:MAX_QUERY_TERMS]
+        if not tokens:
+            return []
+        scores = {}
+        with self.lock:
+            if not self.lengths:
+                return []
+            lengths = self.lengths
+            # BM25's length normalisation, k1 * (1 - b + b * length / avgdl),
+            # split into a constant and a per-length factor
+            base = self.k1 * (1 - self.b)
+            per_length = self.k1 * self.b * len(lengths) / self.total_length if self.total_length else 0
+
+            # Rarest words first (MaxScore). Once the k-th best score beats all
+            # the remaining words could add, a document none of the earlier
+            # words matched cannot reach the top ``limit``, so common words
+            # only rescore the candidates instead of walking their postings.
+            words = sorted(self._words(tokens, prefix), key=itemgetter(0), reverse=True)
+            remaining = sum(bound for bound, _ in words)
+            candidates = None
+            for bound, terms in words:
+                remaining -= bound
+                best = {}
+                for weight, postings in terms:
+                    if candidates is None:
+                        matches = postings.items()
+                    else:
+                        matches = [(d, postings[d]) for d in candidates if d in postings]
+                    part = {
+                        document: weight * frequency / (frequency + base + per_length * lengths[document])
+                        for document, frequency in matches
+                        if kinds is None or document[0] in kinds
+                    }
+                    if not best:
+                        best = part
+                    else:
+                        for document, score in part.items():
+                            if score > best.get(document, 0.0):
+                                best[document] = score
+                if not scores:
+                    scores = best
+                else:
+                    for document, score in best.items():
+                        scores[document] = scores.get(document, 0.0) + score
+                if candidates is None and remaining and len(scores) >= limit:
+                    if heapq.nlargest(limit, scores.values())[-1] > remaining:
+                        candidates = list(scores)
+        return heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+
+
+class Source:
+    """A searchable table: its indexed text, change timestamp and serializer."""
+
+    def __init__(self, model, stamp, fields, serializer):
+        self.model = model
+        self.stamp = stamp
+        self.fields = fields
+        self.serializer = serializer
+
+    def text(self, row):
+        # ``row`` is any mapping with the indexed fields
+        parts = []
+        for field in self.fields:
+            value = row.get(field)
+            if isinstance(value, list):
+                parts.extend(item for item in value if isinstance(item, str))
+            elif value:
+                parts.append(value)
+        return ' '.join(parts)
+
+    def select(self):
+        columns = [getattr(self.model, field) for field in self.fields]
+        return select(self.model.id, self.stamp, *columns)
+
+
+SOURCES = {
+    'project': Source(Project, Project.updated_at, ('title', 'description', 'tech_stack'), project_serializer),
+    # Skill upserts only change proficiency, so the creation time covers every indexed change
+    'skill': Source(Skill, Skill.created_at, ('name', 'category'), skill_serializer),
+}
+
+
+def _latest(current, rows, key):
+    stamps = [row[key] for row in rows if row[key] is not None]
+    if current is not None:
+        stamps.append(current)
+    return max(stamps) if stamps else None
+
+
+class _SearchState:
+    def __init__(self, sync_interval):
+        self.index = None
+        self.sync_interval = sync_interval
+        self.next_sync = 0.0
+        self.synced = {}
+        self.lock = threading.Lock()
+
+
+class SearchIndex:
+    """In-process full-text index over projects and skills.
+
+    Built once from the database, then kept current by the write handlers,
+    which call ``add`` and ``remove`` after they commit. Each process has its
+    own index and pulls rows changed by other workers at most every
+    ``SEARCH_SYNC_INTERVAL`` seconds. A sync cannot see deletions, so rows
+    another worker deleted are evicted when a search finds them missing.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('SEARCH_SYNC_INTERVAL', 5)
+        app.config.setdefault('SEARCH_MAX_RESULTS', 100)
+        app.extensions['search_index'] = _SearchState(app.config['SEARCH_SYNC_INTERVAL'])
+
+    @property
+    def _state(self):
+        return current_app.extensions['search_index']
+
+    def _load(self, state, batch_size):
+        index, synced = InvertedIndex(), {}
+        for kind, source in SOURCES.items():
+            last_id = 0
+            while True:
+                # Keyset batches keep memory flat at any table size
+                rows = db.session.execute(
+                    source.select().where(source.model.id > last_id)
+                    .order_by(source.model.id).limit(batch_size)
+                ).mappings().all()
+                if not rows:
+                    break
+                index.add_many(((kind, row['id']), source.text(row)) for row in rows)
+                synced[kind] = _latest(synced.get(kind), rows, source.stamp.key)
+                last_id = rows[-1]['id']
+        state.index, state.synced = index, synced
+        state.next_sync = time.monotonic() + state.sync_interval
+        logger.info("Search index built with %d documents", len(index))
+
+    def build(self, batch_size=BUILD_BATCH_SIZE):
+        """Index every project and skill, replacing the current index."""
+        state = self._state
+        with state.lock:
+            self._load(state, batch_size)
+        return state.index
+
+    def _sync(self, state):
+        if not state.lock.acquire(blocking=False):
+            return  # another thread is already syncing
+        try:
+            for kind, source in SOURCES.items():
+                query = source.select()
+                since = state.synced.get(kind)
+                if since is not None:
+                    query = query.where(source.stamp >= since - SYNC_OVERLAP)
+                rows = db.session.execute(query).mappings().all()
+                state.index.add_many(((kind, row['id']), source.text(row)) for row in rows)
+                state.synced[kind] = _latest(since, rows, source.stamp.key)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error("Search index sync failed: %s", e)
+        finally:
+            state.next_sync = time.monotonic() + state.sync_interval
+            state.lock.release()
+
+    def index(self):
+        state = self._state
+        if state.index is None:
+            with state.lock:
+                # Concurrent first searches wait for a single build
+                if state.index is None:
+                    self._load(state, BUILD_BATCH_SIZE)
+        elif time.monotonic() >= state.next_sync:
+            self._sync(state)
+        return state.index
+
+    def add(self, kind, rows):
+        # ``rows`` are mappings with ``id`` and the source's fields. Before
+        # the first build there is nothing to update; the build reads them.
+        index = self._state.index
+        if index is not None:
+            source = SOURCES[kind]
+            index.add_many(((kind, row['id']), source.text(row)) for row in rows)
+
+    def remove(self, kind, ids):
+        index = self._state.index
+        if index is not None:
+            index.remove_many((kind, id) for id in ids)
+
+    def _items(self, hits):
+        ids = {}
+        for (kind, id), _ in hits:
+            ids.setdefault(kind, []).append(id)
+        items = {}
+        for kind, kind_ids in ids.items():
+            source = SOURCES[kind]
+            rows = db.session.execute(
+                source.serializer.select().where(source.model.id.in_(kind_ids))
+            )
+            for row in rows:
+                items[kind, row.id] = source.serializer.row(row)
+        return items
+
+    def search(self, query, limit=20, kinds=None):
+        """Ranked matches, each serialized like the resource's own listing."""
+        index = self.index()
+        while True:
+            hits = index.search(query, limit, kinds)
+            items = self._items(hits)
+            gone = [document for document, _ in hits if document not in items]
+            if not gone:
+                break
+            # Deleted by another worker: evict them and search again, so the
+            # page is still filled to ``limit``
+            index.remove_many(gone)
+        return [
+            {'type': kind, 'score': round(score, 4), 'item': items[kind, id]}
+            for (kind, id), score in hits
+        ]
+
+
+search_index = SearchIndex()
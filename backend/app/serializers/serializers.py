@@ -0,0 +1,109 @@
+import json
+from datetime import date, datetime
+from operator import attrgetter
+
+from flask import Response, stream_with_context
+from sqlalchemy import select
+
+from ..models.models import Project, Skill, db
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def dumps(payload):
+        return orjson.dumps(payload, default=_default)
+else:
+    _encoder = json.JSONEncoder(separators=(',', ':'), default=_default)
+
+    def dumps(payload):
+        return _encoder.encode(payload).encode('utf-8')
+
+
+def json_response(payload, status=200, headers=None):
+    return Response(dumps(payload), status=status, headers=headers, mimetype='application/json')
+
+
+def stream_json(serializer, query, chunk_rows=500):
+    """Stream ``query`` as a JSON array, one chunk per ``chunk_rows`` rows.
+
+    Rows come from a server-side cursor (``yield_per``), so neither the result
+    set nor the body is ever held in memory as a whole.
+    """
+    def generate():
+        result = db.session.execute(query.execution_options(yield_per=chunk_rows))
+        try:
+            yield b'['
+            separator = b''
+            for partition in result.partitions():
+                yield separator + b','.join(dumps(serializer.row(row)) for row in partition)
+                separator = b','
+            yield b']'
+        finally:
+            result.close()
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+class RowSerializer:
+    """Column-level serializer for one API resource.
+
+    Selects only the listed columns as plain rows through SQLAlchemy Core, so
+    list endpoints skip ORM instance construction and the identity map, and
+    maps each row to a dict with a fixed field tuple.
+    """
+
+    def __init__(self, *columns):
+        self.columns = columns
+        self.fields = tuple(column.key for column in columns)
+        self._getter = attrgetter(*self.fields)
+
+    def select(self):
+        return select(*self.columns)
+
+    def row(self, row):
+        return dict(zip(self.fields, row))
+
+    def rows(self, rows):
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in rows]
+
+    def instance(self, obj):
+        return dict(zip(self.fields, self._getter(obj)))
+
+
+project_serializer = RowSerializer(
+    Project.id,
+    Project.title,
+    Project.description,
+    Project.image_url,
+    Project.github_url,
+    Project.live_url,
+    Project.tech_stack,
+    Project.image_variants,
+    Project.created_at
+)
+
+skill_serializer = RowSerializer(
+    Skill.id,
+    Skill.name,
+    Skill.category,
+    Skill.proficiency,
+    Skill.created_at
+)
+
+profile_skill_serializer = RowSerializer(
+    Skill.id,
+    Skill.name,
+    Skill.category,
+    Skill.proficiency
+)
@@ -0,0 +1,280 @@
+import os
+import re
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+import click
+from flask import current_app, has_request_context, request
+from flask.cli import AppGroup
+from sqlalchemy import event, inspect
+
+from ..logs.logs import redact
+from ..models.models import db
+
+slow_query_cli = AppGroup('slow-queries', help="Find statements that need an index.")
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Listing variants checked by ``flask slow-queries report``
+REPORT_PATHS = (
+    '/api/projects',
+    '/api/projects?sort=created_at',
+    '/api/projects?tech=React&tech=Flask',
+    '/api/projects?tech=React',
+    '/api/skills',
+    '/api/skills?sort=created_at',
+    '/api/profile',
+)
+
+_ORDER_BY = re.compile(r'\bORDER BY\s+(.+?)(?:\s+LIMIT\b|\s+OFFSET\b|\)|$)', re.IGNORECASE | re.DOTALL)
+_WHERE = re.compile(r'\bWHERE\s+(.+?)(?:\s+GROUP BY\b|\s+ORDER BY\b|\s+LIMIT\b|$)', re.IGNORECASE | re.DOTALL)
+_COLUMN = re.compile(r'[`"]?(\w+)[`"]?\.[`"]?(\w+)[`"]?')
+
+
+class SlowQuery:
+    __slots__ = ('statement', 'parameters', 'duration_ms', 'endpoint', 'stack', 'at', 'plan')
+
+    def __init__(self, statement, parameters, duration_ms, endpoint, stack):
+        self.statement = statement
+        self.parameters = parameters
+        self.duration_ms = duration_ms
+        self.endpoint = endpoint
+        self.stack = stack
+        self.at = datetime.utcnow()
+        self.plan = None
+
+
+def _app_stack():
+    # Application frames only; the SQLAlchemy internals below them say nothing
+    return [
+        f'{os.path.relpath(frame.filename, APP_ROOT)}:{frame.lineno} in {frame.name}'
+        for frame in traceback.extract_stack()[:-3]
+        if frame.filename.startswith(APP_ROOT) and not frame.filename.endswith('slowlog.py')
+    ]
+
+
+def _columns(clause, table):
+    return [column for owner, column in _COLUMN.findall(clause) if owner == table]
+
+
+def index_advice(engine, statement, table):
+    """Suggest an index on ``table``: filter columns first, then the sort columns.
+
+    Primary key filters are already indexed, and nothing is suggested when an
+    existing index starts with the same columns.
+    """
+    inspector = inspect(engine)
+    primary_key = inspector.get_pk_constraint(table)['constrained_columns']
+    columns = []
+    where = _WHERE.search(statement)
+    if where:
+        columns += [c for c in _columns(where.group(1), table) if c not in primary_key]
+    order = _ORDER_BY.search(statement)
+    if order:
+        columns += _columns(order.group(1), table)
+    columns = list(dict.fromkeys(columns))
+    if not columns:
+        return None
+    for index in inspector.get_indexes(table) + [{'column_names': primary_key}]:
+        if index['column_names'][:len(columns)] == columns:
+            return None
+    return f"CREATE INDEX ix_{table}_{'_'.join(columns)} ON {table} ({', '.join(columns)})"
+
+
+def _explain_sqlite(conn, statement, parameters):
+    rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).all()
+    plan, flags = [], []
+    for row in rows:
+        detail = row[-1]
+        plan.append(detail)
+        match = re.match(r'SCAN (?:TABLE )?(\w+)', detail)
+        if match and 'USING' not in detail:
+            flags.append(('full_scan', match.group(1)))
+        if 'TEMP B-TREE' in detail:
+            flags.append(('filesort' if 'ORDER BY' in detail else 'temporary', None))
+    return plan, flags
+
+
+def _explain_mysql(conn, statement, parameters):
+    result = conn.exec_driver_sql('EXPLAIN ' + statement, parameters)
+    rows = [dict(zip(result.keys(), row)) for row in result]
+    flags = []
+    for row in rows:
+        extra = row.get('Extra') or ''
+        if row.get('type') == 'ALL':
+            flags.append(('full_scan', row.get('table')))
+        if 'Using filesort' in extra:
+            flags.append(('filesort', row.get('table')))
+        if 'Using temporary' in extra:
+            flags.append(('temporary', row.get('table')))
+    plan = [
+        f"{row.get('table')}: type={row.get('type')} key={row.get('key')} "
+        f"rows={row.get('rows')} {row.get('Extra') or ''}".strip()
+        for row in rows
+    ]
+    return plan, flags
+
+
+EXPLAINERS = {'sqlite': _explain_sqlite, 'mysql': _explain_mysql}
+
+
+def explain(engine, statement, parameters):
+    """EXPLAIN a captured SELECT and flag full scans, filesorts and temporary tables."""
+    explainer = EXPLAINERS.get(engine.dialect.name)
+    if explainer is None or not statement.lstrip().upper().startswith('SELECT'):
+        return None
+    with engine.connect() as conn:
+        # conn.info outlives this checkout, so the marker must not
+        conn.info['slowlog_skip'] = True
+        try:
+            plan, flags = explainer(conn, statement, parameters)
+        finally:
+            del conn.info['slowlog_skip']
+    tables = re.findall(r'\bFROM\s+[`"]?(\w+)', statement, re.IGNORECASE)
+    advice = []
+    for kind, table in flags:
+        table = table or (tables[0] if tables else None)
+        suggestion = index_advice(engine, statement, table) if table else None
+        if suggestion and suggestion not in advice:
+            advice.append(suggestion)
+    return {
+        'plan': plan,
+        'flags': sorted({kind for kind, _ in flags}),
+        'advice': advice
+    }
+
+
+class _SlowLogState:
+    def __init__(self, threshold_ms, size):
+        self.threshold = threshold_ms / 1000
+        self.entries = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+
+class SlowQueryLog:
+    """Ring buffer of statements slower than ``SLOW_QUERY_THRESHOLD_MS``.
+
+    Capturing only costs a timestamp per statement; the stack is taken for
+    slow ones, and EXPLAIN runs when the log is read, on a connection of its
+    own. Each process keeps its own buffer.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('SLOW_QUERY_ENABLED', True)
+        app.config.setdefault('SLOW_QUERY_THRESHOLD_MS', 100)
+        app.config.setdefault('SLOW_QUERY_LOG_SIZE', 100)
+        if not app.config['SLOW_QUERY_ENABLED']:
+            return
+        state = app.extensions['slow_query_log'] = _SlowLogState(
+            app.config['SLOW_QUERY_THRESHOLD_MS'],
+            app.config['SLOW_QUERY_LOG_SIZE']
+        )
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info['slowlog_start'] = time.perf_counter()
+
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info['slowlog_start']
+            if elapsed < state.threshold or executemany or conn.info.get('slowlog_skip'):
+                return
+            entry = SlowQuery(
+                statement, parameters, round(elapsed * 1000, 3),
+                request.endpoint if has_request_context() else None,
+                _app_stack()
+            )
+            with state.lock:
+                state.entries.append(entry)
+
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+            event.listen(db.engine, 'after_cursor_execute', after_cursor_execute)
+
+    @property
+    def _state(self):
+        return current_app.extensions['slow_query_log']
+
+    def clear(self):
+        with self._state.lock:
+            self._state.entries.clear()
+
+    def report(self, with_plans=True):
+        """Captured statements grouped by SQL text, slowest first."""
+        with self._state.lock:
+            entries = list(self._state.entries)
+        groups = {}
+        for entry in entries:
+            group = groups.get(entry.statement)
+            if group is None:
+                group = groups[entry.statement] = {
+                    'statement': entry.statement,
+                    'count': 0,
+                    'max_ms': 0.0,
+                    'total_ms': 0.0,
+                    'endpoints': [],
+                    'last': None
+                }
+            group['count'] += 1
+            group['max_ms'] = max(group['max_ms'], entry.duration_ms)
+            group['total_ms'] = round(group['total_ms'] + entry.duration_ms, 3)
+            if entry.endpoint and entry.endpoint not in group['endpoints']:
+                group['endpoints'].append(entry.endpoint)
+            group['last'] = entry
+        report = []
+        for group in sorted(groups.values(), key=lambda g: g['total_ms'], reverse=True):
+            last = group.pop('last')
+            group.update({
+                'parameters': redact(repr(last.parameters))[:500],
+                'stack': last.stack,
+                'at': last.at.isoformat()
+            })
+            if with_plans:
+                if last.plan is None:
+                    try:
+                        last.plan = explain(db.engine, last.statement, last.parameters)
+                    except Exception as e:
+                        db.session.rollback()
+                        last.plan = {'error': str(e)}
+                group['explain'] = last.plan
+            report.append(group)
+        return report
+
+
+slow_query_log = SlowQueryLog()
+
+
+@slow_query_cli.command('report')
+@click.option('--path', 'paths', multiple=True,
+              help="Endpoint to request; repeatable. Defaults to the public listings.")
+@click.option('--threshold-ms', default=0.0, show_default=True, help="Capture statements at least this slow.")
+def report_command(paths, threshold_ms):
+    """Request endpoints in-process and EXPLAIN the statements they run."""
+    state = current_app.extensions.get('slow_query_log')
+    if state is None:
+        raise click.ClickException("SLOW_QUERY_ENABLED is off")
+    state.threshold = threshold_ms / 1000
+    slow_query_log.clear()
+    client = current_app.test_client()
+    for path in paths or REPORT_PATHS:
+        client.get(path)
+
+    flagged = 0
+    for group in slow_query_log.report():
+        plan = group.get('explain') or {}
+        if not plan.get('flags') and not plan.get('error'):
+            continue
+        flagged += 1
+        click.echo(f"[{', '.join(plan.get('flags', ['error']))}] {group['max_ms']:.2f}ms "
+                   f"x{group['count']} via {', '.join(group['endpoints']) or '-'}")
+        click.echo('  ' + ' '.join(group['statement'].split()))
+        for line in plan.get('plan', [plan.get('error')]):
+            click.echo(f'    {line}')
+        for advice in plan.get('advice', []):
+            click.echo(f'  advice: {advice}')
+    click.echo(f"{flagged} statement(s) flagged")
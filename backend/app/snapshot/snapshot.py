@@ -0,0 +1,260 @@
+import fcntl
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from werkzeug.datastructures import MultiDict
+
+from ..models.models import db
+from ..pagination.pagination import keyset
+from ..serializers.serializers import dumps
+
+logger = logging.getLogger(__name__)
+
+# Hex digits of the content hash naming each published version
+VERSION_LENGTH = 16
+
+snapshot_cli = AppGroup('snapshots', help="Publish static copies of the public reads for nginx.")
+
+
+def first_page(query, sorts, default_sort):
+    """Rows of the unparameterised listing, or None when it spans several pages.
+
+    A static file cannot carry the ``Link`` header of a paginated response,
+    so such a listing is left to Flask instead of being published.
+    """
+    statement, finish = keyset(
+        query,
+        sorts,
+        default_sort,
+        MultiDict(),
+        current_app.config['PAGINATION_DEFAULT_LIMIT'],
+        current_app.config['PAGINATION_MAX_LIMIT']
+    )
+    page = finish(db.session.execute(statement).all())
+    return None if page.next_cursor else page.items
+
+
+def _write(path, data):
+    # Write beside the target and rename over it, so readers see the old
+    # bytes or the new ones, never a partial file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _link(path, target):
+    tmp = f'{path}.tmp-{os.getpid()}'
+    if os.path.lexists(tmp):
+        os.unlink(tmp)
+    os.symlink(target, tmp)
+    os.replace(tmp, path)
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class _SnapshotState:
+    def __init__(self, directory, gzip_level, debounce):
+        self.directory = directory
+        self.gzip_level = gzip_level
+        self.debounce = debounce
+        # flock only excludes other processes; greenlets of this one queue here
+        # rather than block the whole worker in the system call
+        self.lock = threading.Lock()
+        # Names waiting for the publisher thread, guarded by ``changed``
+        self.changed = threading.Condition()
+        self.pending = set()
+        self.busy = False
+        self.worker_pid = None
+
+
+class SnapshotPublisher:
+    """Static JSON copies of the public GET endpoints, served by nginx.
+
+    Each snapshot ``name`` is written to ``<SNAPSHOT_DIR>/api/<name>.<hash>.json``
+    with a ``.gz`` sibling, and ``api/<name>.json`` is then repointed at it
+    with an atomic symlink swap. Route modules ``register`` the payload
+    builders and write handlers call ``publish`` with the resources they
+    changed after a successful commit. A background thread renders them
+    ``SNAPSHOT_DEBOUNCE`` seconds later, so a burst of writes is published
+    once and no request waits on it; with ``SNAPSHOT_DEBOUNCE = 0`` they are
+    published inline. Publishing is off unless ``SNAPSHOT_DIR`` is set.
+    """
+
+    def __init__(self, app=None):
+        # name -> (render, resources it depends on)
+        self.snapshots = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('SNAPSHOT_DIR', '')
+        app.config.setdefault('SNAPSHOT_GZIP_LEVEL', 9)
+        app.config.setdefault('SNAPSHOT_DEBOUNCE', 0.5)
+        if not app.config['SNAPSHOT_DIR']:
+            return
+        app.extensions['snapshots'] = _SnapshotState(
+            app.config['SNAPSHOT_DIR'],
+            app.config['SNAPSHOT_GZIP_LEVEL'],
+            app.config['SNAPSHOT_DEBOUNCE']
+        )
+
+    def register(self, name, render, depends_on=None):
+        # ``render`` returns the payload of GET /api/<name>, or None when the
+        # response cannot be served from a static file
+        self.snapshots[name] = (render, tuple(depends_on or (name,)))
+
+    @property
+    def enabled(self):
+        return 'snapshots' in current_app.extensions
+
+    def publish(self, *resources):
+        """Queue every snapshot depending on ``resources`` for re-rendering.
+
+        Failures are logged rather than raised: the write that triggered the
+        publish has already committed, and the stale file is replaced by the
+        next publish.
+        """
+        if not self.enabled:
+            return
+        state = current_app.extensions['snapshots']
+        names = self._names(resources)
+        if not state.debounce:
+            self._publish(state, names)
+            return
+        with state.changed:
+            state.pending.update(names)
+            if state.worker_pid != os.getpid():
+                # Threads do not survive fork, so each gunicorn worker starts
+                # its own on the first publish
+                state.worker_pid = os.getpid()
+                threading.Thread(
+                    target=self._run,
+                    args=(current_app._get_current_object(), state),
+                    name='snapshot-publisher',
+                    daemon=True
+                ).start()
+            state.changed.notify_all()
+
+    def publish_all(self):
+        """Re-render every snapshot now and return the names published."""
+        if not self.enabled:
+            return []
+        return self._publish(current_app.extensions['snapshots'], self._names(()))
+
+    def flush(self, timeout=None):
+        """Wait until every queued snapshot has been published."""
+        if not self.enabled:
+            return True
+        state = current_app.extensions['snapshots']
+        with state.changed:
+            return state.changed.wait_for(lambda: not state.pending and not state.busy, timeout)
+
+    def _names(self, resources):
+        return [name for name, (_, depends_on) in self.snapshots.items()
+                if not resources or set(resources) & set(depends_on)]
+
+    def _run(self, app, state):
+        while True:
+            with state.changed:
+                state.changed.wait_for(lambda: state.pending)
+            # Let a burst of writes settle, then publish what they changed at once
+            time.sleep(state.debounce)
+            with state.changed:
+                names = [name for name in self.snapshots if name in state.pending]
+                state.pending.clear()
+                state.busy = True
+            try:
+                with app.app_context():
+                    self._publish(state, names)
+            finally:
+                with state.changed:
+                    state.busy = False
+                    state.changed.notify_all()
+
+    def _publish(self, state, names):
+        try:
+            return self._replace_all(state, names)
+        except Exception as e:
+            logger.error("Error publishing snapshots %s: %s", names, e)
+            return []
+
+    def _replace_all(self, state, names):
+        directory = os.path.join(state.directory, 'api')
+        os.makedirs(directory, exist_ok=True)
+        with state.lock, open(os.path.join(state.directory, '.lock'), 'a') as lock:
+            # One publisher at a time across workers; each renders after taking
+            # the lock, so the last to finish has read the latest commit
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                published = []
+                for name in names:
+                    # Read from a transaction begun after the lock was taken
+                    db.session.rollback()
+                    if self._replace(directory, name, self.snapshots[name][0](), state.gzip_level):
+                        published.append(name)
+                return published
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _replace(self, directory, name, payload, gzip_level):
+        current = os.path.join(directory, f'{name}.json')
+        if payload is None:
+            _unlink(current)
+            _unlink(f'{current}.gz')
+            self._prune(directory, name, None)
+            return False
+        body = dumps(payload)
+        version = hashlib.blake2b(body, digest_size=VERSION_LENGTH // 2).hexdigest()
+        versioned = f'{name}.{version}.json'
+        if not os.path.exists(os.path.join(directory, versioned)):
+            _write(os.path.join(directory, f'{versioned}.gz'),
+                   gzip.compress(body, compresslevel=gzip_level, mtime=0))
+            _write(os.path.join(directory, versioned), body)
+        # The .gz link moves first, so a request between the swaps gets the
+        # new compressed body or the old plain one, each complete
+        _link(f'{current}.gz', f'{versioned}.gz')
+        _link(current, versioned)
+        self._prune(directory, name, versioned)
+        return True
+
+    def _prune(self, directory, name, keep):
+        # Open file handles keep serving a removed version to the end
+        prefix = f'{name}.'
+        for entry in os.listdir(directory):
+            version = entry[len(prefix):].split('.')[0]
+            if (entry.startswith(prefix) and len(version) == VERSION_LENGTH
+                    and not (keep and entry.startswith(keep))):
+                _unlink(os.path.join(directory, entry))
+
+
+snapshot_publisher = SnapshotPublisher()
+
+
+@snapshot_cli.command('publish')
+def publish_command():
+    """Regenerate every snapshot, e.g. after writes that bypassed the API."""
+    if not snapshot_publisher.enabled:
+        raise click.ClickException("SNAPSHOT_DIR is not set")
+    published = snapshot_publisher.publish_all()
+    skipped = sorted(set(snapshot_publisher.snapshots) - set(published))
+    click.echo(f"Published {', '.join(sorted(published)) or 'nothing'}"
+               + (f"; left to the API: {', '.join(skipped)}" if skipped else ""))
@@ -0,0 +1,164 @@
+import logging
+import random
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, func, inspect, select
+from sqlalchemy.exc import DBAPIError, OperationalError, ProgrammingError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateColumn
+
+from ..models.models import SCHEMA_VERSION, SchemaVersion, db
+from ..indexes.tech_index import backfill as backfill_tech_index
+from ..search.search import search_index
+from ..stats.stats import rebuild as rebuild_stats
+
+logger = logging.getLogger(__name__)
+
+# Fill tables added at a schema version from existing rows, once, when a
+# database written by an older version is upgraded. project_technologies
+# predates versioning, so a database without a stored version rebuilds it too
+BACKFILLS = {1: backfill_tech_index, 3: rebuild_stats}
+
+# Public reads whose cached bodies are built before the server takes traffic
+WARM_PATHS = ('/api/portfolio', '/api/projects', '/api/skills', '/api/profile')
+
+
+def wait_for_database(uri, timeout=60, initial_delay=0.1, max_delay=2.0):
+    """Poll until the database accepts a connection, backing off exponentially.
+
+    Each attempt opens a single unpooled connection and closes it, so a slow
+    database never accumulates half-open handles. Returns False on timeout.
+    """
+    engine = create_engine(uri, poolclass=NullPool)
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempt = 0
+    try:
+        while True:
+            attempt += 1
+            try:
+                with engine.connect() as conn:
+                    conn.exec_driver_sql('SELECT 1')
+                logger.info("Database ready after %d attempt(s)", attempt)
+                return True
+            except DBAPIError as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error("Database not ready after %d attempt(s): %s", attempt, e)
+                    return False
+                logger.info("Database not ready (attempt %d): %s", attempt, e)
+                # Full jitter keeps restarting replicas from probing in lockstep
+                time.sleep(min(remaining, random.uniform(0, delay)))
+                delay = min(delay * 2, max_delay)
+    finally:
+        engine.dispose()
+
+
+def stored_schema_version():
+    try:
+        return db.session.execute(select(func.max(SchemaVersion.version))).scalar()
+    except (OperationalError, ProgrammingError):
+        # No schema_version table yet
+        db.session.rollback()
+        return None
+
+
+def add_missing_columns():
+    """ALTER existing tables to add nullable columns added to their models.
+
+    ``create_all`` skips tables that already exist, so a column added to an
+    existing model is created here. Returns the ``table.column`` names added.
+    """
+    inspector = inspect(db.engine)
+    preparer = db.engine.dialect.identifier_preparer
+    added = []
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable:
+                    raise RuntimeError(f"Cannot add NOT NULL column {table.name}.{column.name} in place")
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN "
+                    f"{CreateColumn(column).compile(dialect=db.engine.dialect)}"
+                )
+                added.append(f'{table.name}.{column.name}')
+    return added
+
+
+def ensure_schema():
+    """Create missing tables unless the stored schema version is current.
+
+    A current database costs one query instead of the per-table reflection
+    ``create_all`` does. Returns True when tables were created.
+    """
+    version = stored_schema_version()
+    if version is not None and version >= SCHEMA_VERSION:
+        return False
+    db.create_all()
+    for column in add_missing_columns():
+        logger.info("Added column %s", column)
+    # create_all skips tables that already exist, so indexes added to an
+    # existing model are created here
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    for added, backfill in sorted(BACKFILLS.items()):
+        if version is None or version < added:
+            backfill()
+    db.session.merge(SchemaVersion(version=SCHEMA_VERSION, applied_at=datetime.utcnow()))
+    db.session.commit()
+    logger.info("Schema upgraded from version %s to %s", version, SCHEMA_VERSION)
+    return True
+
+
+def warm_pool(app, connections):
+    # Open the connections up front so the first requests skip the handshake
+    with app.app_context():
+        opened = []
+        try:
+            for _ in range(connections):
+                opened.append(db.engine.connect())
+        finally:
+            for conn in opened:
+                conn.close()
+
+
+def warm_caches(app):
+    client = app.test_client()
+    for path in WARM_PATHS:
+        response = client.get(path)
+        if response.status_code != 200:
+            logger.warning("Warm-up of %s returned %s", path, response.status_code)
+    with app.app_context():
+        search_index.build()
+
+
+def track_startup(app, boot_started):
+    """Record seconds from ``boot_started`` (``time.monotonic()``) to ready and to the first request.
+
+    Call before any warm-up; requests served before ``mark_ready`` are not
+    counted. Each process reports its own first request, so every gunicorn
+    worker logs once. The timings are included in ``/api/ready``.
+    """
+    startup = app.extensions['startup'] = {
+        'boot_started': boot_started,
+        'ready_seconds': None,
+        'first_request_seconds': None
+    }
+
+    @app.after_request
+    def first_request(response):
+        if startup['first_request_seconds'] is None and startup['ready_seconds'] is not None:
+            startup['first_request_seconds'] = round(time.monotonic() - boot_started, 3)
+            logger.info("First request served %.3fs after boot", startup['first_request_seconds'])
+        return response
+
+
+def mark_ready(app):
+    startup = app.extensions['startup']
+    startup['ready_seconds'] = round(time.monotonic() - startup['boot_started'], 3)
+    logger.info("Ready to serve %.3fs after boot", startup['ready_seconds'])
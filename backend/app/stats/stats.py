@@ -0,0 +1,139 @@
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import mysql, sqlite
+
+from ..models.models import ProjectTechnology, Skill, SkillCategoryStats, TechnologyStats, db
+
+stats_cli = AppGroup('stats', help="Maintain the materialized aggregate tables.")
+
+
+def _add(model, key, rows, counters):
+    """Add each row's ``counters`` to the stored ones, inserting missing keys.
+
+    The arithmetic happens in the database, so concurrent transactions never
+    overwrite each other's deltas. Runs inside the caller's transaction.
+    """
+    if not rows:
+        return
+    table = model.__table__
+    if db.session.get_bind().dialect.name == 'mysql':
+        statement = mysql.insert(table)
+        statement = statement.on_duplicate_key_update(
+            {c: table.c[c] + statement.inserted[c] for c in counters}
+        )
+    else:
+        statement = sqlite.insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key], set_={c: table.c[c] + statement.excluded[c] for c in counters}
+        )
+    db.session.execute(statement, rows)
+    emptied = [row[key] for row in rows if row[counters[0]] < 0]
+    if emptied:
+        # A group with nothing left in it is dropped rather than reported as zero
+        db.session.execute(delete(model).where(
+            getattr(model, key).in_(emptied), getattr(model, counters[0]) <= 0
+        ))
+
+
+def count_technologies(entries):
+    # ``entries`` yields (tech_key, name, delta) per project gaining (+1) or
+    # losing (-1) a technology
+    totals = {}
+    for tech_key, name, delta in entries:
+        row = totals.setdefault(tech_key, {'tech_key': tech_key, 'name': name, 'project_count': 0})
+        row['project_count'] += delta
+    _add(TechnologyStats, 'tech_key', [r for r in totals.values() if r['project_count']], ['project_count'])
+
+
+def count_skills(entries):
+    # ``entries`` yields (category, proficiency, delta) per skill added (+1)
+    # or removed (-1); a proficiency change is a removal plus an addition
+    totals = {}
+    for category, proficiency, delta in entries:
+        row = totals.setdefault(category, {
+            'category': category, 'skill_count': 0, 'proficiency_count': 0, 'proficiency_total': 0
+        })
+        row['skill_count'] += delta
+        if proficiency is not None:
+            row['proficiency_count'] += delta
+            row['proficiency_total'] += delta * proficiency
+    _add(SkillCategoryStats, 'category', [r for r in totals.values() if any(
+        r[c] for c in ('skill_count', 'proficiency_count', 'proficiency_total')
+    )], ['skill_count', 'proficiency_count', 'proficiency_total'])
+
+
+def uncount_skill_ids(skill_ids):
+    # Call before the skills are deleted
+    count_skills(
+        (category, proficiency, -1) for category, proficiency in db.session.execute(
+            select(Skill.category, Skill.proficiency).where(Skill.id.in_(skill_ids))
+        )
+    )
+
+
+def skill_categories_select():
+    return select(
+        SkillCategoryStats.category,
+        SkillCategoryStats.skill_count,
+        SkillCategoryStats.proficiency_count,
+        SkillCategoryStats.proficiency_total
+    ).order_by(SkillCategoryStats.category)
+
+
+def skill_categories_rows(rows):
+    return [{
+        'category': category,
+        'skill_count': skill_count,
+        'average_proficiency': round(total / rated, 2) if rated else None
+    } for category, skill_count, rated, total in rows]
+
+
+def technology_stats_select():
+    return select(
+        TechnologyStats.name,
+        TechnologyStats.project_count
+    ).order_by(TechnologyStats.project_count.desc(), TechnologyStats.tech_key)
+
+
+def technology_stats_rows(rows):
+    return [{'name': name, 'project_count': count} for name, count in rows]
+
+
+def rebuild_technology_stats():
+    db.session.execute(delete(TechnologyStats))
+    db.session.execute(insert(TechnologyStats).from_select(
+        ['tech_key', 'name', 'project_count'],
+        select(ProjectTechnology.tech_key, func.min(ProjectTechnology.name), func.count())
+        .group_by(ProjectTechnology.tech_key)
+    ))
+
+
+def rebuild_skill_stats():
+    db.session.execute(delete(SkillCategoryStats))
+    db.session.execute(insert(SkillCategoryStats).from_select(
+        ['category', 'skill_count', 'proficiency_count', 'proficiency_total'],
+        select(
+            Skill.category,
+            func.count(),
+            func.count(Skill.proficiency),
+            func.coalesce(func.sum(Skill.proficiency), 0)
+        ).group_by(Skill.category)
+    ))
+
+
+def rebuild():
+    """Recompute every aggregate from the source tables in one transaction."""
+    rebuild_technology_stats()
+    rebuild_skill_stats()
+    db.session.commit()
+
+
+@stats_cli.command('rebuild')
+def rebuild_command():
+    """Recompute the aggregates after writes that bypassed the API."""
+    rebuild()
+    click.echo(
+        f"Rebuilt {db.session.query(TechnologyStats).count()} technologies and "
+        f"{db.session.query(SkillCategoryStats).count()} skill categories"
+    )
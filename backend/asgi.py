@@ -0,0 +1,10 @@
+"""Async read API entry point.
+
+Usage: uvicorn asgi:app --host 0.0.0.0 --port 5001
+
+Serves GET /api/projects, /api/skills and /api/profile on an async SQLAlchemy
+engine; route writes and auth to the Flask app (main.py / serve.py).
+"""
+from app.asgi.asgi import create_asgi_app
+
+app = create_asgi_app()
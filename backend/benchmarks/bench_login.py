@@ -0,0 +1,93 @@
+"""Measure public GET latency while logins run, with and without the hash pool.
+
+The dev server runs create_app twice against the same seeded SQLite file:
+once hashing inline (PASSWORD_HASH_WORKERS=0) and once through the process
+pool. Each run has GET clients on /api/projects and login clients in
+parallel.
+
+Usage: python benchmarks/bench_login.py [--get-clients N] [--login-clients N] [--duration S]
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from bench_serve import BACKEND, drive, report, seed, wait_for
+
+from app import create_app  # noqa: E402
+from app.models.models import User, db  # noqa: E402
+
+
+def add_user(uri):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': uri, 'PASSWORD_HASH_WORKERS': 0})
+    with app.app_context():
+        user = User(username='bench')
+        user.set_password('bench-password')
+        db.session.add(user)
+        db.session.commit()
+
+
+def logins(port, clients, duration):
+    counts = {'ok': 0, 'busy': 0, 'other': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    body = json.dumps({'username': 'bench', 'password': 'bench-password'})
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        while time.monotonic() < deadline:
+            conn.request('POST', '/api/login', body, {'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            response.read()
+            key = {200: 'ok', 503: 'busy'}.get(response.status, 'other')
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    return threads, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--get-clients', type=int, default=16)
+    parser.add_argument('--login-clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10)
+    args = parser.parse_args()
+
+    db_fd, db_path = tempfile.mkstemp()
+    uri = f'sqlite:///{db_path}'
+    seed(uri, 20)
+    add_user(uri)
+    try:
+        for name, workers in [('inline', '0'), ('pool', '2')]:
+            port = 5111
+            env = dict(os.environ, DATABASE_URL=uri, PASSWORD_HASH_WORKERS=workers)
+            command = [sys.executable, '-m', 'flask', '--app', 'main', 'run', '--port', str(port)]
+            process = subprocess.Popen(command, cwd=BACKEND, env=env,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                wait_for(port, '/api/projects')
+                threads, counts = logins(port, args.login_clients, args.duration)
+                latencies, errors = drive(port, '/api/projects', args.get_clients, args.duration)
+                for thread in threads:
+                    thread.join()
+                report(f'GET {name}', latencies, errors, args.duration)
+                print(f"{'':<10} logins {counts['ok'] / args.duration:6.1f}/s  "
+                      f"503 {counts['busy']}  other {counts['other']}")
+            finally:
+                process.terminate()
+                process.wait()
+    finally:
+        os.close(db_fd)
+        os.unlink(db_path)
+
+
+if __name__ == '__main__':
+    main()
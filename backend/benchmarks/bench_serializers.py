@@ -0,0 +1,81 @@
+"""Compare per-row cost of the ORM + jsonify list path with the Core serializers.
+
+Usage: python benchmarks/bench_serializers.py [--rows N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import jsonify  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.models.models import Project, db  # noqa: E402
+from app.serializers.serializers import dumps, orjson, project_serializer  # noqa: E402
+
+
+def seed(rows):
+    now = datetime.utcnow()
+    db.session.execute(insert(Project), [{
+        'title': f'Project {i}',
+        'description': 'A modern portfolio website built with React and Flask. ' * 4,
+        'image_url': f'/images/project{i}.jpg',
+        'github_url': f'https://github.com/example/project{i}',
+        'live_url': f'https://example.com/{i}',
+        'tech_stack': ['React', 'TypeScript', 'Flask', 'MySQL', 'Docker'],
+        'created_at': now
+    } for i in range(rows)])
+    db.session.commit()
+
+
+def orm_jsonify():
+    projects = Project.query.all()
+    response = jsonify([{
+        'id': p.id,
+        'title': p.title,
+        'description': p.description,
+        'image_url': p.image_url,
+        'github_url': p.github_url,
+        'live_url': p.live_url,
+        'tech_stack': p.tech_stack,
+        'created_at': p.created_at.isoformat() if p.created_at else None
+    } for p in projects])
+    db.session.expunge_all()
+    return response.get_data()
+
+
+def core_serializer():
+    rows = db.session.execute(project_serializer.select())
+    return dumps(project_serializer.rows(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    db_fd, db_path = tempfile.mkstemp()
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}'})
+    try:
+        with app.test_request_context():
+            db.create_all()
+            seed(args.rows)
+            print(f"rows={args.rows} repeat={args.repeat} json backend="
+                  f"{'orjson' if orjson else 'json'}")
+            for name, fn in [('orm + jsonify', orm_jsonify), ('core + serializer', core_serializer)]:
+                fn()
+                best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+                print(f"{name:<20} {best * 1000:8.2f} ms  {best / args.rows * 1e6:6.2f} us/row")
+    finally:
+        os.close(db_fd)
+        os.unlink(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Load-compare the Flask dev server with the gunicorn/gevent serve.py entry point.
+
+Both servers run the same create_app factory against a seeded SQLite file.
+Each is driven by closed-loop keep-alive clients for a fixed duration.
+
+Usage: python benchmarks/bench_serve.py [--clients N] [--duration S] [--path /api/projects]
+"""
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, BACKEND)
+
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.models.models import Project, db  # noqa: E402
+
+
+def seed(uri, rows):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': uri})
+    with app.app_context():
+        db.create_all()
+        db.session.execute(insert(Project), [{
+            'title': f'Project {i}',
+            'description': 'A modern portfolio website built with React and Flask.',
+            'tech_stack': ['React', 'Flask']
+        } for i in range(rows)])
+        db.session.commit()
+
+
+def wait_for(port, path, timeout=15):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', path)
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def drive(port, path, clients, duration):
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        local = []
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise OSError(response.status)
+                local.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0]
+
+
+def report(name, latencies, errors, duration):
+    latencies.sort()
+    q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0] * 99
+    print(f"{name:<10} {len(latencies) / duration:8.0f} req/s  "
+          f"p50 {q[49] * 1000:6.1f} ms  p99 {q[98] * 1000:6.1f} ms  errors {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=64)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--rows', type=int, default=50)
+    parser.add_argument('--path', default='/api/projects')
+    args = parser.parse_args()
+
+    db_fd, db_path = tempfile.mkstemp()
+    uri = f'sqlite:///{db_path}'
+    seed(uri, args.rows)
+    env = dict(os.environ, DATABASE_URL=uri)
+    servers = {
+        'dev': ([sys.executable, '-m', 'flask', '--app', 'main', 'run', '--port', '5101'], 5101),
+        'serve.py': ([sys.executable, 'serve.py'], 5102)
+    }
+    try:
+        for name, (command, port) in servers.items():
+            server_env = dict(env, SERVER_BIND=f'127.0.0.1:{port}')
+            process = subprocess.Popen(command, cwd=BACKEND, env=server_env,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                wait_for(port, args.path)
+                latencies, errors = drive(port, args.path, args.clients, args.duration)
+                report(name, latencies, errors, args.duration)
+            finally:
+                process.terminate()
+                process.wait()
+    finally:
+        os.close(db_fd)
+        os.unlink(db_path)
+
+
+if __name__ == '__main__':
+    main()
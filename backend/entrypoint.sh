@@ -1,3 +1,2 @@
 #!/bin/sh
-python init_db.py
-python app.py
+exec python start.py
@@ -7,8 +7,20 @@ CREATE TABLE IF NOT EXISTS projects (
     github_url VARCHAR(512),
     live_url VARCHAR(512),
     tech_stack JSON,
+    image_variants JSON,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX ix_projects_created_at_id (created_at, id),
+    INDEX ix_projects_updated_at (updated_at)
+);
+
+CREATE TABLE IF NOT EXISTS project_technologies (
+    project_id INT NOT NULL,
+    tech_key VARCHAR(100) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    PRIMARY KEY (project_id, tech_key),
+    INDEX ix_project_technologies_tech_key (tech_key, project_id),
+    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
 );
 
 CREATE TABLE IF NOT EXISTS skills (
@@ -16,7 +28,9 @@ CREATE TABLE IF NOT EXISTS skills (
     name VARCHAR(100) NOT NULL,
     category VARCHAR(100) NOT NULL,
     proficiency INT CHECK (proficiency BETWEEN 1 AND 5),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_skills_category_name (category, name),
+    INDEX ix_skills_created_at_id (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS users (
@@ -25,11 +39,50 @@ CREATE TABLE IF NOT EXISTS users (
     password_hash VARCHAR(256) NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    jti VARCHAR(36) PRIMARY KEY,
+    expires_at DATETIME NOT NULL,
+    revoked_at DATETIME NOT NULL,
+    INDEX ix_revoked_tokens_expires_at (expires_at),
+    INDEX ix_revoked_tokens_revoked_at (revoked_at)
+);
+
+-- Aggregates maintained by the write handlers (flask stats rebuild recomputes them)
+CREATE TABLE IF NOT EXISTS technology_stats (
+    tech_key VARCHAR(100) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    project_count INT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS skill_category_stats (
+    category VARCHAR(100) PRIMARY KEY,
+    skill_count INT NOT NULL DEFAULT 0,
+    proficiency_count INT NOT NULL DEFAULT 0,
+    proficiency_total INT NOT NULL DEFAULT 0
+);
+
+-- Matches SCHEMA_VERSION in app/models/models.py, so the app skips create_all
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INT PRIMARY KEY,
+    applied_at DATETIME NOT NULL
+);
+
+INSERT INTO schema_version (version, applied_at) VALUES (4, NOW());
+
 -- Insert sample data
 INSERT INTO projects (title, description, image_url, github_url, tech_stack) VALUES
 ('Personal Portfolio', 'A modern portfolio website built with React and Flask', '/images/portfolio.jpg', 'https://github.com/yourusername/portfolio', '["React", "TypeScript", "Flask", "MySQL", "Docker"]'),
 ('Project 2', 'Description for project 2', '/images/project2.jpg', 'https://github.com/yourusername/project2', '["Node.js", "Express", "MongoDB"]');
 
+-- Same keys as tech_key() in app/indexes/tech_index.py: trimmed, lowercased,
+-- cut to 100 characters, blank names skipped and one row per project and key
+INSERT INTO project_technologies (project_id, tech_key, name)
+SELECT p.id, LEFT(LOWER(TRIM(jt.name)), 100), MIN(LEFT(TRIM(jt.name), 100))
+FROM projects p,
+     JSON_TABLE(p.tech_stack, '$[*]' COLUMNS (name VARCHAR(255) PATH '$')) jt
+WHERE TRIM(jt.name) <> ''
+GROUP BY p.id, LEFT(LOWER(TRIM(jt.name)), 100);
+
 INSERT INTO skills (name, category, proficiency) VALUES
 ('React', 'Frontend', 5),
 ('TypeScript', 'Frontend', 4),
@@ -37,6 +90,12 @@ INSERT INTO skills (name, category, proficiency) VALUES
 ('Docker', 'DevOps', 4),
 ('MySQL', 'Database', 4);
 
+INSERT INTO technology_stats (tech_key, name, project_count)
+SELECT tech_key, MIN(name), COUNT(*) FROM project_technologies GROUP BY tech_key;
+
+INSERT INTO skill_category_stats (category, skill_count, proficiency_count, proficiency_total)
+SELECT category, COUNT(*), COUNT(proficiency), COALESCE(SUM(proficiency), 0) FROM skills GROUP BY category;
+
 -- Create default admin user (password: baseball)
 INSERT INTO users (username, password_hash) VALUES
 ('jhyde01', 'scrypt:32768:8:1$7ZVCM9qdUYEDpY9M$8df41c74726379009001e092b8654b4d9c4c42d5a6c82f7e9fe7654a1d9e2c5c9b8e1d3a2f7c4b5e8d1a4f7c0b3e6d9');
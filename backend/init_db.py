@@ -1,10 +1,15 @@
-from app import app, db, User
 from werkzeug.security import generate_password_hash
 
-def init_db():
+from app import create_app
+from app.models.models import User, db
+from app.startup.startup import ensure_schema
+
+def init_db(app=None):
+    app = app or create_app()
     with app.app_context():
-        # Create all tables
-        db.create_all()
+        # Create tables only when the stored schema version is behind
+        if ensure_schema():
+            print("Database schema created.")
         
         # Check if admin user exists
         admin = User.query.filter_by(username='admin').first()
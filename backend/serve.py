@@ -0,0 +1,108 @@
+"""Production entry point: the create_app factory under gunicorn.
+
+Usage: python serve.py
+
+Workers default to gevent. Each worker then serves up to
+SERVER_WORKER_CONNECTIONS concurrent requests as greenlets while PyMySQL,
+which is pure Python, waits on patched sockets.
+
+Reloading:
+  kill -HUP <master pid>    gracefully replace workers with the preloaded app
+  kill -USR2 <master pid>   re-exec a new master to pick up code changes,
+                            then kill -TERM the old master
+"""
+import os
+
+# gevent has to patch socket, ssl and threading before anything else imports
+# them, otherwise PyMySQL and the SQLAlchemy pool keep blocking primitives.
+# The worker class is therefore read straight from the environment.
+if os.getenv('SERVER_WORKER_CLASS', 'gevent') == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+import multiprocessing  # noqa: E402
+import tempfile  # noqa: E402
+
+from gunicorn.app.base import BaseApplication  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.auth.hashing import password_hasher  # noqa: E402
+from app.config.config import Config  # noqa: E402
+from app.metrics.metrics import clear_multiproc_dir  # noqa: E402
+from app.startup.startup import warm_pool  # noqa: E402
+from app.models.models import db  # noqa: E402
+
+
+def worker_count(config):
+    if config['SERVER_WORKERS']:
+        return config['SERVER_WORKERS']
+    cores = multiprocessing.cpu_count()
+    # Async workers multiplex connections, so one per core saturates the CPU;
+    # sync workers block on I/O and need the usual 2n + 1
+    if config['SERVER_WORKER_CLASS'] == 'sync':
+        return cores * 2 + 1
+    return cores
+
+
+def post_fork(server, worker):
+    # Connections opened in the master while preloading must not be shared
+    # with the forked workers
+    app = server.app.application
+    with app.app_context():
+        db.engine.dispose(close=False)
+        # Spawning the hashing processes takes seconds; pay it before the
+        # worker accepts requests so the first logins do not time out
+        try:
+            password_hasher.warm()
+        except Exception as e:
+            worker.log.warning("Password hashing pool warm-up failed: %s", e)
+    if app.config['STARTUP_WARM']:
+        try:
+            warm_pool(app, app.config['STARTUP_WARM_CONNECTIONS'])
+        except Exception as e:
+            worker.log.warning("Connection pool warm-up failed: %s", e)
+
+
+class PortfolioServer(BaseApplication):
+    def __init__(self, app):
+        self.application = app
+        super().__init__()
+
+    def load_config(self):
+        config = self.application.config
+        options = {
+            'bind': config['SERVER_BIND'],
+            'workers': worker_count(config),
+            'worker_class': config['SERVER_WORKER_CLASS'],
+            'worker_connections': config['SERVER_WORKER_CONNECTIONS'],
+            'timeout': config['SERVER_TIMEOUT'],
+            'graceful_timeout': config['SERVER_GRACEFUL_TIMEOUT'],
+            'keepalive': config['SERVER_KEEPALIVE'],
+            'max_requests': config['SERVER_MAX_REQUESTS'],
+            'max_requests_jitter': config['SERVER_MAX_REQUESTS'] // 10,
+            'preload_app': True,
+            'post_fork': post_fork,
+            'accesslog': config['SERVER_ACCESS_LOG'] or None
+        }
+        for key, value in options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
+
+
+def server_config():
+    # Workers share one metrics directory so any of them can answer a scrape
+    # for the whole server; it is created or emptied before they fork
+    metrics_dir = Config.METRICS_MULTIPROC_DIR or tempfile.mkdtemp(prefix='portfolio-metrics-')
+    os.makedirs(metrics_dir, exist_ok=True)
+    clear_multiproc_dir(metrics_dir)
+    return {'METRICS_MULTIPROC_DIR': metrics_dir}
+
+
+def main():
+    PortfolioServer(create_app(server_config())).run()
+
+
+if __name__ == '__main__':
+    main()
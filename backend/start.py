@@ -1,45 +1,48 @@
-import subprocess
-import sys
+"""Cold-start entry point: wait for the database, bring the schema up to date,
+publish the static snapshots, warm up, then serve the create_app factory in
+this process under gunicorn.
+
+Usage: python start.py
+
+The time from boot to ready and to the first request served is logged and
+reported by /api/ready.
+"""
 import time
-import pymysql
-import os
-from init_db import init_db
-
-def wait_for_db():
-    max_retries = 30  # Wait up to 30 seconds
-    retries = 0
-    
-    while retries < max_retries:
-        try:
-            print(f"Attempting to connect to database (attempt {retries + 1}/{max_retries})...")
-            pymysql.connect(
-                host=os.getenv('MYSQL_HOST', 'db'),
-                user=os.getenv('MYSQL_USER', 'root'),
-                password=os.getenv('MYSQL_PASSWORD', 'root'),
-                database=os.getenv('MYSQL_DATABASE', 'portfolio_db')
-            )
-            print("Successfully connected to database!")
-            return True
-        except pymysql.Error as e:
-            print(f"Database connection failed: {e}")
-            retries += 1
-            time.sleep(1)
-    
-    return False
+
+BOOT_STARTED = time.monotonic()
+
+import sys  # noqa: E402
+
+# serve applies gevent's monkey patching, which must precede other imports
+import serve  # noqa: E402
+from app import create_app  # noqa: E402
+from app.snapshot.snapshot import snapshot_publisher  # noqa: E402
+from app.startup.startup import mark_ready, track_startup, wait_for_database, warm_caches  # noqa: E402
+from init_db import init_db  # noqa: E402
+
 
 def main():
-    # Wait for database to be ready
-    if not wait_for_db():
-        print("Could not connect to database after maximum retries. Exiting.")
+    app = create_app(serve.server_config())
+    track_startup(app, BOOT_STARTED)
+
+    if not wait_for_database(app.config['SQLALCHEMY_DATABASE_URI'], app.config['STARTUP_DB_TIMEOUT']):
+        print("Could not connect to database before STARTUP_DB_TIMEOUT. Exiting.")
         sys.exit(1)
-    
-    # Initialize the database
-    print("Initializing database...")
-    init_db()
-    
-    # Start the Flask application
-    print("Starting Flask application...")
-    subprocess.run([sys.executable, "app.py"], check=True)
+
+    init_db(app)
+
+    # Files left by the previous deploy may predate a serializer change
+    with app.app_context():
+        snapshot_publisher.publish_all()
+
+    # Cached response bodies and the search index built here are inherited
+    # by every forked worker
+    if app.config['STARTUP_WARM']:
+        warm_caches(app)
+    mark_ready(app)
+
+    serve.PortfolioServer(app).run()
+
 
 if __name__ == "__main__":
     main()
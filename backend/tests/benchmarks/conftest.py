@@ -0,0 +1,176 @@
+"""Fixtures for the endpoint benchmark suite (run with ``pytest --bench``)."""
+import gc
+import json
+import os
+import statistics
+import time
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+
+from app import create_app
+from app.models.models import db as _db
+from tests.benchmarks.datagen import SCALES, USERNAME, seed
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+CALIBRATION_PAYLOAD = [{'id': i, 'title': f'Project {i}', 'tech_stack': ['React', 'Flask']} for i in range(200)]
+
+
+# Most calibration units run before one round (a few seconds)
+MAX_CALIBRATION_UNITS = 8192
+
+# Calls without a setup are repeated until a round takes at least this long,
+# since a single sub-millisecond call is mostly timer and cache noise
+MIN_ROUND_MS = 5
+
+
+def calibrate(units=1):
+    """Time in ms per unit of a fixed CPU-bound workload on this machine.
+
+    Results are compared relative to it, so a baseline recorded on one
+    machine still catches regressions on a faster or slower one.
+    """
+    return _timed(lambda: json.loads(json.dumps(CALIBRATION_PAYLOAD)), units) / units
+
+
+def _timed(fn, number, *args):
+    # The collector runs untimed between rounds, as in timeit; otherwise a
+    # round pays for whatever garbage the previous ones left
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        gc.enable()
+
+
+def _measure(fn, rounds, warmup, setup):
+    # ``setup`` runs untimed before each call and its result is passed to ``fn``.
+    # Every round is paired with a calibration run of about the same length
+    # just before it. The load on a shared machine changes from one second to
+    # the next, and a calibration taken separately, or much shorter than the
+    # round, is preempted far less often than the round it is meant to scale.
+    timings, calibration, ratios = [], [], []
+    units, number = 1, 1
+    for i in range(warmup + rounds):
+        args = () if setup is None else (setup(),)
+        unit_ms = calibrate(units)
+        elapsed = _timed(fn, number, *args)
+        units = max(1, min(MAX_CALIBRATION_UNITS, round(elapsed / unit_ms)))
+        if i < warmup:
+            if setup is None:
+                number = max(1, round(number * MIN_ROUND_MS / elapsed))
+            continue
+        timings.append(elapsed / number)
+        calibration.append(unit_ms)
+        ratios.append(elapsed / number / unit_ms)
+    timings.sort()
+    calibration.sort()
+    ratios.sort()
+    return {
+        'p25_ms': round(timings[len(timings) // 4], 4),
+        'median_ms': round(statistics.median(timings), 4),
+        'p95_ms': round(timings[int(len(timings) * 0.95) - 1], 4),
+        'calibration_ms': round(calibration[len(calibration) // 4], 4),
+        # Each call in calibration units of its own pairing, so a slow
+        # moment scales the call and its unit together
+        'p25_units': round(ratios[len(ratios) // 4], 4),
+        'rounds': rounds
+    }
+
+
+class Bench:
+    """Times a callable and checks it against the stored baseline.
+
+    Each call is expressed in units of the calibration run paired with it,
+    and the lower quartile of those is compared, which tracks the cost of
+    the code far more steadily than wall time on a shared machine. Results
+    are filed under ``scale``, by default the ``--bench-scale`` of the run.
+    """
+
+    def __init__(self, scale, baseline, tolerance, save):
+        self.scale = scale
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.save = save
+        # scale -> name -> result
+        self.results = {}
+
+    def __call__(self, name, fn, rounds=50, warmup=3, setup=None, scale=None):
+        scale = scale or self.scale
+        result = _measure(fn, rounds, warmup, setup)
+        expected = self.baseline.get(scale, {}).get(name)
+        if expected and not self.save:
+            limit = expected['p25_units'] * (1 + self.tolerance)
+            assert result['p25_units'] <= limit, (
+                f"REGRESSION {name} @ {scale}: {result['p25_units']:.2f} calibration units "
+                f"({result['p25_ms']:.3f}ms) exceeds baseline {expected['p25_units']:.2f} "
+                f"by more than {self.tolerance:.0%}"
+            )
+        self.results.setdefault(scale, {})[name] = result
+        return result
+
+
+@pytest.fixture(scope='session')
+def bench_scale(request):
+    return request.config.getoption('--bench-scale')
+
+
+@pytest.fixture(scope='session')
+def bench_app(request, bench_scale, tmp_path_factory):
+    """Application over a database seeded once per session at ``--bench-scale``."""
+    db_path = request.config.getoption('--bench-db')
+    seeded = bool(db_path) and os.path.exists(db_path)
+    if not db_path:
+        db_path = str(tmp_path_factory.mktemp('bench') / f'{bench_scale}.sqlite3')
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+        'SECRET_KEY': 'bench-key',
+        'JWT_SECRET_KEY': 'jwt-bench-key',
+        'RATELIMIT_ENABLED': False,
+        'LOG_LEVEL': 'WARNING'
+    })
+    with app.app_context():
+        # Take fsync out of the write timings; it measures the disk, not the code
+        event.listen(_db.engine, 'connect', lambda conn, record: conn.execute('PRAGMA synchronous=OFF'))
+        _db.engine.dispose()
+        if not seeded:
+            _db.create_all()
+            seed(SCALES[bench_scale])
+        yield app
+        _db.session.remove()
+
+
+@pytest.fixture(scope='session')
+def bench_client(bench_app):
+    return bench_app.test_client()
+
+
+@pytest.fixture(scope='session')
+def bench_headers(bench_app):
+    return {'Authorization': f'Bearer {create_access_token(identity=USERNAME)}'}
+
+
+@pytest.fixture(scope='session')
+def bench(request, bench_scale):
+    """Measure named operations; ``--bench-save`` records them as the new baseline."""
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    save = request.config.getoption('--bench-save')
+    runner = Bench(bench_scale, baseline, request.config.getoption('--bench-tolerance'), save)
+    yield runner
+
+    if save and runner.results:
+        for scale, results in runner.results.items():
+            baseline[scale] = dict(sorted({**baseline.get(scale, {}), **results}.items()))
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
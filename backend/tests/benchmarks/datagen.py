@@ -0,0 +1,97 @@
+"""Seed a database with synthetic projects and skills for the benchmark suite.
+
+Usage: python -m tests.benchmarks.datagen --scale 100k --output /tmp/bench-100k.sqlite3
+
+A database seeded this way can be reused across benchmark runs with
+``pytest --bench --bench-scale 100k --bench-db /tmp/bench-100k.sqlite3``.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app.indexes.tech_index import index_projects
+from app.models.models import Project, Skill, User, db
+from app.stats.stats import count_skills
+
+SCALES = {'1k': 1000, '100k': 100000, '1M': 1000000}
+
+USERNAME = 'admin'
+PASSWORD = 'benchmark-password'
+
+TECHNOLOGIES = [
+    'React', 'TypeScript', 'JavaScript', 'Flask', 'Python', 'MySQL', 'Docker',
+    'Nginx', 'Redis', 'PostgreSQL', 'Go', 'Rust', 'Kubernetes', 'GraphQL',
+    'Tailwind', 'Node.js', 'AWS', 'Terraform', 'SQLite', 'Celery'
+]
+CATEGORIES = ['Frontend', 'Backend', 'DevOps', 'Database', 'Tools', 'Languages', 'Cloud', 'Testing']
+EPOCH = datetime(2020, 1, 1)
+
+
+def _projects(rng, start, count):
+    for i in range(start, start + count):
+        yield {
+            'id': i + 1,
+            'title': f'Project {i}',
+            'description': 'A modern portfolio website built with React and Flask. ' * rng.randint(1, 6),
+            'image_url': f'/images/project{i}.jpg',
+            'github_url': f'https://github.com/example/project{i}',
+            'live_url': f'https://example.com/{i}',
+            'tech_stack': rng.sample(TECHNOLOGIES, rng.randint(2, 6)),
+            'created_at': EPOCH + timedelta(seconds=i * 60 + rng.randint(0, 59))
+        }
+
+
+def _skills(rng, start, count):
+    for i in range(start, start + count):
+        yield {
+            'id': i + 1,
+            'name': f'Skill {i}',
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            'proficiency': rng.randint(1, 5),
+            'created_at': EPOCH + timedelta(seconds=i * 60)
+        }
+
+
+def seed(rows, batch_size=10000, random_seed=0):
+    """Insert ``rows`` projects and skills plus the benchmark user.
+
+    The data is deterministic for a given ``random_seed`` so runs against
+    the same scale are comparable. Must be called in an app context on an
+    empty schema.
+    """
+    rng = random.Random(random_seed)
+    user = User(username=USERNAME)
+    user.set_password(PASSWORD)
+    db.session.add(user)
+    for start in range(0, rows, batch_size):
+        count = min(batch_size, rows - start)
+        projects = list(_projects(rng, start, count))
+        db.session.execute(insert(Project), projects)
+        index_projects((p['id'], p['tech_stack']) for p in projects)
+        skills = list(_skills(rng, start, count))
+        db.session.execute(insert(Skill), skills)
+        count_skills((s['category'], s['proficiency'], 1) for s in skills)
+        db.session.commit()
+
+
+def main():
+    from app import create_app
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=SCALES, default='1k')
+    parser.add_argument('--output', required=True, help='SQLite database file to create')
+    args = parser.parse_args()
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{args.output}'})
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        seed(SCALES[args.scale])
+        print(f'Seeded {SCALES[args.scale]} projects and skills in {time.perf_counter() - started:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
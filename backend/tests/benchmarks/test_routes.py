@@ -0,0 +1,111 @@
+"""Benchmark every API route against the seeded database."""
+import pytest
+
+from app.cache.cache import read_cache
+from app.models.models import Project, Skill, db
+from tests.benchmarks.datagen import PASSWORD, USERNAME
+
+pytestmark = pytest.mark.benchmark
+
+NEW_PROJECT = {
+    'title': 'Benchmark project',
+    'description': 'Created by the benchmark suite',
+    'tech_stack': ['React', 'Flask']
+}
+
+
+def _ok(response, status=200):
+    assert response.status_code == status, response.get_data(as_text=True)
+
+
+def _uncached(*resources):
+    return lambda: read_cache.invalidate(*resources)
+
+
+def test_list_projects(bench, bench_client):
+    """Benchmark the first page of projects, rebuilt on every call."""
+    bench('projects.list', lambda _: _ok(bench_client.get('/api/projects')), setup=_uncached('projects'))
+
+
+def test_list_projects_cached(bench, bench_client):
+    """Benchmark the first page of projects served from the read cache."""
+    bench('projects.list_cached', lambda: _ok(bench_client.get('/api/projects')))
+
+
+def test_list_projects_by_tech(bench, bench_client):
+    """Benchmark a technology-filtered page of projects."""
+    path = '/api/projects?tech=React&tech=Flask'
+    # Timing an empty page would measure nothing but the index probe
+    assert bench_client.get(path).get_json()
+    bench('projects.list_by_tech', lambda _: _ok(bench_client.get(path)), setup=_uncached('projects'))
+
+
+def test_list_skills(bench, bench_client):
+    """Benchmark the first page of skills, rebuilt on every call."""
+    bench('skills.list', lambda _: _ok(bench_client.get('/api/skills')), setup=_uncached('skills'))
+
+
+def test_profile(bench, bench_client, bench_scale):
+    """Benchmark the profile, which embeds every skill."""
+    if bench_scale == '1M':
+        pytest.skip('the profile is not paginated')
+    bench('profile.get', lambda _: _ok(bench_client.get('/api/profile')), setup=_uncached('skills'))
+
+
+def test_portfolio(bench, bench_client):
+    """Benchmark the landing page bundle, rebuilt on every call."""
+    bench('portfolio.get', lambda _: _ok(bench_client.get('/api/portfolio')),
+          setup=_uncached('projects', 'skills'))
+
+
+def test_create_project(bench, bench_client, bench_headers):
+    """Benchmark creating a project."""
+    bench('projects.create',
+          lambda: _ok(bench_client.post('/api/projects', json=NEW_PROJECT, headers=bench_headers), 201))
+
+
+def test_create_skill(bench, bench_client, bench_headers):
+    """Benchmark creating a skill."""
+    bench('skills.create', lambda: _ok(bench_client.post(
+        '/api/skills', json={'name': 'Benchmark', 'category': 'Tools', 'proficiency': 4},
+        headers=bench_headers), 201))
+
+
+def _new(model, **fields):
+    def setup():
+        row = model(**fields)
+        db.session.add(row)
+        db.session.commit()
+        return row.id
+    return setup
+
+
+def test_delete_project(bench, bench_client, bench_headers):
+    """Benchmark deleting a project."""
+    bench('projects.delete',
+          lambda id: _ok(bench_client.delete(f'/api/projects/{id}', headers=bench_headers)),
+          setup=_new(Project, title='Doomed', tech_stack=['Go']))
+
+
+def test_delete_skill(bench, bench_client, bench_headers):
+    """Benchmark deleting a skill."""
+    bench('skills.delete',
+          lambda id: _ok(bench_client.delete(f'/api/skills/{id}', headers=bench_headers)),
+          setup=_new(Skill, name='Doomed', category='Tools'))
+
+
+def test_login(bench, bench_client):
+    """Benchmark a successful login, dominated by password hashing."""
+    bench('auth.login', lambda: _ok(bench_client.post(
+        '/api/login', json={'username': USERNAME, 'password': PASSWORD})), rounds=20, warmup=2)
+
+
+def test_check_auth(bench, bench_client, bench_headers):
+    """Benchmark verifying a token against the principal cache."""
+    bench('auth.check', lambda: _ok(bench_client.get('/api/check-auth', headers=bench_headers)))
+
+
+def test_search(bench, bench_client):
+    """Benchmark a ranked search over projects and skills."""
+    bench_client.get('/api/search?q=project')  # builds the index
+    bench('search.query', lambda: _ok(bench_client.get('/api/search?q=project+42')))
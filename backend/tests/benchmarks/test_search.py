@@ -0,0 +1,72 @@
+"""Benchmark the in-memory search index at 100k documents, independent of --bench-scale.
+
+Results are filed under the 100k scale of the baseline whatever scale the run seeds.
+"""
+import itertools
+import random
+
+import pytest
+
+from app.search.search import SOURCES, InvertedIndex
+from tests.benchmarks.datagen import SCALES, _projects, _skills
+
+pytestmark = pytest.mark.benchmark
+
+SCALE = '100k'
+DOCUMENTS = SCALES[SCALE]
+
+
+def _documents():
+    # Half projects, half skills, with the text the app would index
+    rng = random.Random(0)
+    projects = _projects(rng, 0, DOCUMENTS // 2)
+    skills = _skills(rng, 0, DOCUMENTS // 2)
+    return [(('project', p['id']), SOURCES['project'].text(p)) for p in projects] + \
+        [(('skill', s['id']), SOURCES['skill'].text(s)) for s in skills]
+
+
+@pytest.fixture(scope='module')
+def documents():
+    return _documents()
+
+
+@pytest.fixture(scope='module')
+def search_index(documents):
+    index = InvertedIndex()
+    index.add_many(documents)
+    return index
+
+
+def test_build(bench, documents):
+    """Benchmark building the index from 100k documents."""
+    bench('search.index.build', lambda: InvertedIndex().add_many(documents), rounds=3, warmup=1, scale=SCALE)
+
+
+def test_query_selective(bench, search_index):
+    """Benchmark a query with one rare word and one in half the documents."""
+    bench('search.index.selective', lambda: search_index.search('project 4242'), scale=SCALE)
+
+
+def test_query_common(bench, search_index):
+    """Benchmark the worst case: two words that each match half the documents."""
+    bench('search.index.common', lambda: search_index.search('react flask'), rounds=10, scale=SCALE)
+
+
+def test_query_prefix(bench, search_index):
+    """Benchmark typeahead on a partial word that expands to a term in half the documents."""
+    # A rarer expansion scores a few thousand postings, which fit in the CPU
+    # cache or not depending on where a process's pages land, and its time
+    # moves by a quarter from one run to the next
+    bench('search.index.prefix', lambda: search_index.search('fla'), scale=SCALE)
+
+
+def test_add_remove(bench, search_index):
+    """Benchmark the incremental update a write handler makes."""
+    ids = itertools.count(DOCUMENTS + 1)
+
+    def update():
+        document = ('project', next(ids))
+        search_index.add(document, 'Realtime dashboard built with Svelte and Go')
+        search_index.remove(document)
+
+    bench('search.index.add_remove', update, scale=SCALE)
@@ -3,8 +3,34 @@ import os
 import tempfile
 
 import pytest
+from flask_jwt_extended import create_access_token
+
 from app import create_app
-from app.models.models import db as _db
+from app.models.models import User, db as _db
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmarks')
+    group.addoption('--bench', action='store_true', help='run the benchmark suite in tests/benchmarks')
+    group.addoption('--bench-scale', choices=['1k', '100k', '1M'], default='1k',
+                    help='number of seeded projects and skills')
+    group.addoption('--bench-db', default=None, help='SQLite file seeded by tests.benchmarks.datagen')
+    group.addoption('--bench-save', action='store_true', help='record results as the new baseline')
+    group.addoption('--bench-tolerance', type=float, default=0.2,
+                    help='allowed slowdown against the baseline lower quartile')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: endpoint benchmark, only run with --bench')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--bench'):
+        return
+    skip = pytest.mark.skip(reason='benchmarks only run with --bench')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
 
 
 @pytest.fixture
@@ -41,3 +67,14 @@ def db(app):
         yield _db
         _db.session.remove()
         _db.drop_all()
+
+
+@pytest.fixture
+def auth_headers(app, db):
+    """Create a user and an Authorization header carrying its access token."""
+    user = User(username='admin')
+    user.password_hash = 'unused'
+    db.session.add(user)
+    db.session.commit()
+    token = create_access_token(identity='admin')
+    return {'Authorization': f'Bearer {token}'}
@@ -0,0 +1,88 @@
+"""Test the async (ASGI) read API against aiosqlite."""
+import asyncio
+import json
+
+import pytest
+
+from app.config.config import Config
+from app.models.models import Skill
+
+pytest.importorskip('aiosqlite')
+
+from app.asgi.asgi import AsyncReadAPI, async_database_uri  # noqa: E402
+
+
+def _call(api, path, query_string=b'', method='GET', headers=()):
+    scope = {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': query_string,
+        'headers': list(headers)
+    }
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        await api(scope, receive, send)
+        await api.engine.dispose()
+
+    asyncio.run(run())
+    start, body = messages
+    return start['status'], dict(start['headers']), body['body']
+
+
+@pytest.fixture
+def api(app):
+    class AsyncConfig(Config):
+        SQLALCHEMY_DATABASE_URI = app.config['SQLALCHEMY_DATABASE_URI']
+        PAGINATION_DEFAULT_LIMIT = 2
+
+    return AsyncReadAPI(AsyncConfig)
+
+
+def test_async_driver_mapping():
+    """Test that sync URIs are mapped onto asyncio drivers."""
+    assert async_database_uri('sqlite:////tmp/x.db') == 'sqlite+aiosqlite:////tmp/x.db'
+    assert async_database_uri('mysql+pymysql://u:p@db/portfolio').startswith('mysql+aiomysql://')
+
+
+def test_async_reads_match_flask(api, client, db):
+    """Test that the async endpoints return the same bodies as the blueprints."""
+    for i in range(3):
+        client.post('/api/projects', json={'title': f'p{i}', 'tech_stack': ['Flask']})
+    db.session.add(Skill(name='Python', category='Backend', proficiency=5))
+    db.session.commit()
+
+    status, headers, body = _call(api, '/api/projects', b'tech=flask')
+    assert status == 200
+    assert b'x-next-cursor' in headers
+    flask_response = client.get('/api/projects?tech=flask&limit=2')
+    assert json.loads(body) == json.loads(flask_response.data)
+
+    status, headers, body = _call(api, '/api/profile')
+    assert json.loads(body) == json.loads(client.get('/api/profile').data)
+
+    client.application.config['PAGINATION_DEFAULT_LIMIT'] = 2
+    status, _, body = _call(api, '/api/portfolio')
+    assert json.loads(body) == client.get('/api/portfolio').get_json()
+
+    status, _, body = _call(api, '/api/stats/tech')
+    assert json.loads(body) == client.get('/api/stats/tech').get_json() == [{'name': 'Flask', 'project_count': 3}]
+
+    status, _, _ = _call(api, '/api/skills', headers=[(b'if-none-match', headers[b'etag'])])
+    assert status == 200
+    status, _, _ = _call(api, '/api/profile', headers=[(b'if-none-match', headers[b'etag'])])
+    assert status == 304
+
+
+def test_async_errors(api, db):
+    """Test not found, method and argument errors."""
+    assert _call(api, '/api/nope')[0] == 404
+    assert _call(api, '/api/skills', method='POST')[0] == 405
+    assert _call(api, '/api/skills', b'sort=proficiency')[0] == 400
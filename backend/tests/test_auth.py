@@ -1,7 +1,10 @@
 """Test authentication functionality."""
 import json
+import time
+
 import pytest
-from app.models.models import User
+from app.auth.revocation import RevocationStore, token_blocklist
+from app.models.models import RevokedToken, User
 
 
 def test_login(client, db):
@@ -67,3 +70,73 @@ def test_check_auth(client, db):
     # Test without token
     response = client.get('/api/check-auth')
     assert response.status_code == 401
+
+
+def test_logout_revokes_token(app, client, db):
+    """Test that a logged-out token is rejected afterwards."""
+    user = User(username='testuser')
+    user.set_password('testpass')
+    db.session.add(user)
+    db.session.commit()
+
+    response = client.post('/api/login', json={
+        'username': 'testuser',
+        'password': 'testpass'
+    })
+    headers = {'Authorization': f"Bearer {json.loads(response.data)['token']}"}
+    assert client.get('/api/check-auth', headers=headers).status_code == 200
+
+    response = client.post('/api/logout', headers=headers)
+    assert response.status_code == 200
+
+    response = client.get('/api/check-auth', headers=headers)
+    assert response.status_code == 401
+    assert json.loads(response.data)['message'] == 'Token has been revoked'
+    assert RevokedToken.query.count() == 1
+
+    # A fresh worker starts with an empty store and loads it from the table
+    token_blocklist.init_app(app)
+    assert client.get('/api/check-auth', headers=headers).status_code == 401
+
+
+def test_revocation_store_evicts_expired():
+    """Test that revoked entries disappear once their token expires."""
+    store = RevocationStore()
+    now = time.time()
+    store.add('old', now - 1)
+    store.add('live', now + 60)
+    assert 'old' not in store
+    assert 'live' in store
+    assert len(store) == 1
+
+    store.evict(now + 61)
+    assert len(store) == 0
+
+
+def test_login_rejected_when_hash_pool_saturated(app, client, db):
+    """Test that login answers 503 instead of queueing behind a full pool."""
+    user = User(username='testuser')
+    user.set_password('testpass')
+    db.session.add(user)
+    db.session.commit()
+
+    slots = app.extensions['password_hasher'].slots
+    taken = 0
+    while slots.acquire(blocking=False):
+        taken += 1
+    try:
+        response = client.post('/api/login', json={
+            'username': 'testuser',
+            'password': 'testpass'
+        })
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+    finally:
+        for _ in range(taken):
+            slots.release()
+
+    response = client.post('/api/login', json={
+        'username': 'testuser',
+        'password': 'testpass'
+    })
+    assert response.status_code == 200
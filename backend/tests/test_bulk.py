@@ -0,0 +1,86 @@
+"""Test the bulk create/upsert/delete endpoints."""
+import json
+
+from app.models.models import Project, ProjectTechnology, Skill
+
+
+def test_bulk_skills(client, db, auth_headers):
+    """Test a mixed skill batch with partial failures."""
+    db.session.add(Skill(name='Python', category='Backend', proficiency=3))
+    db.session.commit()
+
+    response = client.post('/api/skills/bulk', headers=auth_headers, json={
+        'create': [{'name': 'React', 'category': 'Frontend', 'proficiency': 5},
+                   {'name': 'Vue'}],
+        'upsert': [{'name': 'Python', 'category': 'Backend', 'proficiency': 5},
+                   {'name': 'Go', 'category': 'Backend', 'proficiency': 2}],
+        'delete': [999]
+    })
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['errors'] == 2
+    assert [r['status'] for r in data['results']['create']] == ['created', 'error']
+    assert [r['status'] for r in data['results']['upsert']] == ['updated', 'created']
+    assert data['results']['delete'][0]['status'] == 'not_found'
+
+    skills = {s.name: s.proficiency for s in Skill.query}
+    assert skills == {'Python': 5, 'React': 5, 'Go': 2}
+
+    response = client.post('/api/skills/bulk', headers=auth_headers, json={
+        'delete': [s.id for s in Skill.query]
+    })
+    assert json.loads(response.data)['errors'] == 0
+    assert Skill.query.count() == 0
+
+
+def test_bulk_projects_keep_tech_index(client, db, auth_headers):
+    """Test that project batches keep the technology index in sync."""
+    response = client.post('/api/projects/bulk', headers=auth_headers, json={
+        'create': [{'title': 'site', 'tech_stack': ['React']},
+                   {'title': 'api', 'tech_stack': ['Flask']}]
+    })
+    ids = [r['id'] for r in json.loads(response.data)['results']['create']]
+
+    response = client.post('/api/projects/bulk', headers=auth_headers, json={
+        'upsert': [{'title': 'site', 'tech_stack': ['Vue']}],
+        'delete': [ids[1]]
+    })
+    assert json.loads(response.data)['errors'] == 0
+    assert [p.title for p in Project.query] == ['site']
+    assert [(t.project_id, t.tech_key) for t in ProjectTechnology.query] == [(ids[0], 'vue')]
+
+
+def test_bulk_upsert_rejects_ambiguous_keys(client, db, auth_headers):
+    """Test that an upsert key matching several rows is rejected, not applied to one."""
+    db.session.add_all([Project(title='site'), Project(title='site'),
+                        Skill(name='Go', category='Backend', proficiency=2),
+                        Skill(name='Go', category='Backend', proficiency=3)])
+    db.session.commit()
+
+    response = client.post('/api/projects/bulk', headers=auth_headers, json={
+        'upsert': [{'title': 'site', 'description': 'changed'}]
+    })
+    data = json.loads(response.data)
+    assert data['errors'] == 1
+    assert data['results']['upsert'][0]['message'] == "Title matches more than one project"
+    assert [p.description for p in Project.query] == [None, None]
+
+    response = client.post('/api/skills/bulk', headers=auth_headers, json={
+        'upsert': [{'name': 'Go', 'category': 'Backend', 'proficiency': 5},
+                   {'name': 'Rust', 'category': 'Backend', 'proficiency': 1}]
+    })
+    data = json.loads(response.data)
+    assert [r['status'] for r in data['results']['upsert']] == ['error', 'created']
+    assert sorted(s.proficiency for s in Skill.query.filter_by(name='Go')) == [2, 3]
+
+
+def test_bulk_rejects_bad_requests(app, client, db, auth_headers):
+    """Test authentication, shape and size checks."""
+    assert client.post('/api/skills/bulk', json={'create': []}).status_code == 401
+    response = client.post('/api/skills/bulk', headers=auth_headers, json=[])
+    assert response.status_code == 400
+
+    app.config['BULK_MAX_ITEMS'] = 2
+    response = client.post('/api/projects/bulk', headers=auth_headers,
+                           json={'delete': [1, 2, 3]})
+    assert response.status_code == 413
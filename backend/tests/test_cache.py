@@ -0,0 +1,55 @@
+"""Test the versioned read cache on the public GET endpoints."""
+import json
+
+from sqlalchemy import event
+
+
+def _count_queries(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def test_etag_and_not_modified(client, db):
+    """Test that a matching If-None-Match is answered without a query."""
+    response = client.get('/api/projects')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert json.loads(response.data) == []
+
+    statements = _count_queries(db)
+    response = client.get('/api/projects', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert statements == []
+
+    response = client.get('/api/projects')
+    assert response.status_code == 200
+    assert statements == []
+
+
+def test_write_invalidates_cached_body(client, db):
+    """Test that creating and deleting skills bumps the cached version."""
+    response = client.get('/api/skills')
+    etag = response.headers['ETag']
+    profile_etag = client.get('/api/profile').headers['ETag']
+
+    response = client.post('/api/skills', json={
+        'name': 'Flask',
+        'category': 'Backend',
+        'proficiency': 4
+    })
+    assert response.status_code == 201
+
+    response = client.get('/api/skills', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert [s['name'] for s in json.loads(response.data)] == ['Flask']
+
+    response = client.get('/api/profile', headers={'If-None-Match': profile_etag})
+    assert response.status_code == 200
+    assert [s['name'] for s in json.loads(response.data)['skills']] == ['Flask']
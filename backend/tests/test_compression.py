@@ -0,0 +1,63 @@
+"""Test Accept-Encoding negotiation and the precompressed read cache bodies."""
+import gzip
+import json
+
+from app.compression.compression import Compression
+
+
+def _create_projects(client, count):
+    for i in range(count):
+        client.post('/api/projects', json={
+            'title': f'Project {i}',
+            'description': 'A project description long enough to need compressing. ' * 4
+        })
+
+
+def test_cached_body_compressed_once(app, client, db, monkeypatch):
+    """Test gzip negotiation, weak ETags and reuse of the compressed variant."""
+    _create_projects(client, 10)
+    plain = client.get('/api/projects')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.headers['Vary'] == 'Accept-Encoding'
+
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert json.loads(gzip.decompress(response.data)) == json.loads(plain.data)
+    etag = response.headers['ETag']
+    assert etag == 'W/' + plain.headers['ETag']
+
+    compressed = []
+    monkeypatch.setattr(Compression, 'compress', lambda self, body, encoding: compressed.append(encoding))
+    again = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+    assert again.data == response.data
+    assert compressed == []
+
+    # Either validator revalidates whichever encoding the client now accepts
+    assert client.get('/api/projects', headers={'If-None-Match': etag}).status_code == 304
+    response = client.get('/api/projects', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': plain.headers['ETag']
+    })
+    assert response.status_code == 304
+
+
+def test_identity_when_small_or_refused(client, db):
+    """Test that small bodies and gzip;q=0 are sent uncompressed."""
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.data) == []
+
+    _create_projects(client, 10)
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip;q=0, identity'})
+    assert 'Content-Encoding' not in response.headers
+    assert len(json.loads(response.data)) == 10
+
+
+def test_uncached_response_compressed_on_the_way_out(app, client, db):
+    """Test that responses outside the read cache are compressed by the hook."""
+    _create_projects(client, 1)
+    app.extensions['compression'].min_size = 1
+    response = client.get('/api/search?q=project', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data))['results'][0]['item']['title'] == 'Project 0'
+
@@ -0,0 +1,114 @@
+"""Test project image uploads and their resized variants."""
+import io
+import json
+import os
+
+import pytest
+
+from app.images.images import image_pipeline
+from app.snapshot.snapshot import snapshot_publisher
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def _png(width, height):
+    buffer = io.BytesIO()
+    Image.new('RGBA', (width, height), (200, 40, 40, 128)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _upload(client, headers, project_id, data):
+    return client.post(
+        f'/api/projects/{project_id}/image',
+        headers=headers,
+        data={'image': (io.BytesIO(data), 'cover.png')},
+        content_type='multipart/form-data'
+    )
+
+
+@pytest.fixture
+def images(app, tmp_path):
+    app.config.update(IMAGE_DIR=str(tmp_path), IMAGE_WIDTHS=(320, 640, 1280), IMAGE_WORKERS=0)
+    image_pipeline.init_app(app)
+    return tmp_path
+
+
+def test_upload_renders_variants(client, db, auth_headers, images):
+    """Test that an upload yields hashed WebP/JPEG widths, a placeholder and a srcset."""
+    project_id = client.post('/api/projects', json={'title': 'Portfolio'}).get_json()['id']
+    client.get('/api/projects')
+
+    response = _upload(client, auth_headers, project_id, _png(800, 400))
+    assert response.status_code == 202
+
+    project = client.get('/api/projects').get_json()[0]
+    variants = project['image_variants']
+    assert variants['status'] == 'ready'
+    assert (variants['width'], variants['height']) == (800, 400)
+    assert variants['placeholder'].startswith('data:image/webp;base64,')
+    # Never upscaled: 1280 is capped at the original 800
+    assert sorted({(v['width'], v['height']) for v in variants['variants']}) == [(320, 160), (640, 320), (800, 400)]
+    for variant in variants['variants']:
+        path = images / os.path.basename(variant['url'])
+        assert path.stat().st_size == variant['bytes']
+        assert Image.open(path).size == (variant['width'], variant['height'])
+    assert variants['srcset']['image/webp'].endswith('.webp 800w')
+    assert project['image_url'] == variants['srcset']['image/jpeg'].split(', ')[-1].split(' ')[0]
+
+    # The same pixels map to the same files
+    assert _upload(client, auth_headers, project_id, _png(800, 400)).status_code == 202
+    assert len(os.listdir(images)) == len(variants['variants'])
+
+
+def test_superseded_result_is_dropped(client, db, auth_headers, images, monkeypatch):
+    """Test that a result finishing after a newer upload does not overwrite it."""
+    project_id = client.post('/api/projects', json={'title': 'Portfolio'}).get_json()['id']
+    started = []
+    monkeypatch.setattr(image_pipeline, 'start', lambda *args: started.append(args))
+    _upload(client, auth_headers, project_id, _png(400, 400))
+    _upload(client, auth_headers, project_id, _png(300, 300))
+    monkeypatch.undo()
+
+    # The newer upload is processed first, then the older one finishes late
+    image_pipeline.start(*started[1])
+    image_pipeline.start(*started[0])
+    assert client.get('/api/projects').get_json()[0]['image_variants']['width'] == 300
+
+
+def test_upload_republishes_snapshot(app, client, db, auth_headers, images, tmp_path, monkeypatch):
+    """Test that the projects snapshot shows an upload as processing."""
+    app.config['SNAPSHOT_DIR'] = str(tmp_path / 'snapshots')
+    snapshot_publisher.init_app(app)
+    project_id = client.post('/api/projects', json={'title': 'Portfolio'}).get_json()['id']
+    monkeypatch.setattr(image_pipeline, 'start', lambda *args: None)
+    assert _upload(client, auth_headers, project_id, _png(400, 400)).status_code == 202
+
+    assert snapshot_publisher.flush(timeout=10)
+    with open(tmp_path / 'snapshots' / 'api' / 'projects.json') as f:
+        assert json.load(f)[0]['image_variants']['status'] == 'processing'
+
+
+def test_upload_rejections(client, db, auth_headers, images):
+    """Test the errors for bad uploads, unknown projects and missing auth."""
+    project_id = client.post('/api/projects', json={'title': 'Portfolio'}).get_json()['id']
+    assert _upload(client, auth_headers, project_id, b'not an image').status_code == 400
+    assert _upload(client, auth_headers, project_id + 1, _png(10, 10)).status_code == 404
+    assert _upload(client, {}, project_id, _png(10, 10)).status_code == 401
+    assert client.post(f'/api/projects/{project_id}/image', headers=auth_headers).status_code == 400
+
+
+def test_upsert_to_another_url_drops_variants(client, db, auth_headers, images):
+    """Test that pointing image_url elsewhere clears variants of the old upload."""
+    project_id = client.post('/api/projects', json={'title': 'Portfolio'}).get_json()['id']
+    _upload(client, auth_headers, project_id, _png(400, 200))
+    project = client.get('/api/projects').get_json()[0]
+
+    client.post('/api/projects/bulk', headers=auth_headers, json={
+        'upsert': [{'title': 'Portfolio', 'image_url': project['image_url']}]
+    })
+    assert client.get('/api/projects').get_json()[0]['image_variants']['status'] == 'ready'
+
+    client.post('/api/projects/bulk', headers=auth_headers, json={
+        'upsert': [{'title': 'Portfolio', 'image_url': 'https://example.com/cover.png'}]
+    })
+    assert client.get('/api/projects').get_json()[0]['image_variants'] is None
@@ -0,0 +1,70 @@
+"""Test the loadtest command."""
+import random
+
+import click
+import pytest
+
+from app.loadtest.loadtest import parse_mix, percentile, run
+from app.models.models import User
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 95) == 7
+
+
+def test_parse_mix():
+    """Test that weights default to 1 and bad ones are rejected."""
+    assert parse_mix('projects:3, profile') == (['projects', 'profile'], [3.0, 1.0])
+    for mix in ('projects:abc', 'projects:-1', 'projects:nan', 'projects:0,profile:0'):
+        with pytest.raises(click.BadParameter):
+            parse_mix(mix)
+
+
+def test_scenario_errors_are_counted():
+    """Test that an exception inside a scenario is reported instead of lost in the pool."""
+    class Transport:
+        def request(self, method, path, body=None, headers=None):
+            return 200, b'not json'
+
+    recorder, _ = run(Transport(), ['login'], [1], 200, 0.2, 2,
+                      {'username': 'admin', 'password': ''}, random.Random(1))
+    logins = recorder.statuses['POST /api/login'][200]
+    assert logins > 0
+    assert recorder.statuses['scenario login'] == {'JSONDecodeError': logins}
+
+
+def test_loadtest_in_process(app, db):
+    """Test that the in-process run reports every endpoint in the mix."""
+    result = app.test_cli_runner().invoke(args=[
+        'loadtest', '--mix', 'projects:3,profile:1', '--rate', '200', '--duration', '0.3',
+        '--concurrency', '4', '--seed', '1'
+    ])
+    assert result.exit_code == 0, result.output
+    assert 'GET /api/projects' in result.output
+    assert 'GET /api/profile' in result.output
+    assert '200=' in result.output
+
+    result = app.test_cli_runner().invoke(args=['loadtest', '--mix', 'nope:1'])
+    assert result.exit_code != 0
+
+
+def test_loadtest_writes_log_in_once_per_client(app, db):
+    """Test that create-skill succeeds and logs in once per client thread."""
+    user = User(username='admin')
+    user.set_password('secret')
+    db.session.add(user)
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=[
+        'loadtest', '--mix', 'create-skill:1', '--rate', '200', '--duration', '0.3',
+        '--concurrency', '2', '--seed', '1', '--password', 'secret'
+    ])
+    assert result.exit_code == 0, result.output
+    lines = {line.split('  ')[0].strip(): line for line in result.output.splitlines()}
+    assert '201=' in lines['POST /api/skills']
+    # Two clients, two logins, well inside RATELIMIT_LOGIN_USERNAME
+    assert lines['POST /api/login'].split()[2] in ('1', '2')
@@ -0,0 +1,38 @@
+"""Test request and database metrics."""
+import os
+
+from app.metrics.metrics import MetricsState, render
+
+
+def test_metrics_exposition(client, db):
+    """Test that requests are recorded by endpoint and status with their queries."""
+    client.get('/api/skills')
+    client.get('/api/nothing-here')
+
+    response = client.get('/api/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    text = response.get_data(as_text=True)
+
+    labels = 'endpoint="skills.skills",method="GET",status="200"'
+    assert 'http_request_duration_seconds_count{%s} 1' % labels in text
+    assert 'http_request_duration_seconds_bucket{%s,le="+Inf"} 1' % labels in text
+    assert 'endpoint="unmatched",method="GET",status="404"' in text
+    assert 'db_queries_total{endpoint="skills.skills"} 1' in text
+
+
+def test_multiprocess_aggregation(tmp_path, monkeypatch):
+    """Test that totals from every worker file are summed on collection."""
+    labels = (('endpoint', 'projects.get_projects'),)
+    for pid, queries in ((101, 2), (102, 3)):
+        monkeypatch.setattr(os, 'getpid', lambda: pid)
+        worker = MetricsState(str(tmp_path), 1.0)
+        worker.inc('db_queries_total', labels, queries)
+        worker.observe('http_request_duration_seconds', labels, 0.02)
+        worker.flush()
+
+    monkeypatch.setattr(os, 'getpid', lambda: 103)
+    text = render(MetricsState(str(tmp_path), 1.0).collect())
+    assert 'db_queries_total{endpoint="projects.get_projects"} 5' in text
+    assert 'http_request_duration_seconds_bucket{endpoint="projects.get_projects",le="0.025"} 2' in text
+    assert 'http_request_duration_seconds_count{endpoint="projects.get_projects"} 2' in text
@@ -0,0 +1,54 @@
+"""Test keyset pagination on the project and skill listings."""
+import base64
+import json
+from datetime import datetime, timedelta
+
+from app.models.models import Project, Skill
+
+
+def _walk(client, url):
+    pages = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append([item['id'] for item in json.loads(response.data)])
+        cursor = response.headers.get('X-Next-Cursor')
+        url = response.headers['Link'][1:].split('>')[0] if cursor else None
+    return pages
+
+
+def test_projects_keyset_pages(client, db):
+    """Test that cursors walk projects newest first without gaps."""
+    start = datetime(2024, 1, 1)
+    for i in range(5):
+        # Two projects share a timestamp so the id tie-breaker is exercised
+        db.session.add(Project(title=f'p{i}', created_at=start + timedelta(days=i // 2)))
+    db.session.commit()
+
+    pages = _walk(client, '/api/projects?limit=2')
+    assert pages == [[5, 4], [3, 2], [1]]
+
+    pages = _walk(client, '/api/projects?limit=3&sort=created_at')
+    assert pages == [[1, 2, 3], [4, 5]]
+
+
+def test_skills_sorted_by_category(client, db):
+    """Test the default category/name ordering of skills."""
+    for name, category in [('React', 'Frontend'), ('Flask', 'Backend'),
+                           ('Django', 'Backend'), ('Docker', 'DevOps')]:
+        db.session.add(Skill(name=name, category=category, proficiency=3))
+    db.session.commit()
+
+    pages = _walk(client, '/api/skills?limit=3')
+    assert pages == [[3, 2, 4], [1]]
+
+
+def test_invalid_pagination_arguments(client, db):
+    """Test that malformed arguments are rejected with 400."""
+    assert client.get('/api/projects?limit=abc').status_code == 400
+    assert client.get('/api/projects?cursor=not-a-cursor').status_code == 400
+    # Well-formed cursors carrying values of the wrong type for the sort key
+    for values in ([[1], 2], ['yesterday', 2], [{'dt': '2024-01-01T00:00:00'}, 'x'], [{'dt': 5}, 1], 7):
+        cursor = base64.urlsafe_b64encode(json.dumps(['-created_at', values]).encode()).decode()
+        assert client.get(f'/api/projects?cursor={cursor}').status_code == 400
+    assert client.get('/api/skills?sort=proficiency').status_code == 400
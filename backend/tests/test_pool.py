@@ -0,0 +1,29 @@
+"""Test pool configuration, telemetry and the readiness endpoint."""
+import json
+
+from app import create_app
+from app.pool.pool import InstrumentedQueuePool
+
+
+def test_ready_reports_pool_stats(app, client, db):
+    """Test that /api/ready pings through the instrumented pool."""
+    assert app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_pre_ping'] is True
+    assert isinstance(db.engine.pool, InstrumentedQueuePool)
+
+    response = client.get('/api/ready')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['status'] == 'ready'
+    pool = data['pool']
+    assert pool['size'] == app.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_size']
+    assert pool['checked_out'] == 0
+    assert pool['acquisitions'] >= 1
+    assert pool['timeouts'] == 0
+
+
+def test_memory_sqlite_drops_queue_options():
+    """Test that an in-memory database still gets a working engine."""
+    app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+    assert 'pool_size' not in app.config['SQLALCHEMY_ENGINE_OPTIONS']
+    with app.test_client() as client:
+        assert client.get('/api/ready').status_code == 200
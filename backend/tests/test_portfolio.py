@@ -0,0 +1,21 @@
+"""Test the /api/portfolio landing page bundle."""
+import json
+
+
+def test_bundle_matches_listings(client, db, app):
+    """Test that the bundle carries the first page of each listing and follows writes."""
+    app.config['PAGINATION_DEFAULT_LIMIT'] = 2
+    for i in range(3):
+        client.post('/api/projects', json={'title': f'p{i}', 'tech_stack': ['Flask']})
+    client.post('/api/skills', json={'name': 'Python', 'category': 'Backend', 'proficiency': 5})
+
+    bundle = client.get('/api/portfolio').get_json()
+    projects = client.get('/api/projects')
+    assert bundle['projects'] == json.loads(projects.data)
+    assert bundle['next_cursors']['projects'] == projects.headers['X-Next-Cursor']
+    assert bundle['skills'] == client.get('/api/skills').get_json()
+    assert bundle['next_cursors']['skills'] is None
+    assert bundle['profile']['name'] == client.get('/api/profile').get_json()['name']
+
+    client.post('/api/skills', json={'name': 'Go', 'category': 'Backend', 'proficiency': 3})
+    assert [s['name'] for s in client.get('/api/portfolio').get_json()['skills']] == ['Go', 'Python']
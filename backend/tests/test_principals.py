@@ -0,0 +1,34 @@
+"""Test the authenticated-principal cache."""
+from sqlalchemy import event
+
+from app.models.models import User
+
+
+def _queries(db):
+    statements = []
+    event.listen(db.engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+def test_check_auth_served_from_cache(client, db, auth_headers):
+    """Test that repeat check-auth calls do not query the users table."""
+    assert client.get('/api/check-auth', headers=auth_headers).status_code == 200
+
+    statements = _queries(db)
+    for _ in range(3):
+        assert client.get('/api/check-auth', headers=auth_headers).status_code == 200
+    assert not [s for s in statements if 'users' in s]
+
+
+def test_deleted_user_is_evicted(client, db, auth_headers):
+    """Test that deleting a user invalidates its cached principal."""
+    assert client.get('/api/check-auth', headers=auth_headers).status_code == 200
+    assert client.delete('/api/skills/1', headers=auth_headers).status_code == 404
+
+    db.session.delete(User.query.filter_by(username='admin').first())
+    db.session.commit()
+
+    assert client.get('/api/check-auth', headers=auth_headers).status_code == 401
+    response = client.delete('/api/skills/1', headers=auth_headers)
+    assert response.status_code == 401
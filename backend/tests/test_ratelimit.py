@@ -0,0 +1,69 @@
+"""Test the token-bucket rate limiter."""
+import os
+import tempfile
+
+from sqlalchemy import event
+
+from app.ratelimit.ratelimit import MemoryBackend, SQLiteBackend, parse_limit
+
+
+def test_login_throttled_before_user_lookup(app, client, db):
+    """Test that a throttled login never queries users or hashes."""
+    app.config['RATELIMIT_LOGIN_USERNAME'] = '2/minute'
+    credentials = {'username': 'victim', 'password': 'guess'}
+    for _ in range(2):
+        assert client.post('/api/login', json=credentials).status_code == 401
+
+    statements = []
+    event.listen(db.engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    response = client.post('/api/login', json=credentials)
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert statements == []
+
+    # Other usernames from the same IP are still allowed
+    response = client.post('/api/login', json={'username': 'other', 'password': 'x'})
+    assert response.status_code == 401
+
+
+def test_writes_limited_per_ip(app, client, db):
+    """Test that writes share a per-IP bucket and reads are exempt."""
+    app.config['RATELIMIT_WRITE_IP'] = '1/minute'
+    assert client.post('/api/skills', json={'name': 'Go', 'category': 'Backend'}).status_code == 201
+    assert client.post('/api/projects', json={'title': 'site'}).status_code == 429
+    assert client.get('/api/projects').status_code == 200
+
+
+def test_memory_backend_is_bounded():
+    """Test that only refilled keys are evicted and a full table shares an overflow bucket."""
+    backend = MemoryBackend(max_keys=3)
+    capacity, rate = parse_limit('1/minute')
+    for i in range(3):
+        assert backend.hit(f'k{i}', capacity, rate, 0.0) == (True, 0.0)
+
+    # Every bucket is still draining: new keys share one bucket instead
+    assert backend.hit('k3', capacity, rate, 30.0) == (True, 0.0)
+    assert backend.hit('k4', capacity, rate, 30.0) == (False, 60.0)
+    assert len(backend.buckets) == 4
+
+    # Refilled buckets make room again, least recently used first
+    assert backend.hit('k5', capacity, rate, 60.0) == (True, 0.0)
+    assert list(backend.buckets) == [('overflow', capacity, rate), 'k5']
+
+
+def test_sqlite_backend_shared_between_workers():
+    """Test that two backends on one file share the same buckets."""
+    fd, path = tempfile.mkstemp()
+    try:
+        first, second = SQLiteBackend(path), SQLiteBackend(path)
+        capacity, rate = parse_limit('2/second')
+        assert first.hit('login-ip:1.2.3.4', capacity, rate, 100.0)[0]
+        assert second.hit('login-ip:1.2.3.4', capacity, rate, 100.0)[0]
+        assert not first.hit('login-ip:1.2.3.4', capacity, rate, 100.0)[0]
+        assert second.hit('login-ip:1.2.3.4', capacity, rate, 100.5)[0]
+    finally:
+        os.close(fd)
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
@@ -0,0 +1,83 @@
+"""Test the full-text search index and /api/search."""
+from app.models.models import Project, Skill
+from app.search.search import InvertedIndex
+
+
+def _search(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return [(r['type'], r['item'].get('title') or r['item']['name']) for r in response.get_json()['results']]
+
+
+def test_bm25_ranking_and_prefixes():
+    """Test ranking, prefix expansion of the last word and removal."""
+    index = InvertedIndex()
+    index.add_many([
+        (('project', 1), 'Portfolio site built with React and Flask'),
+        (('project', 2), 'React React React dashboard'),
+        (('project', 3), 'Command line tool written in Rust'),
+        (('skill', 1), 'React Frontend'),
+    ])
+
+    assert [doc for doc, _ in index.search('react')][0] == ('project', 2)
+    assert {doc for doc, _ in index.search('reac')} == {('project', 1), ('project', 2), ('skill', 1)}
+    assert index.search('reac', prefix=False) == []
+    assert [doc for doc, _ in index.search('react', kinds={'skill'})] == [('skill', 1)]
+    # Only the last word is a prefix
+    assert [doc for doc, _ in index.search('rus tool')] == [('project', 3)]
+
+    index.remove(('project', 2))
+    index.add(('project', 1), 'Renamed')
+    assert {doc for doc, _ in index.search('react')} == {('skill', 1)}
+    assert index.expand('re') == ['react', 'renamed']
+
+
+def test_search_endpoint_follows_writes(client, db, auth_headers):
+    """Test that handler writes update the index without a rebuild."""
+    client.post('/api/projects', json={'title': 'Portfolio', 'description': 'Built with Flask'})
+    assert _search(client, '/api/search?q=flask') == [('project', 'Portfolio')]
+    index = client.application.extensions['search_index'].index
+
+    client.post('/api/skills', json={'name': 'Flask', 'category': 'Backend'})
+    client.post('/api/projects/bulk', headers=auth_headers, json={
+        'create': [{'title': 'Flask API', 'description': 'REST service'}]
+    })
+    assert sorted(_search(client, '/api/search?q=fla')) == [
+        ('project', 'Flask API'), ('project', 'Portfolio'), ('skill', 'Flask')
+    ]
+    assert _search(client, '/api/search?q=flask&type=skill') == [('skill', 'Flask')]
+
+    portfolio = Project.query.filter_by(title='Portfolio').one()
+    client.delete(f'/api/projects/{portfolio.id}', headers=auth_headers)
+    assert ('project', 'Portfolio') not in _search(client, '/api/search?q=flask')
+    assert client.application.extensions['search_index'].index is index
+
+    assert client.get('/api/search').status_code == 400
+    assert client.get('/api/search?q=flask&type=user').status_code == 400
+
+
+def test_sync_picks_up_other_writers(app, client, db):
+    """Test that rows written outside this process's handlers are found after a sync."""
+    assert _search(client, '/api/search?q=kubernetes') == []
+
+    db.session.add(Skill(name='Kubernetes', category='DevOps'))
+    db.session.commit()
+    assert _search(client, '/api/search?q=kubernetes') == []
+
+    app.extensions['search_index'].next_sync = 0
+    assert _search(client, '/api/search?q=kubernetes') == [('skill', 'Kubernetes')]
+
+
+def test_rows_deleted_elsewhere_are_evicted(app, client, db):
+    """Test that rows another worker deleted are evicted and the page is still filled."""
+    for name in ('Flask', 'FastAPI', 'Falcon'):
+        db.session.add(Skill(name=name, category='Backend'))
+    db.session.commit()
+    (_, first), _ = _search(client, '/api/search?q=backend&limit=2')
+
+    # Deleted without going through this process's handlers
+    db.session.delete(Skill.query.filter_by(name=first).one())
+    db.session.commit()
+    results = _search(client, '/api/search?q=backend&limit=2')
+    assert len(results) == 2 and ('skill', first) not in results
+    assert len(app.extensions['search_index'].index) == 2
@@ -0,0 +1,24 @@
+"""Test the Core row serializers used by the list endpoints."""
+import json
+from datetime import datetime
+
+from app.models.models import Project
+from app.serializers.serializers import dumps, project_serializer
+
+
+def test_rows_and_instances_match(client, db):
+    """Test that selected rows and ORM instances serialize identically."""
+    project = Project(title='site', tech_stack=['React'],
+                      created_at=datetime(2024, 5, 1, 12, 30, 15))
+    db.session.add(project)
+    db.session.commit()
+
+    row = db.session.execute(project_serializer.select()).one()
+    assert project_serializer.row(row) == project_serializer.instance(project)
+
+    payload = json.loads(dumps(project_serializer.rows([row])))
+    assert payload[0]['created_at'] == '2024-05-01T12:30:15'
+    assert payload[0]['tech_stack'] == ['React']
+
+    response = client.get('/api/projects')
+    assert json.loads(response.data) == payload
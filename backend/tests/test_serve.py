@@ -0,0 +1,141 @@
+"""Test the process pools under the production server: serve.py with gevent workers."""
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.models.models import User
+
+pytest.importorskip('gevent')
+pytest.importorskip('gunicorn')
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _request(url, body=None, timeout=30, headers=None, data=None, content_type='application/json'):
+    request = urllib.request.Request(
+        url,
+        data=data if body is None else json.dumps(body).encode(),
+        headers=dict(headers or {}, **{'Content-Type': content_type})
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def _descendants(pid):
+    children = {}
+    for entry in os.listdir('/proc'):
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                children.setdefault(int(f.read().rsplit(')', 1)[1].split()[1]), []).append(int(entry))
+        except (ValueError, OSError):
+            continue
+    found, pending = [], [pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            found.append(child)
+            pending.append(child)
+    return found
+
+
+@pytest.fixture
+def server(app, db, tmp_path):
+    user = User(username='admin')
+    user.set_password('secret')
+    db.session.add(user)
+    db.session.commit()
+
+    url = f'http://127.0.0.1:{_free_port()}'
+    env = dict(
+        os.environ,
+        DATABASE_URL=app.config['SQLALCHEMY_DATABASE_URI'],
+        SERVER_BIND=url[len('http://'):],
+        SERVER_WORKERS='1',
+        SERVER_WORKER_CLASS='gevent',
+        PASSWORD_HASH_WORKERS='2',
+        STARTUP_WARM='false',
+        IMAGE_DIR=str(tmp_path / 'media'),
+        RATELIMIT_ENABLED='false'
+    )
+    process = subprocess.Popen([sys.executable, 'serve.py'], cwd=BACKEND, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                _request(f'{url}/api/ready', timeout=1)
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    pytest.fail(f"serve.py did not start: {process.stderr.read().decode()[-2000:]}")
+                time.sleep(0.2)
+        yield url, process
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason='inspects worker processes through /proc')
+def test_login_hashes_in_pool_under_gevent(server):
+    """Test that concurrent logins succeed through the spawned hashing pool of a gevent worker."""
+    url, process = server
+    credentials = {'username': 'admin', 'password': 'secret'}
+    with ThreadPoolExecutor(4) as pool:
+        logins = [pool.submit(_request, f'{url}/api/login', credentials) for _ in range(4)]
+        # The worker keeps serving other requests while the hashes run
+        assert _request(f'{url}/api/ready')[0] == 200
+        results = [login.result() for login in logins]
+    assert [status for status, _ in results] == [200] * 4
+    assert all(body['token'] for _, body in results)
+    assert _request(f'{url}/api/login', dict(credentials, password='wrong'))[0] == 401
+
+    spawned = []
+    for pid in _descendants(process.pid):
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            if b'multiprocessing' in f.read():
+                spawned.append(pid)
+    assert spawned, "logins were hashed inline instead of in the pool"
+
+
+def test_image_processed_in_pool_under_gevent(server):
+    """Test that an upload is resized in the spawned image pool and stored from its callback."""
+    Image = pytest.importorskip('PIL.Image')
+    url, _ = server
+    token = _request(f'{url}/api/login', {'username': 'admin', 'password': 'secret'})[1]['token']
+    headers = {'Authorization': f'Bearer {token}'}
+    project_id = _request(f'{url}/api/projects', {'title': 'Portfolio'}, headers=headers)[1]['id']
+
+    image = io.BytesIO()
+    Image.new('RGB', (800, 400), (200, 40, 40)).save(image, 'PNG')
+    boundary = 'test-boundary'
+    data = (f'--{boundary}\r\nContent-Disposition: form-data; name="image"; filename="cover.png"\r\n'
+            f'Content-Type: image/png\r\n\r\n').encode() + image.getvalue() + f'\r\n--{boundary}--\r\n'.encode()
+    status, _ = _request(f'{url}/api/projects/{project_id}/image', headers=headers, data=data,
+                         content_type=f'multipart/form-data; boundary={boundary}')
+    assert status == 202
+
+    deadline = time.monotonic() + 30
+    while True:
+        variants = _request(f'{url}/api/projects')[1][0]['image_variants']
+        if variants['status'] != 'processing' or time.monotonic() > deadline:
+            break
+        time.sleep(0.2)
+    assert variants['status'] == 'ready'
+    assert (variants['width'], variants['height']) == (800, 400)
@@ -0,0 +1,34 @@
+"""Test the slow query log."""
+from sqlalchemy import text
+
+
+def test_slow_queries_endpoint(app, client, db, auth_headers):
+    """Test that slow statements are captured with their plan and index advice."""
+    app.extensions['slow_query_log'].threshold = 0
+    db.session.execute(text('DROP INDEX ix_skills_category_name'))
+    db.session.commit()
+    client.get('/api/skills')
+
+    assert client.get('/api/admin/slow-queries').status_code == 401
+    response = client.get('/api/admin/slow-queries', headers=auth_headers)
+    assert response.status_code == 200
+
+    listing = next(q for q in response.get_json()['queries'] if 'ORDER BY skills.category' in q['statement'])
+    assert listing['endpoints'] == ['skills.skills']
+    assert any('skill_routes.py' in frame for frame in listing['stack'])
+    assert 'filesort' in listing['explain']['flags']
+    assert listing['explain']['advice'] == [
+        'CREATE INDEX ix_skills_category_name_id ON skills (category, name, id)'
+    ]
+
+    assert client.delete('/api/admin/slow-queries', headers=auth_headers).status_code == 200
+    queries = client.get('/api/admin/slow-queries?explain=0', headers=auth_headers).get_json()['queries']
+    assert all('ORDER BY skills.category' not in q['statement'] for q in queries)
+
+
+def test_report_command(app, db):
+    """Test that the CLI report flags the unpaginated profile scan."""
+    result = app.test_cli_runner().invoke(args=['slow-queries', 'report', '--path', '/api/profile'])
+    assert result.exit_code == 0, result.output
+    assert '[full_scan]' in result.output
+    assert '1 statement(s) flagged' in result.output
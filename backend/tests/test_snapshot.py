@@ -0,0 +1,88 @@
+"""Test the static snapshots published for nginx."""
+import gzip
+import json
+import os
+
+from app.snapshot.snapshot import snapshot_publisher
+
+
+def _read(directory, name):
+    path = os.path.join(directory, 'api', f'{name}.json')
+    with open(path, 'rb') as f:
+        body = f.read()
+    with open(f'{path}.gz', 'rb') as f:
+        assert gzip.decompress(f.read()) == body
+    return json.loads(body)
+
+
+def test_writes_republish(app, client, db, auth_headers, tmp_path):
+    """Test that writes swap in new snapshots matching the API responses."""
+    app.config['SNAPSHOT_DIR'] = str(tmp_path)
+    snapshot_publisher.init_app(app)
+    assert sorted(snapshot_publisher.publish_all()) == ['portfolio', 'profile', 'projects', 'skills']
+    assert _read(tmp_path, 'projects') == []
+
+    client.post('/api/projects', json={'title': 'Portfolio'})
+    client.post('/api/skills', json={'name': 'Flask', 'category': 'Backend', 'proficiency': 4})
+    assert snapshot_publisher.flush(timeout=10)
+    for name in ('projects', 'skills', 'profile', 'portfolio'):
+        assert _read(tmp_path, name) == client.get(f'/api/{name}').get_json()
+
+    # Only the current version of each snapshot is kept
+    target = os.readlink(tmp_path / 'api' / 'projects.json')
+    assert sorted(p for p in os.listdir(tmp_path / 'api') if p.startswith('projects.')) == [
+        target, f'{target}.gz', 'projects.json', 'projects.json.gz'
+    ]
+
+    skill_id = client.get('/api/skills').get_json()[0]['id']
+    client.delete(f'/api/skills/{skill_id}', headers=auth_headers)
+    assert snapshot_publisher.flush(timeout=10)
+    assert _read(tmp_path, 'skills') == []
+    assert _read(tmp_path, 'portfolio')['skills'] == []
+
+
+def test_listing_over_one_page_left_to_the_api(app, client, db, tmp_path):
+    """Test that a listing needing a cursor is unpublished rather than truncated."""
+    app.config.update(SNAPSHOT_DIR=str(tmp_path), PAGINATION_DEFAULT_LIMIT=2)
+    snapshot_publisher.init_app(app)
+    for i in range(3):
+        client.post('/api/projects', json={'title': f'Project {i}'})
+    assert snapshot_publisher.flush(timeout=10)
+
+    assert not os.path.lexists(tmp_path / 'api' / 'projects.json')
+    assert not [p for p in os.listdir(tmp_path / 'api') if p.startswith('projects.')]
+    assert len(_read(tmp_path, 'portfolio')['projects']) == 2
+
+
+def test_burst_of_writes_published_once(app, client, db, tmp_path, monkeypatch):
+    """Test that writes within the debounce window share one background publish."""
+    app.config.update(SNAPSHOT_DIR=str(tmp_path), SNAPSHOT_DEBOUNCE=1)
+    snapshot_publisher.init_app(app)
+    publishes = []
+    replace_all = snapshot_publisher._replace_all
+    monkeypatch.setattr(snapshot_publisher, '_replace_all',
+                        lambda state, names: publishes.append(names) or replace_all(state, names))
+
+    for i in range(3):
+        client.post('/api/projects', json={'title': f'Project {i}'})
+    # Nothing is rendered on the request path
+    assert publishes == []
+    assert snapshot_publisher.flush(timeout=10)
+    assert publishes == [['projects', 'portfolio']]
+    assert _read(tmp_path, 'projects') == client.get('/api/projects').get_json()
+
+
+def test_publish_inline_without_debounce(app, client, db, tmp_path):
+    """Test that SNAPSHOT_DEBOUNCE = 0 publishes before the response."""
+    app.config.update(SNAPSHOT_DIR=str(tmp_path), SNAPSHOT_DEBOUNCE=0)
+    snapshot_publisher.init_app(app)
+    client.post('/api/projects', json={'title': 'Portfolio'})
+    assert [p['title'] for p in _read(tmp_path, 'projects')] == ['Portfolio']
+
+
+def test_disabled_without_directory(app, client, db):
+    """Test that nothing is published unless SNAPSHOT_DIR is set."""
+    assert snapshot_publisher.publish_all() == []
+    result = app.test_cli_runner().invoke(args=['snapshots', 'publish'])
+    assert result.exit_code != 0
+    assert 'SNAPSHOT_DIR is not set' in result.output
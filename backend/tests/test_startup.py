@@ -0,0 +1,69 @@
+"""Test the cold-start helpers."""
+import time
+from datetime import datetime
+
+from sqlalchemy import inspect
+
+from app.models.models import SCHEMA_VERSION, SchemaVersion
+from app.startup import startup
+from app.startup.startup import ensure_schema, mark_ready, track_startup, wait_for_database
+
+
+def test_schema_version_skips_create_all(app, db, monkeypatch):
+    """Test that create_all runs only while the stored version is behind."""
+    calls = []
+    create_all = db.create_all
+    monkeypatch.setattr(db, 'create_all', lambda: calls.append(1) or create_all())
+
+    assert ensure_schema() is True
+    assert db.session.get(SchemaVersion, SCHEMA_VERSION) is not None
+    assert ensure_schema() is False
+    assert calls == [1]
+
+
+def test_wait_for_database_backs_off(tmp_path, monkeypatch):
+    """Test that the probe retries with growing delays and gives up at the timeout."""
+    delays = []
+    monkeypatch.setattr(startup.time, 'sleep', delays.append)
+    monkeypatch.setattr(startup.random, 'uniform', lambda low, high: high)
+
+    missing = f'sqlite:///{tmp_path}/missing/db.sqlite3'
+    assert wait_for_database(missing, timeout=0.5, initial_delay=0.01, max_delay=0.02) is False
+    assert delays[:3] == [0.01, 0.02, 0.02]
+    assert wait_for_database(f'sqlite:///{tmp_path}/db.sqlite3', timeout=1) is True
+
+
+def test_first_request_timing(app, client, db):
+    """Test that requests before the app is ready are not counted as the first."""
+    track_startup(app, time.monotonic())
+    client.get('/api/skills')
+    assert app.extensions['startup']['first_request_seconds'] is None
+
+    mark_ready(app)
+    client.get('/api/skills')
+    payload = client.get('/api/ready').get_json()
+    assert payload['startup']['first_request_seconds'] >= payload['startup']['ready_seconds']
+
+
+def test_schema_upgrade_adds_columns(app, db):
+    """Test that a column added to an existing table's model is ALTERed in."""
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql('ALTER TABLE projects DROP COLUMN image_variants')
+    db.session.add(SchemaVersion(version=SCHEMA_VERSION - 1, applied_at=datetime.utcnow()))
+    db.session.commit()
+
+    assert ensure_schema() is True
+    columns = {column['name'] for column in inspect(db.engine).get_columns('projects')}
+    assert 'image_variants' in columns
+
+
+def test_schema_upgrade_backfills_tech_index(app, client, db):
+    """Test that upgrading an unversioned database rebuilds the technology index."""
+    client.post('/api/projects', json={'title': 'Portfolio', 'tech_stack': ['React', 'Flask']})
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql('DROP TABLE project_technologies')
+        conn.exec_driver_sql('DROP TABLE schema_version')
+
+    assert ensure_schema() is True
+    response = client.get('/api/projects?tech=React&tech=Flask')
+    assert [p['title'] for p in response.get_json()] == ['Portfolio']
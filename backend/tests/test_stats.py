@@ -0,0 +1,64 @@
+"""Test the materialized skill and technology aggregates."""
+from app.stats.stats import rebuild
+
+
+def _categories(client):
+    response = client.get('/api/skills?group=category')
+    assert response.status_code == 200
+    return {row['category']: (row['skill_count'], row['average_proficiency']) for row in response.get_json()}
+
+
+def _tech(client):
+    response = client.get('/api/stats/tech')
+    assert response.status_code == 200
+    return [(row['name'], row['project_count']) for row in response.get_json()]
+
+
+def test_skill_categories_follow_writes(client, db, auth_headers):
+    """Test that single and bulk skill writes keep the category averages current."""
+    client.post('/api/skills', json={'name': 'React', 'category': 'Frontend', 'proficiency': 4})
+    client.post('/api/skills', json={'name': 'CSS', 'category': 'Frontend', 'proficiency': 3})
+    doomed = client.post('/api/skills', json={'name': 'Go', 'category': 'Backend', 'proficiency': 2})
+    assert _categories(client) == {'Frontend': (2, 3.5), 'Backend': (1, 2.0)}
+
+    response = client.post('/api/skills/bulk', headers=auth_headers, json={
+        'create': [{'name': 'Flask', 'category': 'Backend', 'proficiency': 5}],
+        'upsert': [{'name': 'CSS', 'category': 'Frontend', 'proficiency': 5}]
+    })
+    assert response.status_code == 200
+    client.delete(f"/api/skills/{doomed.get_json()['id']}", headers=auth_headers)
+    assert _categories(client) == {'Frontend': (2, 4.5), 'Backend': (1, 5.0)}
+
+    expected = _categories(client)
+    rebuild()
+    assert _categories(client) == expected
+    assert client.get('/api/skills?group=name').status_code == 400
+
+
+def test_skill_proficiency_is_coerced(client, db):
+    """Test that a numeric string proficiency is counted as an integer and junk is rejected."""
+    response = client.post('/api/skills', json={'name': 'React', 'category': 'Frontend', 'proficiency': '4'})
+    assert response.status_code == 201
+    assert response.get_json()['proficiency'] == 4
+    assert _categories(client) == {'Frontend': (1, 4.0)}
+
+    response = client.post('/api/skills', json={'name': 'Vue', 'category': 'Frontend', 'proficiency': 'high'})
+    assert response.status_code == 400
+    assert _categories(client) == {'Frontend': (1, 4.0)}
+
+
+def test_tech_counts_follow_writes(client, db, auth_headers):
+    """Test that project writes keep per-technology counts current and drop unused ones."""
+    client.post('/api/projects', json={'title': 'site', 'tech_stack': ['React', 'Flask']})
+    api = client.post('/api/projects', json={'title': 'api', 'tech_stack': ['Flask', 'Go']})
+    assert _tech(client) == [('Flask', 2), ('Go', 1), ('React', 1)]
+
+    client.post('/api/projects/bulk', headers=auth_headers, json={
+        'upsert': [{'title': 'site', 'tech_stack': ['react', 'Docker']}]
+    })
+    client.delete(f"/api/projects/{api.get_json()['id']}", headers=auth_headers)
+    assert _tech(client) == [('Docker', 1), ('react', 1)]
+
+    expected = _tech(client)
+    rebuild()
+    assert _tech(client) == expected
@@ -0,0 +1,28 @@
+"""Test streamed JSON listings."""
+import json
+
+from app.models.models import Skill
+
+
+def test_streamed_skills_match_listing(app, client, db):
+    """Test that ?stream=1 returns every row, in order, across chunks."""
+    app.config['STREAM_CHUNK_ROWS'] = 3
+    for i in range(10):
+        db.session.add(Skill(name=f'skill{i:02d}', category=f'cat{i % 3}', proficiency=3))
+    db.session.commit()
+
+    response = client.get('/api/skills?stream=1')
+    assert response.status_code == 200
+    assert response.is_streamed
+    streamed = json.loads(response.data)
+    assert len(streamed) == 10
+    assert streamed == json.loads(client.get('/api/skills').data)
+
+    response = client.get('/api/skills?stream=1&sort=-created_at')
+    assert [s['id'] for s in json.loads(response.data)] == list(range(10, 0, -1))
+
+
+def test_streamed_empty_projects(client, db):
+    """Test that an empty result still streams a valid array."""
+    response = client.get('/api/projects?stream=1')
+    assert json.loads(response.data) == []
@@ -0,0 +1,40 @@
+"""Test the project technology index and ?tech= filtering."""
+import json
+
+from app.models.models import Project, ProjectTechnology
+
+
+def _titles(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return sorted(p['title'] for p in json.loads(response.data))
+
+
+def test_tech_filter(client, db, auth_headers):
+    """Test AND/OR filtering and index upkeep on create/delete."""
+    for title, stack in [('site', ['React', 'Flask']), ('api', ['Flask', 'MySQL']),
+                         ('app', ['react', 'Node.js'])]:
+        response = client.post('/api/projects', json={'title': title, 'tech_stack': stack})
+        assert response.status_code == 201
+
+    assert _titles(client, '/api/projects?tech=React&tech=Flask') == ['site']
+    assert _titles(client, '/api/projects?tech=react') == ['app', 'site']
+    assert _titles(client, '/api/projects?tech=MySQL&tech=Node.js&match=any') == ['api', 'app']
+    assert client.get('/api/projects?tech=Flask&match=some').status_code == 400
+
+    site_id = Project.query.filter_by(title='site').first().id
+    response = client.delete(f'/api/projects/{site_id}', headers=auth_headers)
+    assert response.status_code == 200
+    assert ProjectTechnology.query.filter_by(project_id=site_id).count() == 0
+    assert _titles(client, '/api/projects?tech=react') == ['app']
+
+
+def test_backfill_command(app, db):
+    """Test that the CLI backfill indexes rows written around the handlers."""
+    db.session.add(Project(title='legacy', tech_stack=['Docker', 'docker', 'Python']))
+    db.session.commit()
+    assert ProjectTechnology.query.count() == 0
+
+    result = app.test_cli_runner().invoke(args=['tech-index', 'backfill'])
+    assert 'Indexed 1 projects' in result.output
+    assert sorted(t.tech_key for t in ProjectTechnology.query) == ['docker', 'python']
@@ -14,22 +14,21 @@ import {
 } from '@mui/material';
 import { motion } from 'framer-motion';
 import { useAppDispatch, useAppSelector } from '../hooks';
-import { fetchProfile, fetchProjects, fetchSkills } from '../store/portfolioSlice';
+import { fetchPortfolio } from '../store/portfolioSlice';
 
 const MotionContainer = motion(Container);
 const MotionCard = motion(Card);
 
+// Cards are a third of the row from md up, half on sm, full width below
+const CARD_IMAGE_SIZES = '(min-width: 900px) 33vw, (min-width: 600px) 50vw, 100vw';
+
 const Portfolio: React.FC = () => {
   const dispatch = useAppDispatch();
   const { profile, projects, skills, loading } = useAppSelector((state) => state.portfolio);
 
   const loadData = useCallback(async () => {
     try {
-      await Promise.all([
-        dispatch(fetchProfile()),
-        dispatch(fetchProjects()),
-        dispatch(fetchSkills())
-      ]);
+      await dispatch(fetchPortfolio());
     } catch (error) {
       console.error('Error loading data:', error);
     }
@@ -103,7 +102,29 @@ const Portfolio: React.FC = () => {
               whileHover={{ scale: 1.03 }}
               transition={{ duration: 0.2 }}
             >
-              {project.image_url && (
+              {project.image_variants?.status === 'ready' ? (
+                <picture>
+                  <source
+                    type="image/webp"
+                    srcSet={project.image_variants.srcset?.['image/webp']}
+                    sizes={CARD_IMAGE_SIZES}
+                  />
+                  <CardMedia
+                    component="img"
+                    height="200"
+                    image={project.image_url}
+                    srcSet={project.image_variants.srcset?.['image/jpeg']}
+                    sizes={CARD_IMAGE_SIZES}
+                    loading="lazy"
+                    decoding="async"
+                    alt={project.title}
+                    sx={{
+                      backgroundImage: `url(${project.image_variants.placeholder})`,
+                      backgroundSize: 'cover'
+                    }}
+                  />
+                </picture>
+              ) : project.image_url && (
                 <CardMedia
                   component="img"
                   height="200"
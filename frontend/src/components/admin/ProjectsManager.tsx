@@ -28,11 +28,18 @@ const ProjectsManager: React.FC = () => {
 
   const fetchProjects = async () => {
     try {
-      const response = await fetch('http://localhost:8092/api/projects', {
-        credentials: 'include',
-      });
-      const data = await response.json();
-      setProjects(data);
+      // The listing is paginated; follow the cursor to the last page
+      const all: Project[] = [];
+      let cursor: string | null = null;
+      do {
+        const query: string = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response: Response = await fetch(`http://localhost:8092/api/projects${query}`, {
+          credentials: 'include',
+        });
+        all.push(...(await response.json()));
+        cursor = response.headers.get('X-Next-Cursor');
+      } while (cursor);
+      setProjects(all);
     } catch (error) {
       console.error('Error fetching projects:', error);
     }
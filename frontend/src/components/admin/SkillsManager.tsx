@@ -22,8 +22,7 @@ const SkillsManager: React.FC = () => {
 
   const fetchSkills = async () => {
     try {
-      const response = await skillsApi.list();
-      setSkills(response.data);
+      setSkills(await skillsApi.listAll());
     } catch (error) {
       console.error('Error fetching skills:', error);
     }
@@ -7,7 +7,7 @@ interface AuthContextType {
   isAuthenticated: boolean;
   user: { username: string } | null;
   login: (username: string, password: string) => Promise<void>;
-  logout: () => void;
+  logout: () => Promise<void>;
   loading: boolean;
 }
 
@@ -57,10 +57,16 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
     }
   };
 
-  const logout = () => {
-    authApi.logout();
-    setIsAuthenticated(false);
-    setUser(null);
+  const logout = async () => {
+    try {
+      await authApi.logout();
+    } catch (error) {
+      console.error('Logout failed:', error);
+    } finally {
+      localStorage.removeItem('token');
+      setIsAuthenticated(false);
+      setUser(null);
+    }
   };
 
   if (loading) {
@@ -1,9 +1,9 @@
 import { createSlice, createAsyncThunk } from '@reduxjs/toolkit';
-import { Profile, Project, Skill } from '../types';
-import { profileApi, projectsApi, skillsApi } from '../utils/api';
+import { PortfolioBundle, PortfolioProfile, Project, Skill } from '../types';
+import { portfolioApi } from '../utils/api';
 
 interface PortfolioState {
-  profile: Profile | null;
+  profile: PortfolioProfile | null;
   projects: Project[];
   skills: Skill[];
   loading: boolean;
@@ -18,26 +18,11 @@ const initialState: PortfolioState = {
   error: null,
 };
 
-export const fetchProfile = createAsyncThunk<Profile>(
-  'portfolio/fetchProfile',
+// Profile, projects and skills arrive together from one consistent read
+export const fetchPortfolio = createAsyncThunk<PortfolioBundle>(
+  'portfolio/fetchPortfolio',
   async () => {
-    const response = await profileApi.get();
-    return response.data;
-  }
-);
-
-export const fetchProjects = createAsyncThunk<Project[]>(
-  'portfolio/fetchProjects',
-  async () => {
-    const response = await projectsApi.list();
-    return response.data;
-  }
-);
-
-export const fetchSkills = createAsyncThunk<Skill[]>(
-  'portfolio/fetchSkills',
-  async () => {
-    const response = await skillsApi.list();
+    const response = await portfolioApi.get();
     return response.data;
   }
 );
@@ -48,46 +33,25 @@ const portfolioSlice = createSlice({
   reducers: {},
   extraReducers: (builder) => {
     builder
-      .addCase(fetchProfile.pending, (state) => {
-        state.loading = true;
-        state.error = null;
-      })
-      .addCase(fetchProfile.fulfilled, (state, action) => {
-        state.loading = false;
-        state.profile = action.payload;
-      })
-      .addCase(fetchProfile.rejected, (state, action) => {
-        state.loading = false;
-        state.error = action.error.message || 'Failed to fetch profile';
-      })
-      .addCase(fetchProjects.pending, (state) => {
+      .addCase(fetchPortfolio.pending, (state) => {
         state.loading = true;
         state.error = null;
       })
-      .addCase(fetchProjects.fulfilled, (state, action) => {
+      .addCase(fetchPortfolio.fulfilled, (state, action) => {
         state.loading = false;
-        state.projects = action.payload.map((project: Project) => ({
+        state.profile = action.payload.profile;
+        state.projects = action.payload.projects.map((project: Project) => ({
           ...project,
           image_url: project.image_url || '',
           github_url: project.github_url || '',
-          tech_stack: project.tech_stack || []
+          tech_stack: project.tech_stack || [],
+          image_variants: project.image_variants || null
         }));
+        state.skills = action.payload.skills;
       })
-      .addCase(fetchProjects.rejected, (state, action) => {
-        state.loading = false;
-        state.error = action.error.message || 'Failed to fetch projects';
-      })
-      .addCase(fetchSkills.pending, (state) => {
-        state.loading = true;
-        state.error = null;
-      })
-      .addCase(fetchSkills.fulfilled, (state, action) => {
-        state.loading = false;
-        state.skills = action.payload;
-      })
-      .addCase(fetchSkills.rejected, (state, action) => {
+      .addCase(fetchPortfolio.rejected, (state, action) => {
         state.loading = false;
-        state.error = action.error.message || 'Failed to fetch skills';
+        state.error = action.error.message || 'Failed to fetch portfolio';
       });
   }
 });
@@ -6,6 +6,25 @@ export interface Profile {
   skills: Skill[];
 }
 
+export interface ImageVariant {
+  type: string;
+  url: string;
+  width: number;
+  height: number;
+  bytes: number;
+}
+
+// Resized copies of an uploaded project image; only 'ready' carries the rest
+export interface ImageVariants {
+  status: 'processing' | 'ready' | 'failed';
+  source: string;
+  width?: number;
+  height?: number;
+  placeholder?: string;
+  variants?: ImageVariant[];
+  srcset?: Record<string, string>;
+}
+
 export interface Project {
   id: number;
   title: string;
@@ -14,6 +33,7 @@ export interface Project {
   github_url: string;
   live_url: string | null;
   tech_stack: string[];
+  image_variants: ImageVariants | null;
   created_at: string | null;
 }
 
@@ -24,8 +44,21 @@ export interface Skill {
   proficiency: number;
 }
 
+export type PortfolioProfile = Pick<Profile, 'name' | 'title' | 'bio'>;
+
+// GET /api/portfolio: the landing page in one response, read from one snapshot
+export interface PortfolioBundle {
+  profile: PortfolioProfile;
+  projects: Project[];
+  skills: Skill[];
+  next_cursors: {
+    projects: string | null;
+    skills: string | null;
+  };
+}
+
 export interface PortfolioState {
-  profile: Profile | null;
+  profile: PortfolioProfile | null;
   projects: Project[];
   skills: Skill[];
   loading: boolean;
@@ -51,6 +51,20 @@ api.interceptors.response.use(
   }
 );
 
+// Listings are paginated; follow X-Next-Cursor until the last page for
+// views that need every row
+const listAll = async <T>(path: string): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await api.get<T[]>(path, { params: cursor ? { cursor } : undefined });
+    items.push(...response.data);
+    const next = response.headers['x-next-cursor'];
+    cursor = typeof next === 'string' && next ? next : undefined;
+  } while (cursor);
+  return items;
+};
+
 export const authApi = {
   login: async (username: string, password: string) => {
     const response = await api.post('/login', { username, password });
@@ -60,19 +74,35 @@ export const authApi = {
     return response.data;
   },
   checkAuth: async () => api.get('/check-auth'),
-  logout: () => {
-    localStorage.removeItem('token');
+  logout: async () => {
+    try {
+      await api.post('/logout');
+    } catch (error) {
+      // The token is dropped locally even if the server could not revoke it
+    } finally {
+      localStorage.removeItem('token');
+    }
   },
 };
 
 export const projectsApi = {
   list: () => api.get('/projects'),
+  listAll: () => listAll<Project>('/projects'),
   create: (project: Omit<Project, 'id'>) => api.post('/projects', project),
   delete: (id: number) => api.delete(`/projects/${id}`),
+  // Resized in the background; the project reports image_variants.status
+  uploadImage: (id: number, image: File) => {
+    const form = new FormData();
+    form.append('image', image);
+    return api.post(`/projects/${id}/image`, form, {
+      headers: { 'Content-Type': 'multipart/form-data' }
+    });
+  },
 };
 
 export const skillsApi = {
   list: () => api.get('/skills'),
+  listAll: () => listAll<Skill>('/skills'),
   create: (skill: Omit<Skill, 'id'>) => api.post('/skills', skill),
   delete: (id: number) => api.delete(`/skills/${id}`),
 };
@@ -81,4 +111,8 @@ export const profileApi = {
   get: () => api.get('/profile'),
 };
 
+export const portfolioApi = {
+  get: () => api.get('/portfolio'),
+};
+
 export default api;